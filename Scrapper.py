@@ -1,13 +1,21 @@
-import csv
-import json
-import time
 import os
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException
-from object import Experience, Education, Scraper
+import argparse
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from linkedin_scraper import LinkedInScraper, create_driver
+import session_vault
+import html_extraction
+import resource_blocking
+import checkpoint
+import exporters
+import profile_cache
+import url_frontier
+import rate_limiter
+import scrape_metrics
+from object import FailedProfile
+from scrape_errors import Deadline, RendererCrash, AuthLost, classify, RetryQueue, DEFAULT_PROFILE_BUDGET, DEFAULT_MAX_ATTEMPTS
+from field_parsing import parse_item_cap, DEFAULT_ITEM_CAP
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -16,444 +24,414 @@ load_dotenv()
 EMAIL = os.getenv("EMAIL")
 PASSWORD = os.getenv("PASSWORD")
 
-# === Load URLs from urls.json ===
-def load_urls_from_json():
-    try:
-        with open("urls.json", "r", encoding="utf-8") as f:
-            data = json.load(f)
-        urls = data.get("urls", [])
-        if not isinstance(urls, list):
-            print("Invalid urls.json: 'urls' must be a list")
-            return []
-        return [u.strip() for u in urls if isinstance(u, str) and u.strip()]
-    except FileNotFoundError:
-        print("urls.json not found. Create it with {\"urls\": [ ... ]}")
-        return []
-    except Exception as e:
-        print(f"Failed to read urls.json: {e}")
-        return []
+# Number of parallel browser workers (1 = single browser, as before)
+WORKERS = int(os.getenv("WORKERS", "1"))
 
+# Where the authenticated session is kept between runs
+SESSION_VAULT = os.getenv("SESSION_VAULT", session_vault.DEFAULT_VAULT_PATH)
 
-class LinkedInScraper(Scraper):
-    def __init__(self, driver):
-        super().__init__(driver)
-        self.profiles = []
+# How profile pages are read: "webdriver" (element lookups), "js" (one script
+# per page) or "html" (page source parsed off-browser in a process pool)
+EXTRACTION = os.getenv("EXTRACTION", "webdriver")
+PARSE_PROCESSES = int(os.getenv("PARSE_PROCESSES", str(os.cpu_count() or 1)))
 
-    def login(self, email, password):
-        """Login to LinkedIn"""
-        self.driver.get("https://www.linkedin.com/login")
-        time.sleep(3)
-        
-        try:
-            username_field = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.ID, "username"))
+# URL patterns blocked through DevTools; "default" is the built-in list of
+# images, media, fonts and trackers, an empty value disables blocking
+BLOCKED_URLS = resource_blocking.parse_blocked_urls(os.getenv("BLOCKED_URLS", "default"))
+
+# Scraping engine: "selenium" (chromedriver) or "cdp" (asyncio over DevTools)
+ENGINE = os.getenv("ENGINE", "selenium")
+# Tabs in flight at once with the cdp engine
+CDP_CONCURRENCY = int(os.getenv("CDP_CONCURRENCY", "4"))
+
+# Profiles scraped within this many hours are served from the local cache
+CACHE_PATH = os.getenv("CACHE_PATH", profile_cache.DEFAULT_CACHE_PATH)
+CACHE_TTL_HOURS = float(os.getenv("CACHE_TTL_HOURS", str(profile_cache.DEFAULT_TTL_HOURS)))
+
+# Page loads allowed per minute across all workers, and how many may go at once
+PAGES_PER_MINUTE = float(os.getenv("PAGES_PER_MINUTE", str(rate_limiter.DEFAULT_PAGES_PER_MINUTE)))
+RATE_LIMIT_BURST = int(os.getenv("RATE_LIMIT_BURST", str(rate_limiter.DEFAULT_BURST)))
+
+# Wall-clock seconds one profile may take across all of its page loads, and
+# how many times a profile that timed out or crashed the browser is tried
+PROFILE_BUDGET = float(os.getenv("PROFILE_BUDGET", str(DEFAULT_PROFILE_BUDGET)))
+MAX_ATTEMPTS = int(os.getenv("MAX_ATTEMPTS", str(DEFAULT_MAX_ATTEMPTS)))
+
+# Experience/education items kept per profile; 0 keeps them all
+ITEM_CAP = parse_item_cap(os.getenv("ITEM_CAP", str(DEFAULT_ITEM_CAP)))
+
+# Compress CSV/JSON exports: "" (none), "gzip" or "zstd"; also the codec of
+# the --parquet tables, which are snappy-compressed otherwise
+EXPORT_COMPRESSION = os.getenv("EXPORT_COMPRESSION", "")
+
+# Local port serving per-phase timings and counters at /metrics; 0 serves none
+METRICS_PORT = int(os.getenv("METRICS_PORT", "0"))
+
+def scrape_with_workers(queue, session, workers, on_result, resource_stats=None, limiter=None, metrics=None):
+    """Scrape URLs with a pool of browser workers sharing one login session.
+
+    Each worker thread owns its own Chrome instance and LinkedInScraper, so
+    no WebDriver is ever used from two threads at once, while all of them
+    draw page loads from the same ``limiter`` and time into the same
+    ``metrics``. ``on_result`` is
+    called with each profile, on the calling thread, as soon as it finishes.
+    URLs are pulled from the RetryQueue ``queue`` only as workers free up,
+    and failures go back to it to be retried or recorded.
+    """
+    local = threading.local()
+    drivers = []
+    drivers_lock = threading.Lock()
+
+    def get_worker_scraper():
+        if getattr(local, "scraper", None) is None:
+            driver = create_driver(blocked_urls=BLOCKED_URLS, page_timeout=PROFILE_BUDGET)
+            if metrics is not None:
+                metrics.instrument_driver(driver)
+            with drivers_lock:
+                drivers.append(driver)
+            session_vault.restore_session(session, driver)
+            local.scraper = LinkedInScraper(
+                driver, extraction=EXTRACTION, profile_budget=PROFILE_BUDGET, item_cap=ITEM_CAP,
+                blocked_urls=BLOCKED_URLS
             )
-            username_field.send_keys(email)
-            
-            password_field = self.driver.find_element(By.ID, "password")
-            password_field.send_keys(password)
-            
-            submit_button = self.driver.find_element(By.XPATH, "//button[@type='submit']")
-            submit_button.click()
-            
-            print("Logging in...")
-            time.sleep(8)
-            
-            if self.is_signed_in():
-                print("✓ LOGIN SUCCESS!")
-                return True
-            else:
-                print("✗ Login failed! Check credentials or 2FA.")
-                return False
-        except Exception as e:
-            print(f"✗ Login error: {e}")
-            return False
+            local.scraper.resource_stats = resource_stats
+            local.scraper.rate_limiter = limiter
+            local.scraper.metrics = metrics
+        return local.scraper
 
-    def scrape_profile(self, url):
-        """Scrape a single LinkedIn profile"""
-        print(f"\n→ Scraping: {url}")
-        self.driver.get(url)
-        time.sleep(5)
-        
-        profile_data = {
-            "url": url,
-            "name": None,
-            "headline": None,
-            "location": None,
-            "experiences": [],
-            "educations": []
-        }
-        
+    def work(url):
+        scraper = get_worker_scraper()
         try:
-            # Get name and location
-            try:
-                name = WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "h1"))
-                ).text
-                profile_data["name"] = name
-            except:
-                profile_data["name"] = "N/A"
-            
-            # Get headline
-            try:
-                headline = self.driver.find_element(
-                    By.XPATH, 
-                    "//div[contains(@class, 'text-body-medium')]"
-                ).text
-                profile_data["headline"] = headline
-            except:
-                profile_data["headline"] = "N/A"
-            
-            # Get location
-            try:
-                location = self.driver.find_element(
-                    By.XPATH, 
-                    "//span[contains(@class, 'text-body-small') and contains(@class, 'inline')]"
-                ).text
-                profile_data["location"] = location
-            except:
-                profile_data["location"] = "N/A"
-            
-            # Scroll to load more content
-            self.scroll_to_half()
-            time.sleep(2)
-            self.scroll_to_bottom()
-            time.sleep(2)
-            
-            # Get experiences
-            profile_data["experiences"] = self.get_experiences(url)
-            
-            # Get education
-            profile_data["educations"] = self.get_educations(url)
-            
-            print(f"✓ Scraped: {profile_data['name']}")
-            return profile_data
-            
+            profile_data = scraper.scrape_profile(url)
         except Exception as e:
-            print(f"✗ Error scraping {url}: {e}")
-            profile_data["error"] = str(e)
-            return profile_data
-
-    def get_experiences(self, base_url):
-        """Get experience details"""
-        experiences = []
-        try:
-            exp_url = base_url.rstrip('/') + "/details/experience"
-            self.driver.get(exp_url)
-            time.sleep(3)
-            
-            main = self.wait_for_element_to_load(by=By.TAG_NAME, name="main")
-            self.scroll_to_bottom()
-            time.sleep(2)
-            
+            if not isinstance(classify(e), RendererCrash):
+                raise
+            # This worker starts a fresh browser for its next URL
+            local.scraper = None
+            with drivers_lock:
+                drivers.remove(scraper.driver)
             try:
-                main_list = self.wait_for_element_to_load(name="pvs-list__container", base=main)
-                items = main_list.find_elements(By.CLASS_NAME, "pvs-list__paged-list-item")
-                
-                for item in items[:5]:  # Limit to 5 experiences
-                    try:
-                        exp_data = self._parse_experience_item(item)
-                        if exp_data:
-                            experiences.append(exp_data)
-                    except:
-                        continue
-            except:
+                scraper.driver.quit()
+            except Exception:
                 pass
-                
-        except Exception as e:
-            print(f"  Warning: Could not fetch experiences - {e}")
-        
-        return experiences
+            raise
+        scraper.collect_resource_stats()
+        return profile_data
 
-    def _parse_experience_item(self, item):
-        """Parse a single experience item"""
-        try:
-            position = item.find_element(By.CSS_SELECTOR, "div[data-view-name='profile-component-entity']")
-            elements = position.find_elements(By.XPATH, "*")
-            
-            if len(elements) < 2:
-                return None
-            
-            position_details = elements[1]
-            position_details_list = position_details.find_elements(By.XPATH, "*")
-            
-            if not position_details_list:
-                return None
-            
-            position_summary = position_details_list[0]
-            outer_positions = position_summary.find_element(By.XPATH, "*").find_elements(By.XPATH, "*")
-            
-            # Extract basic info
-            position_title = ""
-            company = ""
-            work_times = ""
-            location = ""
-            
-            if len(outer_positions) >= 2:
-                try:
-                    position_title = outer_positions[0].find_element(By.TAG_NAME, "span").text
-                except:
-                    pass
-                try:
-                    company = outer_positions[1].find_element(By.TAG_NAME, "span").text
-                except:
-                    pass
-                if len(outer_positions) >= 3:
-                    try:
-                        work_times = outer_positions[2].find_element(By.TAG_NAME, "span").text
-                    except:
-                        pass
-                if len(outer_positions) >= 4:
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {}
+            
+            def submit_next():
+                url = next(queue, None)
+                if url is not None:
+                    futures[pool.submit(work, url)] = url
+            
+            # Keep every worker busy with one URL queued behind it
+            for _ in range(workers * 2):
+                submit_next()
+            
+            done = 0
+            while futures:
+                finished, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    url = futures.pop(future)
                     try:
-                        location = outer_positions[3].find_element(By.TAG_NAME, "span").text
-                    except:
-                        pass
-            
-            # Parse dates
-            from_date = ""
-            to_date = ""
-            duration = None
-            
-            if work_times and "·" in work_times:
-                parts = work_times.split("·")
-                times = parts[0].strip()
-                duration = parts[1].strip() if len(parts) > 1 else None
-                
-                time_parts = times.split(" ")
-                if len(time_parts) >= 2:
-                    from_date = " ".join(time_parts[:2])
-                if len(time_parts) >= 4:
-                    to_date = " ".join(time_parts[3:])
-            
-            return {
-                "position_title": position_title or "N/A",
-                "company": company or "N/A",
-                "from_date": from_date,
-                "to_date": to_date,
-                "duration": duration,
-                "location": location
-            }
-        except:
-            return None
-
-    def get_educations(self, base_url):
-        """Get education details"""
-        educations = []
-        try:
-            edu_url = base_url.rstrip('/') + "/details/education"
-            self.driver.get(edu_url)
-            time.sleep(3)
-            
-            main = self.wait_for_element_to_load(by=By.TAG_NAME, name="main")
-            self.scroll_to_bottom()
-            time.sleep(2)
-            
+                        profile_data = future.result()
+                    except Exception as e:
+                        profile_data = queue.handle(url, e)
+                    if profile_data is not None:
+                        done += 1
+                        print(f"[{done}] done")
+                        on_result(profile_data)
+                    submit_next()
+    finally:
+        for driver in drivers:
             try:
-                main_list = self.wait_for_element_to_load(name="pvs-list__container", base=main)
-                items = main_list.find_elements(By.CLASS_NAME, "pvs-list__paged-list-item")
-                
-                for item in items[:5]:  # Limit to 5 educations
-                    try:
-                        edu_data = self._parse_education_item(item)
-                        if edu_data:
-                            educations.append(edu_data)
-                    except:
-                        continue
-            except:
+                driver.quit()
+            except Exception:
                 pass
-                
+
+
+def scrape_with_parse_pool(scraper, queue, session, processes, on_result):
+    """Capture pages in the browser and parse them in a process pool.
+
+    The browser moves on to the next URL as soon as a profile's HTML is
+    captured, so parsing overlaps with navigation. ``on_result`` is called
+    with each profile as soon as it is parsed; failures go back to the
+    RetryQueue ``queue``.
+    """
+    def collect(url, future):
+        try:
+            profile_data = future.result()
         except Exception as e:
-            print(f"  Warning: Could not fetch education - {e}")
-        
-        return educations
+            profile_data = queue.handle(url, e)
+        if profile_data is not None:
+            on_result(profile_data)
 
-    def _parse_education_item(self, item):
-        """Parse a single education item"""
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        pending = {}
         try:
-            position = item.find_element(By.CSS_SELECTOR, "div[data-view-name='profile-component-entity']")
-            elements = position.find_elements(By.XPATH, "*")
-            
-            if len(elements) < 2:
-                return None
-            
-            position_details = elements[1]
-            position_details_list = position_details.find_elements(By.XPATH, "*")
-            
-            if not position_details_list:
-                return None
-            
-            position_summary = position_details_list[0]
-            outer_positions = position_summary.find_element(By.XPATH, "*").find_elements(By.XPATH, "*")
-            
-            institution_name = ""
-            degree = ""
-            from_date = ""
-            to_date = ""
-            
-            if outer_positions:
+            for i, url in enumerate(queue, 1):
+                print(f"\n[{i}]", end=" ")
                 try:
-                    institution_name = outer_positions[0].find_element(By.TAG_NAME, "span").text
-                except:
-                    pass
-                
-                if len(outer_positions) > 1:
-                    try:
-                        degree = outer_positions[1].find_element(By.TAG_NAME, "span").text
-                    except:
-                        pass
-                
-                if len(outer_positions) > 2:
-                    try:
-                        times = outer_positions[2].find_element(By.TAG_NAME, "span").text
-                        if times and "-" in times:
-                            time_parts = times.split()
-                            if "-" in time_parts:
-                                dash_idx = time_parts.index("-")
-                                if dash_idx > 0:
-                                    from_date = time_parts[dash_idx - 1]
-                                if dash_idx < len(time_parts) - 1:
-                                    to_date = time_parts[-1]
-                    except:
-                        pass
-            
-            return {
-                "institution": institution_name or "N/A",
-                "degree": degree or "N/A",
-                "from_date": from_date,
-                "to_date": to_date
-            }
-        except:
-            return None
-
-    def save_to_csv(self, filename="linkedin_profiles.csv"):
-        """Save scraped data to CSV with detailed experience and education"""
-        if not self.profiles:
-            print("No profiles to save!")
-            return
-        
-        with open(filename, "w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            
-            # Header
-            writer.writerow([
-                "URL", "Name", "Headline", "Location",
-                "Position Title", "Company", "Work From", "Work To", "Duration", "Work Location",
-                "Education Institution", "Degree", "Edu From", "Edu To"
-            ])
-            
-            # Data rows - one row per experience/education combination
-            for profile in self.profiles:
-                url = profile.get("url", "")
-                name = profile.get("name", "")
-                headline = profile.get("headline", "")
-                location = profile.get("location", "")
-                
-                experiences = profile.get("experiences", [])
-                educations = profile.get("educations", [])
+                    scraper.deadline = Deadline(scraper.profile_budget)
+                    pages = scraper.capture_profile_pages(url)
+                    pending[pool.submit(html_extraction.parse_profile_pages, url, pages, scraper.item_cap)] = url
+                except Exception as e:
+                    profile_data = queue.handle(url, e)
+                    if profile_data is not None:
+                        on_result(profile_data)
+                    if isinstance(classify(e), RendererCrash):
+                        scraper.restart_browser(session)
+                        continue
+                finally:
+                    scraper.deadline = None
+                scraper.collect_resource_stats()
                 
-                # If no experience or education, still write one row with basic info
-                if not experiences and not educations:
-                    writer.writerow([
-                        url, name, headline, location,
-                        "", "", "", "", "", "",
-                        "", "", "", ""
-                    ])
-                else:
-                    # Create rows for each experience
-                    max_rows = max(len(experiences), len(educations))
-                    
-                    for i in range(max_rows):
-                        # Experience data
-                        exp = experiences[i] if i < len(experiences) else {}
-                        position = exp.get("position_title", "")
-                        company = exp.get("company", "")
-                        work_from = exp.get("from_date", "")
-                        work_to = exp.get("to_date", "")
-                        duration = exp.get("duration", "")
-                        work_location = exp.get("location", "")
-                        
-                        # Education data
-                        edu = educations[i] if i < len(educations) else {}
-                        institution = edu.get("institution", "")
-                        degree = edu.get("degree", "")
-                        edu_from = edu.get("from_date", "")
-                        edu_to = edu.get("to_date", "")
-                        
-                        writer.writerow([
-                            url, name, headline, location,
-                            position, company, work_from, work_to, duration, work_location,
-                            institution, degree, edu_from, edu_to
-                        ])
-        
-        print(f"\n✓ CSV saved: {filename}")
-
-    def save_to_json(self, filename="linkedin_profiles.json"):
-        """Save scraped data to JSON"""
-        if not self.profiles:
-            print("No profiles to save!")
-            return
-        
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(self.profiles, f, indent=2, ensure_ascii=False)
-        
-        print(f"✓ JSON saved: {filename}")
+                # Hand over whatever has finished parsing in the meantime
+                for future in [f for f in pending if f.done()]:
+                    collect(pending.pop(future), future)
+        finally:
+            # Profiles already captured are parsed and handed over even when a
+            # fatal error (a lost login) ends the run
+            for future in as_completed(pending):
+                collect(pending[future], future)
 
 
 def main():
+    parser = argparse.ArgumentParser(description="LinkedIn Profile Scraper")
+    parser.add_argument(
+        "--urls", nargs="+", default=["urls.json"], metavar="FILE",
+        help="URL sources: .json, .ndjson/.jsonl, .csv or plain text, optionally .gz (default: urls.json)"
+    )
+    parser.add_argument(
+        "--url-column", default="url",
+        help="field holding the URL in NDJSON objects and CSV headers (default: url)"
+    )
+    parser.add_argument(
+        "--resume", action="store_true",
+        help="skip URLs already scraped successfully in the journal and continue"
+    )
+    parser.add_argument(
+        "--journal", default=checkpoint.DEFAULT_JOURNAL_PATH,
+        help=f"JSONL file each profile is appended to (default: {checkpoint.DEFAULT_JOURNAL_PATH})"
+    )
+    parser.add_argument(
+        "--engine", choices=["selenium", "cdp"], default=ENGINE,
+        help=f"browser engine to scrape with (default: {ENGINE})"
+    )
+    parser.add_argument(
+        "--cache-ttl", type=float, default=CACHE_TTL_HOURS, metavar="HOURS",
+        help=f"re-use profiles scraped within this many hours, 0 to always scrape (default: {CACHE_TTL_HOURS:g})"
+    )
+    parser.add_argument(
+        "--pages-per-minute", type=float, default=PAGES_PER_MINUTE, metavar="N",
+        help=f"page loads allowed per minute across all workers (default: {PAGES_PER_MINUTE:g})"
+    )
+    parser.add_argument(
+        "--xlsx", action="store_true",
+        help="also export linkedin_profiles.xlsx"
+    )
+    parser.add_argument(
+        "--parquet", action="store_true",
+        help="also export profiles/experiences/educations tables to linkedin_profiles.parquet/ (needs pyarrow)"
+    )
+    parser.add_argument(
+        "--metrics", action="store_true",
+        help="time each scraping phase and print a summary at the end"
+    )
+    parser.add_argument(
+        "--metrics-port", type=int, default=METRICS_PORT, metavar="PORT",
+        help="also serve the timings in Prometheus format at http://127.0.0.1:PORT/metrics (implies --metrics)"
+    )
+    args = parser.parse_args()
+    if not args.pages_per_minute > 0:
+        parser.error(f"--pages-per-minute (or PAGES_PER_MINUTE) must be positive, got {args.pages_per_minute:g}")
+    
     print("=" * 60)
     print("LinkedIn Profile Scraper")
     print("=" * 60)
     
-    # Load URLs
-    urls = load_urls_from_json()
-    if not urls:
-        print("\n✗ No URLs found in urls.json. Exiting.")
-        return
+    # Phase timings and counters, only collected when asked for
+    metrics = scrape_metrics.ScrapeMetrics() if args.metrics or args.metrics_port else None
+    metrics_server = None
+    if args.metrics_port:
+        metrics_server = scrape_metrics.serve(metrics, args.metrics_port)
+        print(f"✓ Serving metrics at http://127.0.0.1:{args.metrics_port}/metrics")
     
-    print(f"\n✓ Loaded {len(urls)} URL(s) from urls.json")
+    # The timings matter most on the runs that end early, so they are always reported
+    try:
+        scrape(args, metrics)
+    finally:
+        if metrics is not None:
+            print(f"✓ {metrics.summary()}")
+        if metrics_server is not None:
+            metrics_server.shutdown()
+    print("=" * 60)
+
+
+def scrape(args, metrics=None):
+    """Scrape the URLs of the parsed command line into the journal and export them"""
+    # Every finished profile goes straight to the journal
+    journal = checkpoint.ProfileJournal(args.journal)
+    completed = set()
+    if args.resume:
+        completed = {url_frontier.canonicalize_url(url) for url in journal.completed_urls()}
+        print(f"✓ Resuming: {len(completed)} profile(s) already in {args.journal}")
+    else:
+        journal.reset()
     
-    # Setup Chrome
-    print("\n→ Starting Chrome...")
-    chrome_options = webdriver.ChromeOptions()
-    # chrome_options.add_argument("--headless")  # Uncomment to run headless
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64)")
+    # URLs are canonicalized, de-duplicated and read lazily as scraping goes
+    frontier = url_frontier.URLFrontier(
+        url_frontier.read_sources(args.urls, args.url_column), skip=completed.__contains__
+    )
+    print(f"\n✓ Reading URLs from {', '.join(args.urls)}")
     
-    driver = webdriver.Chrome(options=chrome_options)
-    # Increase HTTP-related timeouts
-    driver.set_page_load_timeout(500)
-    driver.set_script_timeout(500)
-    scraper = LinkedInScraper(driver)
+    # Serve fresh profiles from the cache without navigating to them
+    cache = profile_cache.ProfileCache(CACHE_PATH, args.cache_ttl) if args.cache_ttl > 0 else None
     
-    try:
-        # Login
-        if not scraper.login(EMAIL, PASSWORD):
+    def cache_misses(urls):
+        for url in urls:
+            cached = cache.get(url)
+            if cached is None:
+                yield url
+            else:
+                journal.append(cached)
+                if metrics is not None:
+                    metrics.inc("profiles_total", status="cached")
+    
+    urls = iter(frontier) if cache is None else cache_misses(frontier)
+    
+    # Only start a browser if at least one URL is left to scrape
+    first_url = next(urls, None)
+    if first_url is not None:
+        urls = itertools.chain([first_url], urls)
+    elif not frontier.read:
+        print("\n✗ No URLs found. Exiting.")
+        return
+    
+    def record_profile(profile_data):
+        if metrics is not None:
+            metrics.inc("profiles_total", status="failed" if isinstance(profile_data, FailedProfile) else "ok")
+        journal.append(profile_data)
+        if cache is not None:
+            cache.put(profile_data)
+    
+    # Every page load, in every worker, draws from one shared rate limiter
+    limiter = rate_limiter.RateLimiter(args.pages_per_minute, RATE_LIMIT_BURST)
+    # Profiles that time out or crash the browser are retried at the end
+    queue = RetryQueue(urls, MAX_ATTEMPTS)
+    
+    scraper = LinkedInScraper(
+        None, extraction=EXTRACTION, profile_budget=PROFILE_BUDGET, item_cap=ITEM_CAP, blocked_urls=BLOCKED_URLS
+    )
+    scraper.rate_limiter = limiter
+    scraper.metrics = metrics
+    if first_url is not None and args.engine == "cdp":
+        import asyncio
+        import cdp_engine
+        
+        try:
+            logged_in = asyncio.run(cdp_engine.run(
+                queue, EMAIL, PASSWORD, record_profile,
+                concurrency=CDP_CONCURRENCY, vault_path=SESSION_VAULT, blocked_urls=BLOCKED_URLS,
+                limiter=limiter, profile_budget=PROFILE_BUDGET, item_cap=ITEM_CAP, metrics=metrics
+            ))
+        except Exception as e:
+            if isinstance(e, AuthLost):
+                session_vault.delete_session(SESSION_VAULT)
+            print(f"\n✗ Error: {e}")
+            print(f"→ Finished profiles are kept in {args.journal}; re-run with --resume to continue.")
+            return
+        if not logged_in:
             print("\n✗ Login failed. Exiting.")
-            driver.quit()
             return
+    elif first_url is not None:
+        # Setup Chrome
+        print("\n→ Starting Chrome...")
+        driver = create_driver(blocked_urls=BLOCKED_URLS, page_timeout=PROFILE_BUDGET)
+        scraper.driver = driver
+        if metrics is not None:
+            metrics.instrument_driver(driver)
+        if BLOCKED_URLS:
+            scraper.resource_stats = resource_blocking.ResourceStats()
         
-        # Scrape profiles
-        print(f"\n→ Scraping {len(urls)} profile(s)...")
-        for i, url in enumerate(urls, 1):
-            print(f"\n[{i}/{len(urls)}]", end=" ")
-            profile_data = scraper.scrape_profile(url)
-            scraper.profiles.append(profile_data)
-            time.sleep(3)  # Be polite
-        
-        # Save results
-        print("\n" + "=" * 60)
-        scraper.save_to_csv("linkedin_profiles.csv")
-        scraper.save_to_json("linkedin_profiles.json")
-        
-        print("\n✓ DONE! Check linkedin_profiles.csv and linkedin_profiles.json")
-        print("=" * 60)
-        
-    except Exception as e:
-        print(f"\n✗ Error: {e}")
-    finally:
-        driver.quit()
-        print("\n→ Browser closed.")
+        try:
+            # Re-use the saved session, and only log in when it is rejected
+            session = session_vault.load_session(SESSION_VAULT)
+            if session and scraper.resume_session(session):
+                print("✓ Re-used saved session")
+            else:
+                if session:
+                    print("→ Saved session rejected, logging in again...")
+                    session_vault.delete_session(SESSION_VAULT)
+                if not scraper.login(EMAIL, PASSWORD):
+                    print("\n✗ Login failed. Exiting.")
+                    return
+                session = session_vault.capture_session(driver)
+                session_vault.save_session(session, SESSION_VAULT)
+                print(f"✓ Session saved to {SESSION_VAULT}")
+            
+            # Scrape profiles
+            workers = max(1, WORKERS)
+            if workers == 1 and EXTRACTION == "html":
+                print(f"\n→ Scraping profiles, parsing in {PARSE_PROCESSES} process(es)...")
+                scrape_with_parse_pool(scraper, queue, session, PARSE_PROCESSES, record_profile)
+            elif workers > 1:
+                print(f"\n→ Scraping profiles with {workers} workers...")
+                scrape_with_workers(
+                    queue, session, workers, record_profile,
+                    resource_stats=scraper.resource_stats, limiter=limiter, metrics=metrics
+                )
+            else:
+                print("\n→ Scraping profiles...")
+                for i, url in enumerate(queue, 1):
+                    print(f"\n[{i}]", end=" ")
+                    try:
+                        profile_data = scraper.scrape_profile(url)
+                    except Exception as e:
+                        profile_data = queue.handle(url, e)
+                        if isinstance(classify(e), RendererCrash):
+                            scraper.restart_browser(session)
+                    else:
+                        scraper.collect_resource_stats()
+                    if profile_data is not None:
+                        record_profile(profile_data)
+            
+        except Exception as e:
+            if isinstance(e, AuthLost):
+                # The saved session no longer works; log in afresh next time
+                session_vault.delete_session(SESSION_VAULT)
+            print(f"\n✗ Error: {e}")
+            print(f"→ Finished profiles are kept in {args.journal}; re-run with --resume to continue.")
+            return
+        finally:
+            scraper.driver.quit()
+            print("\n→ Browser closed.")
+    
+    # Save results, streaming them from the journal
+    print("\n" + "=" * 60)
+    csv_file = exporters.compressed_name("linkedin_profiles.csv", EXPORT_COMPRESSION)
+    json_file = exporters.compressed_name("linkedin_profiles.json", EXPORT_COMPRESSION)
+    scraper.save_to_csv(csv_file, profiles=journal.iter_profiles())
+    scraper.save_to_json(json_file, profiles=journal.iter_profiles())
+    if args.xlsx:
+        scraper.save_to_xlsx("linkedin_profiles.xlsx", profiles=journal.iter_profiles())
+    if args.parquet:
+        scraper.save_to_parquet(
+            "linkedin_profiles.parquet", profiles=journal.iter_profiles(), compression=EXPORT_COMPRESSION
+        )
+    
+    print(f"\n✓ DONE! Check {csv_file} and {json_file}")
+    print(f"✓ {frontier.summary()}")
+    print(f"✓ {limiter.summary()}")
+    print(f"✓ {queue.summary()}")
+    if cache is not None:
+        print(f"✓ {cache.summary()}")
+        cache.close()
+    if scraper.resource_stats is not None:
+        print(f"✓ {scraper.resource_stats.summary()}")
 
 
 if __name__ == "__main__":
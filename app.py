@@ -1,16 +1,22 @@
 import streamlit as st
-import pandas as pd
 import json
-import time
 import io
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException
-import plotly.express as px
-import plotly.graph_objects as go
+import hashlib
+import secrets
+import zipfile
 from datetime import datetime
+# pandas, plotly and Selenium are imported where they are first needed so the
+# page renders without loading them; scraping runs on a background ScrapeJob
+from scrape_job import ScrapeJob
+from search_index import SearchIndex
+from profile_tables import ProfileTables
+import profile_codec
+import date_parsing
+import resource_blocking
+import exporters
+import profile_cache
+import url_frontier
+import rate_limiter
 
 # Page config
 st.set_page_config(
@@ -45,457 +51,197 @@ if 'profiles_data' not in st.session_state:
     st.session_state.profiles_data = None
 if 'scraping_complete' not in st.session_state:
     st.session_state.scraping_complete = False
+if 'scrape_error' not in st.session_state:
+    st.session_state.scrape_error = None
 
-# Scraper class (embedded)
-class LinkedInScraper:
-    WAIT_FOR_ELEMENT_TIMEOUT = 5
 
-    def __init__(self, driver):
-        self.driver = driver
-        self.profiles = []
+@st.cache_resource
+def scrape_jobs():
+    """Background jobs by job token, kept across sessions so a refresh finds a running job again"""
+    return {}
 
-    def wait_for_element_to_load(self, by=By.CLASS_NAME, name="pv-top-card", base=None):
-        base = base or self.driver
-        return WebDriverWait(base, self.WAIT_FOR_ELEMENT_TIMEOUT).until(
-            EC.presence_of_element_located((by, name))
-        )
 
-    def is_signed_in(self):
-        try:
-            return "feed" in self.driver.current_url or "mynetwork" in self.driver.current_url
-        except:
-            return False
+# Finished jobs kept for sessions that have not come back for their results yet
+MAX_FINISHED_JOBS = 4
 
-    def scroll_to_half(self):
-        self.driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight/2));")
 
-    def scroll_to_bottom(self):
-        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+def job_token(create=False):
+    """This browser's job token, kept in the URL (?job=...) so it survives a refresh.
 
-    def login(self, email, password):
-        """Login to LinkedIn"""
-        self.driver.get("https://www.linkedin.com/login")
-        time.sleep(3)
-        
-        try:
-            username_field = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.ID, "username"))
-            )
-            username_field.send_keys(email)
-            
-            password_field = self.driver.find_element(By.ID, "password")
-            password_field.send_keys(password)
-            
-            submit_button = self.driver.find_element(By.XPATH, "//button[@type='submit']")
-            submit_button.click()
-            
-            time.sleep(8)
-            
-            return self.is_signed_in()
-        except Exception as e:
-            st.error(f"Login error: {e}")
-            return False
-
-    def scrape_profile(self, url, progress_callback=None):
-        """Scrape a single LinkedIn profile"""
-        self.driver.get(url)
-        time.sleep(5)
-        
-        profile_data = {
-            "url": url,
-            "name": None,
-            "headline": None,
-            "location": None,
-            "experiences": [],
-            "educations": []
-        }
-        
-        try:
-            # Get name
-            try:
-                name = WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "h1"))
-                ).text
-                profile_data["name"] = name
-            except:
-                profile_data["name"] = "N/A"
-            
-            # Get headline
-            try:
-                headline = self.driver.find_element(
-                    By.XPATH, 
-                    "//div[contains(@class, 'text-body-medium')]"
-                ).text
-                profile_data["headline"] = headline
-            except:
-                profile_data["headline"] = "N/A"
-            
-            # Get location
-            try:
-                location = self.driver.find_element(
-                    By.XPATH, 
-                    "//span[contains(@class, 'text-body-small') and contains(@class, 'inline')]"
-                ).text
-                profile_data["location"] = location
-            except:
-                profile_data["location"] = "N/A"
-            
-            # Scroll to load more content
-            self.scroll_to_half()
-            time.sleep(2)
-            self.scroll_to_bottom()
-            time.sleep(2)
-            
-            # Get experiences
-            profile_data["experiences"] = self.get_experiences(url)
-            
-            # Get education
-            profile_data["educations"] = self.get_educations(url)
-            
-            return profile_data
-            
-        except Exception as e:
-            profile_data["error"] = str(e)
-            return profile_data
-
-    def get_experiences(self, base_url):
-        """Get experience details"""
-        experiences = []
-        try:
-            exp_url = base_url.rstrip('/') + "/details/experience"
-            self.driver.get(exp_url)
-            time.sleep(3)
-            
-            main = self.wait_for_element_to_load(by=By.TAG_NAME, name="main")
-            self.scroll_to_bottom()
-            time.sleep(2)
-            
-            try:
-                main_list = self.wait_for_element_to_load(name="pvs-list__container", base=main)
-                items = main_list.find_elements(By.CLASS_NAME, "pvs-list__paged-list-item")
-                
-                for item in items[:5]:
-                    try:
-                        exp_data = self._parse_experience_item(item)
-                        if exp_data:
-                            experiences.append(exp_data)
-                    except:
-                        continue
-            except:
-                pass
-                
-        except Exception as e:
-            pass
-        
-        return experiences
+    Other sessions do not have it and never see or take over the job.
+    """
+    token = st.query_params.get("job")
+    if not token and create:
+        token = secrets.token_urlsafe(16)
+        st.query_params["job"] = token
+    return token
 
-    def _parse_experience_item(self, item):
-        """Parse a single experience item"""
-        try:
-            position = item.find_element(By.CSS_SELECTOR, "div[data-view-name='profile-component-entity']")
-            elements = position.find_elements(By.XPATH, "*")
-            
-            if len(elements) < 2:
-                return None
-            
-            position_details = elements[1]
-            position_details_list = position_details.find_elements(By.XPATH, "*")
-            
-            if not position_details_list:
-                return None
-            
-            position_summary = position_details_list[0]
-            outer_positions = position_summary.find_element(By.XPATH, "*").find_elements(By.XPATH, "*")
-            
-            position_title = ""
-            company = ""
-            work_times = ""
-            location = ""
-            
-            if len(outer_positions) >= 2:
-                try:
-                    position_title = outer_positions[0].find_element(By.TAG_NAME, "span").text
-                except:
-                    pass
-                try:
-                    company = outer_positions[1].find_element(By.TAG_NAME, "span").text
-                except:
-                    pass
-                if len(outer_positions) >= 3:
-                    try:
-                        work_times = outer_positions[2].find_element(By.TAG_NAME, "span").text
-                    except:
-                        pass
-                if len(outer_positions) >= 4:
-                    try:
-                        location = outer_positions[3].find_element(By.TAG_NAME, "span").text
-                    except:
-                        pass
-            
-            from_date = ""
-            to_date = ""
-            duration = None
-            
-            if work_times and "·" in work_times:
-                parts = work_times.split("·")
-                times = parts[0].strip()
-                duration = parts[1].strip() if len(parts) > 1 else None
-                
-                time_parts = times.split(" ")
-                if len(time_parts) >= 2:
-                    from_date = " ".join(time_parts[:2])
-                if len(time_parts) >= 4:
-                    to_date = " ".join(time_parts[3:])
-            
-            return {
-                "position_title": position_title or "N/A",
-                "company": company or "N/A",
-                "from_date": from_date,
-                "to_date": to_date,
-                "duration": duration,
-                "location": location
-            }
-        except:
-            return None
-
-    def get_educations(self, base_url):
-        """Get education details"""
-        educations = []
-        try:
-            edu_url = base_url.rstrip('/') + "/details/education"
-            self.driver.get(edu_url)
-            time.sleep(3)
-            
-            main = self.wait_for_element_to_load(by=By.TAG_NAME, name="main")
-            self.scroll_to_bottom()
-            time.sleep(2)
-            
-            try:
-                main_list = self.wait_for_element_to_load(name="pvs-list__container", base=main)
-                items = main_list.find_elements(By.CLASS_NAME, "pvs-list__paged-list-item")
-                
-                for item in items[:5]:
-                    try:
-                        edu_data = self._parse_education_item(item)
-                        if edu_data:
-                            educations.append(edu_data)
-                    except:
-                        continue
-            except:
-                pass
-                
-        except Exception as e:
-            pass
-        
-        return educations
 
-    def _parse_education_item(self, item):
-        """Parse a single education item"""
-        try:
-            position = item.find_element(By.CSS_SELECTOR, "div[data-view-name='profile-component-entity']")
-            elements = position.find_elements(By.XPATH, "*")
-            
-            if len(elements) < 2:
-                return None
-            
-            position_details = elements[1]
-            position_details_list = position_details.find_elements(By.XPATH, "*")
-            
-            if not position_details_list:
-                return None
-            
-            position_summary = position_details_list[0]
-            outer_positions = position_summary.find_element(By.XPATH, "*").find_elements(By.XPATH, "*")
-            
-            institution_name = ""
-            degree = ""
-            from_date = ""
-            to_date = ""
-            
-            if outer_positions:
-                try:
-                    institution_name = outer_positions[0].find_element(By.TAG_NAME, "span").text
-                except:
-                    pass
-                
-                if len(outer_positions) > 1:
-                    try:
-                        degree = outer_positions[1].find_element(By.TAG_NAME, "span").text
-                    except:
-                        pass
-                
-                if len(outer_positions) > 2:
-                    try:
-                        times = outer_positions[2].find_element(By.TAG_NAME, "span").text
-                        if times and "-" in times:
-                            time_parts = times.split()
-                            if "-" in time_parts:
-                                dash_idx = time_parts.index("-")
-                                if dash_idx > 0:
-                                    from_date = time_parts[dash_idx - 1]
-                                if dash_idx < len(time_parts) - 1:
-                                    to_date = time_parts[-1]
-                    except:
-                        pass
-            
-            return {
-                "institution": institution_name or "N/A",
-                "degree": degree or "N/A",
-                "from_date": from_date,
-                "to_date": to_date
-            }
-        except:
-            return None
-
-
-def convert_to_dataframe(profiles):
-    """Convert profiles to DataFrame"""
-    rows = []
-    for profile in profiles:
-        url = profile.get("url", "")
-        name = profile.get("name", "")
-        headline = profile.get("headline", "")
-        location = profile.get("location", "")
-        
-        experiences = profile.get("experiences", [])
-        educations = profile.get("educations", [])
-        
-        if not experiences and not educations:
-            rows.append({
-                "URL": url,
-                "Name": name,
-                "Headline": headline,
-                "Location": location,
-                "Position Title": "",
-                "Company": "",
-                "Work From": "",
-                "Work To": "",
-                "Duration": "",
-                "Work Location": "",
-                "Education Institution": "",
-                "Degree": "",
-                "Edu From": "",
-                "Edu To": ""
-            })
+def finish_job(job):
+    """Keep the results of a finished job in this session and forget the job"""
+    job.drain()
+    st.session_state.profiles_data = job.profiles
+    st.session_state.scraping_complete = bool(job.profiles)
+    st.session_state.resource_summary = job.resource_summary
+    st.session_state.cache_summary = job.cache_summary
+    st.session_state.scrape_error = job.error
+    scrape_jobs().pop(job_token(), None)
+
+
+job = scrape_jobs().get(job_token())
+if job is not None and not job.running:
+    finish_job(job)
+    job = None
+
+# Top-10 charts: (title, table, column, chart type, axis label, color scale, empty message)
+CHARTS = [
+    ("📍 Location Distribution", "profiles", "location", "bar", "Location", "Blues", "No location data available"),
+    ("🏢 Top Companies", "experiences", "company", "pie", None, None, "No company data available"),
+    ("🎓 Education Institutions", "educations", "institution", "bar", "Institution", "Greens",
+     "No education data available"),
+    ("💼 Top Job Titles", "experiences", "position_title", "bar", "Position", "Oranges",
+     "No position data available")
+]
+
+
+def profiles_fingerprint(profiles):
+    """Cheap content fingerprint of a profile list, for keying cached results.
+
+    Profile lists only ever grow (while a job is running) or get replaced,
+    so the digest of the profiles already seen is kept in the session and
+    extended with the new ones instead of re-hashing the whole list.
+    """
+    state = st.session_state.get("profiles_digest")
+    if state is None or state["profiles"] is not profiles or state["count"] > len(profiles):
+        state = {"profiles": profiles, "count": 0, "digest": hashlib.blake2b(digest_size=16)}
+    for profile in profiles[state["count"]:]:
+        state["digest"].update(profile_codec.encode(profile))
+    state["count"] = len(profiles)
+    st.session_state.profiles_digest = state
+    return f"{state['count']}-{state['digest'].hexdigest()}"
+
+
+# The tables are kept as a shared resource rather than in cache_data so
+# that reruns get them without a pickle round trip; callers never modify them
+@st.cache_resource(max_entries=4)
+def cached_tables(fingerprint, _profiles):
+    """Normalized tables of the profiles and their one-row-per-entry view for the data table"""
+    tables = ProfileTables.from_profiles(_profiles)
+    return tables, tables.wide()
+
+
+@st.cache_resource(max_entries=4)
+def cached_search_index(fingerprint, _df):
+    return SearchIndex(_df.itertuples(index=False, name=None))
+
+
+@st.cache_data(max_entries=4)
+def build_visualizations(fingerprint, _tables):
+    """Metrics and plotly figures for the visualizations panel"""
+    import plotly.express as px
+    
+    metrics = {
+        "Total Profiles": len(_tables.profiles),
+        "Total Experiences": len(_tables.experiences),
+        "Total Education": len(_tables.educations),
+        "Unique Locations": _tables.profiles["location"].nunique()
+    }
+    figures = []
+    for title, table, column, kind, label, scale, _ in CHARTS:
+        # Categorical counts list unused categories too, with a count of 0
+        counts = getattr(_tables, table)[column].value_counts()
+        counts = counts[counts > 0].head(10)
+        if counts.empty:
+            figures.append(None)
+        elif kind == "pie":
+            fig = px.pie(values=counts.values, names=counts.index, hole=0.4)
+            fig.update_layout(height=400)
+            figures.append(fig)
         else:
-            max_rows = max(len(experiences), len(educations))
-            
-            for i in range(max_rows):
-                exp = experiences[i] if i < len(experiences) else {}
-                edu = educations[i] if i < len(educations) else {}
-                
-                rows.append({
-                    "URL": url,
-                    "Name": name,
-                    "Headline": headline,
-                    "Location": location,
-                    "Position Title": exp.get("position_title", ""),
-                    "Company": exp.get("company", ""),
-                    "Work From": exp.get("from_date", ""),
-                    "Work To": exp.get("to_date", ""),
-                    "Duration": exp.get("duration", ""),
-                    "Work Location": exp.get("location", ""),
-                    "Education Institution": edu.get("institution", ""),
-                    "Degree": edu.get("degree", ""),
-                    "Edu From": edu.get("from_date", ""),
-                    "Edu To": edu.get("to_date", "")
-                })
-    
-    return pd.DataFrame(rows)
-
-
-def create_visualizations(df, profiles):
+            fig = px.bar(
+                x=counts.values,
+                y=counts.index,
+                orientation='h',
+                labels={'x': 'Count', 'y': label},
+                color=counts.values,
+                color_continuous_scale=scale
+            )
+            fig.update_layout(showlegend=False, height=400)
+            figures.append(fig)
+    return metrics, figures
+
+
+def create_visualizations(tables, fingerprint):
     """Create data visualizations"""
+    metrics, figures = build_visualizations(fingerprint, tables)
     
     # Metrics
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric("Total Profiles", len(profiles))
-    
-    with col2:
-        total_exp = sum(len(p.get("experiences", [])) for p in profiles)
-        st.metric("Total Experiences", total_exp)
-    
-    with col3:
-        total_edu = sum(len(p.get("educations", [])) for p in profiles)
-        st.metric("Total Education", total_edu)
-    
-    with col4:
-        unique_locations = df["Location"].nunique()
-        st.metric("Unique Locations", unique_locations)
+    for col, (label, value) in zip(st.columns(4), metrics.items()):
+        with col:
+            st.metric(label, value)
     
     st.markdown("---")
     
-    # Visualizations
-    viz_col1, viz_col2 = st.columns(2)
-    
-    with viz_col1:
-        st.subheader("📍 Location Distribution")
-        location_counts = df[df["Location"] != ""]["Location"].value_counts().head(10)
-        if not location_counts.empty:
-            fig1 = px.bar(
-                x=location_counts.values,
-                y=location_counts.index,
-                orientation='h',
-                labels={'x': 'Count', 'y': 'Location'},
-                color=location_counts.values,
-                color_continuous_scale='Blues'
-            )
-            fig1.update_layout(showlegend=False, height=400)
-            st.plotly_chart(fig1, width='stretch')
-        else:
-            st.info("No location data available")
-    
-    with viz_col2:
-        st.subheader("🏢 Top Companies")
-        company_counts = df[df["Company"] != ""]["Company"].value_counts().head(10)
-        if not company_counts.empty:
-            fig2 = px.pie(
-                values=company_counts.values,
-                names=company_counts.index,
-                hole=0.4
-            )
-            fig2.update_layout(height=400)
-            st.plotly_chart(fig2, width='stretch')
-        else:
-            st.info("No company data available")
-    
-    viz_col3, viz_col4 = st.columns(2)
-    
-    with viz_col3:
-        st.subheader("🎓 Education Institutions")
-        edu_counts = df[df["Education Institution"] != ""]["Education Institution"].value_counts().head(10)
-        if not edu_counts.empty:
-            fig3 = px.bar(
-                x=edu_counts.values,
-                y=edu_counts.index,
-                orientation='h',
-                labels={'x': 'Count', 'y': 'Institution'},
-                color=edu_counts.values,
-                color_continuous_scale='Greens'
-            )
-            fig3.update_layout(showlegend=False, height=400)
-            st.plotly_chart(fig3, width='stretch')
-        else:
-            st.info("No education data available")
-    
-    with viz_col4:
-        st.subheader("💼 Top Job Titles")
-        title_counts = df[df["Position Title"] != ""]["Position Title"].value_counts().head(10)
-        if not title_counts.empty:
-            fig4 = px.bar(
-                x=title_counts.values,
-                y=title_counts.index,
-                orientation='h',
-                labels={'x': 'Count', 'y': 'Position'},
-                color=title_counts.values,
-                color_continuous_scale='Oranges'
-            )
-            fig4.update_layout(showlegend=False, height=400)
-            st.plotly_chart(fig4, width='stretch')
-        else:
-            st.info("No position data available")
+    # Visualizations, two per row
+    for row in range(0, len(CHARTS), 2):
+        for col, (title, *_, empty_message), fig in zip(
+            st.columns(2), CHARTS[row:row + 2], figures[row:row + 2]
+        ):
+            with col:
+                st.subheader(title)
+                if fig is not None:
+                    st.plotly_chart(fig, width='stretch')
+                else:
+                    st.info(empty_message)
+
+
+@st.cache_data(max_entries=4)
+def tenure_stats(fingerprint, _tables):
+    """Time in position, career and study lengths from the parsed month columns"""
+    def average(values, scale=1):
+        return None if values.empty else float(values.mean()) / scale
+    
+    experiences = _tables.experiences
+    careers = experiences.groupby("profile_id")
+    career_months = (careers["to_month"].max() - careers["from_month"].min() + 1).dropna()
+    position_months = experiences["months"].dropna()
+    # Counted per distinct end date
+    end_dates = experiences["to_date"].value_counts()
+    return {
+        "position_months": None if position_months.empty else float(position_months.median()),
+        "career_years": average(career_months[career_months > 0], 12),
+        "current_positions": int(end_dates[[date_parsing.is_present(text) for text in end_dates.index]].sum()),
+        "study_years": average(_tables.educations["months"].dropna(), 12)
+    }
+
+
+@st.cache_data(max_entries=4)
+def export_files(fingerprint, _df, _profiles):
+    """CSV, JSON and Excel downloads of the scraped profiles"""
+    csv_buffer = io.StringIO()
+    _df.to_csv(csv_buffer, index=False)
+    json_buffer = io.StringIO()
+    exporters.write_json(_profiles, json_buffer)
+    excel_buffer = io.BytesIO()
+    exporters.write_xlsx(_profiles, excel_buffer)
+    return csv_buffer.getvalue(), json_buffer.getvalue(), excel_buffer.getvalue()
+
+
+@st.cache_data(max_entries=4)
+def parquet_archive(fingerprint, _profiles):
+    """Zip of the profiles/experiences/educations Parquet tables, or None without pyarrow"""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return None
+    buffers = {name: io.BytesIO() for name in exporters.PARQUET_TABLES}
+    exporters.write_parquet(_profiles, buffers)
+    archive = io.BytesIO()
+    # Parquet pages are compressed already
+    with zipfile.ZipFile(archive, "w", zipfile.ZIP_STORED) as zf:
+        for name, buffer in buffers.items():
+            zf.writestr(f"{name}.parquet", buffer.getvalue())
+    return archive.getvalue()
 
 
 # Main App
@@ -514,28 +260,73 @@ with st.sidebar:
     
     # URL Input Method
     st.subheader("📥 Input Method")
-    input_method = st.radio("Choose input method:", ["Single URL", "Upload JSON File"])
+    input_method = st.radio("Choose input method:", ["Single URL", "Upload JSON File", "Load Previous Run"])
     
     urls_to_scrape = []
     
     if input_method == "Single URL":
         single_url = st.text_input("LinkedIn Profile URL", placeholder="https://www.linkedin.com/in/username")
         if single_url:
-            urls_to_scrape = [single_url.strip()]
-    else:
+            urls_to_scrape = list(url_frontier.URLFrontier([single_url]))
+    elif input_method == "Upload JSON File":
         uploaded_file = st.file_uploader("Upload JSON file", type=['json'])
         if uploaded_file is not None:
             try:
                 json_data = json.load(uploaded_file)
-                urls_to_scrape = json_data.get("urls", [])
+                frontier = url_frontier.URLFrontier(json_data.get("urls", []))
+                urls_to_scrape = list(frontier)
                 st.success(f"✅ Loaded {len(urls_to_scrape)} URL(s)")
+                if frontier.duplicates or frontier.invalid:
+                    st.caption(f"Skipped {frontier.duplicates} duplicate(s) and {frontier.invalid} invalid URL(s)")
             except Exception as e:
                 st.error(f"Error reading JSON: {e}")
+    else:
+        run_directory = st.text_input(
+            "Parquet folder",
+            value="linkedin_profiles.parquet",
+            help="Written by `python Scrapper.py --parquet`, or an unzipped Parquet download"
+        )
+        if st.button("📂 Load Run", use_container_width=True, disabled=job is not None):
+            try:
+                # Memory-mapped reads; nothing is scraped again
+                tables = ProfileTables.from_parquet(run_directory)
+                st.session_state.profiles_data = tables.to_profiles()
+                st.session_state.scraping_complete = True
+                st.session_state.resource_summary = None
+                st.session_state.cache_summary = None
+                st.session_state.scrape_error = None
+                st.rerun()
+            except Exception as e:
+                st.error(f"Error loading {run_directory}: {e}")
+    
+    st.markdown("---")
+    
+    # Performance
+    st.subheader("⚡ Performance")
+    block_resources = st.checkbox(
+        "Block images, fonts and trackers",
+        value=True,
+        help="Skips page resources the scraper never reads to save bandwidth"
+    )
+    cache_ttl = st.number_input(
+        "Re-use profiles scraped within (hours)",
+        min_value=0,
+        value=profile_cache.DEFAULT_TTL_HOURS,
+        help="Fresh profiles are loaded from the local cache instead of being scraped again. 0 always scrapes."
+    )
+    pages_per_minute = st.number_input(
+        "Page loads per minute",
+        min_value=1,
+        value=rate_limiter.DEFAULT_PAGES_PER_MINUTE,
+        help="Upper bound on LinkedIn page loads; slows down automatically when LinkedIn pushes back"
+    )
     
     st.markdown("---")
     
     # Scrape Button
-    scrape_button = st.button("🚀 Start Scraping", type="primary", use_container_width=True)
+    scrape_button = st.button(
+        "🚀 Start Scraping", type="primary", use_container_width=True, disabled=job is not None
+    )
     
     st.markdown("---")
     st.caption("⚠️ Note: Web scraping may take several minutes. LinkedIn may require 2FA authentication.")
@@ -547,71 +338,40 @@ if scrape_button:
     elif not urls_to_scrape:
         st.error("❌ Please provide at least one URL to scrape!")
     else:
-        st.info("🔄 Starting scraping process...")
-        
-        # Progress tracking
-        progress_bar = st.progress(0)
-        status_text = st.empty()
-        
-        # Setup Chrome
-        chrome_options = webdriver.ChromeOptions()
-        chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64)")
-        
-        driver = webdriver.Chrome(options=chrome_options)
-        driver.set_page_load_timeout(500)
-        driver.set_script_timeout(500)
-        
-        scraper = LinkedInScraper(driver)
-        
-        try:
-            # Login
-            status_text.text("🔐 Logging in to LinkedIn...")
-            if not scraper.login(email, password):
-                st.error("❌ Login failed! Check your credentials or 2FA settings.")
-                driver.quit()
-            else:
-                st.success("✅ Login successful!")
-                
-                # Scrape profiles
-                profiles = []
-                for i, url in enumerate(urls_to_scrape):
-                    progress = (i + 1) / len(urls_to_scrape)
-                    progress_bar.progress(progress)
-                    status_text.text(f"📊 Scraping profile {i+1}/{len(urls_to_scrape)}...")
-                    
-                    profile_data = scraper.scrape_profile(url)
-                    profiles.append(profile_data)
-                    time.sleep(3)
-                
-                # Store in session state
-                st.session_state.profiles_data = profiles
-                st.session_state.scraping_complete = True
-                
-                progress_bar.progress(1.0)
-                status_text.text("✅ Scraping complete!")
-                st.success(f"🎉 Successfully scraped {len(profiles)} profile(s)!")
-                
-                driver.quit()
-                st.rerun()
-                
-        except Exception as e:
-            st.error(f"❌ Error during scraping: {e}")
-            driver.quit()
+        blocked_urls = resource_blocking.DEFAULT_BLOCKED_URLS if block_resources else None
+        job = ScrapeJob(
+            urls_to_scrape, email, password,
+            cache_ttl=cache_ttl, blocked_urls=blocked_urls, pages_per_minute=pages_per_minute
+        ).start()
+        jobs = scrape_jobs()
+        # Jobs are only dropped when their own session collects them, so
+        # forget the oldest uncollected ones (dicts keep insertion order)
+        finished = [token for token, other in jobs.items() if not other.running]
+        for token in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            jobs.pop(token, None)
+        jobs[job_token(create=True)] = job
+        st.session_state.profiles_data = None
+        st.session_state.scraping_complete = False
+        st.session_state.scrape_error = None
 
 # Display Results
-if st.session_state.scraping_complete and st.session_state.profiles_data:
+def show_results(profiles, resource_summary=None, cache_summary=None, live=False):
+    """Charts, table and profile details; downloads are offered once scraping is done"""
     st.markdown("---")
     st.header("📊 Scraped Data")
+    if resource_summary:
+        st.caption(f"⚡ {resource_summary}")
+    if cache_summary:
+        st.caption(f"🗄️ {cache_summary}")
     
-    profiles = st.session_state.profiles_data
-    df = convert_to_dataframe(profiles)
+    # Everything derived from the profiles alone is cached by their fingerprint,
+    # so typing in the search box only re-runs the search
+    fingerprint = profiles_fingerprint(profiles)
+    tables, df = cached_tables(fingerprint, profiles)
     
     # Visualizations
     with st.expander("📈 Data Visualizations", expanded=True):
-        create_visualizations(df, profiles)
+        create_visualizations(tables, fingerprint)
     
     st.markdown("---")
     
@@ -621,14 +381,17 @@ if st.session_state.scraping_complete and st.session_state.profiles_data:
     # Add search/filter functionality
     search_col1, search_col2 = st.columns([3, 1])
     with search_col1:
-        search_term = st.text_input("🔍 Search in data", placeholder="Search by name, company, location...")
+        search_term = st.text_input(
+            "🔍 Search in data",
+            placeholder="Search by name, company, location...",
+            help="Every word must match; words match by prefix, e.g. \"eng lond\""
+        )
     with search_col2:
         show_all = st.checkbox("Show all columns", value=False)
     
     # Filter dataframe based on search
     if search_term:
-        mask = df.astype(str).apply(lambda x: x.str.contains(search_term, case=False, na=False)).any(axis=1)
-        filtered_df = df[mask]
+        filtered_df = df.iloc[cached_search_index(fingerprint, df).search(search_term)]
         st.info(f"Found {len(filtered_df)} matching record(s)")
     else:
         filtered_df = df
@@ -704,15 +467,15 @@ if st.session_state.scraping_complete and st.session_state.profiles_data:
     # Download Buttons
     st.markdown("---")
     st.subheader("💾 Download Data")
+    if live:
+        st.info("Downloads are available once scraping is finished")
+        return
     
-    col1, col2, col3 = st.columns(3)
+    col1, col2, col3, col4 = st.columns(4)
+    csv_data, json_data, excel_data = export_files(fingerprint, df, profiles)
     
     with col1:
         # CSV Download
-        csv_buffer = io.StringIO()
-        df.to_csv(csv_buffer, index=False)
-        csv_data = csv_buffer.getvalue()
-        
         st.download_button(
             label="📥 Download CSV",
             data=csv_data,
@@ -723,8 +486,6 @@ if st.session_state.scraping_complete and st.session_state.profiles_data:
     
     with col2:
         # JSON Download
-        json_data = json.dumps(profiles, indent=2, ensure_ascii=False)
-        
         st.download_button(
             label="📥 Download JSON",
             data=json_data,
@@ -735,11 +496,6 @@ if st.session_state.scraping_complete and st.session_state.profiles_data:
     
     with col3:
         # Excel Download
-        excel_buffer = io.BytesIO()
-        with pd.ExcelWriter(excel_buffer, engine='openpyxl') as writer:
-            df.to_excel(writer, index=False, sheet_name='Profiles')
-        excel_data = excel_buffer.getvalue()
-        
         st.download_button(
             label="📥 Download Excel",
             data=excel_data,
@@ -748,6 +504,21 @@ if st.session_state.scraping_complete and st.session_state.profiles_data:
             use_container_width=True
         )
     
+    with col4:
+        # Parquet Download
+        parquet_data = parquet_archive(fingerprint, profiles)
+        if parquet_data is not None:
+            st.download_button(
+                label="📥 Download Parquet",
+                data=parquet_data,
+                file_name=f"linkedin_profiles_{datetime.now().strftime('%Y%m%d_%H%M%S')}.parquet.zip",
+                mime="application/zip",
+                use_container_width=True,
+                help="profiles, experiences and educations tables; unzip and use Load Previous Run to reopen"
+            )
+        else:
+            st.caption("Install pyarrow for Parquet downloads")
+    
     # Additional Stats Section
     st.markdown("---")
     st.subheader("📈 Quick Statistics")
@@ -770,6 +541,21 @@ if st.session_state.scraping_complete and st.session_state.profiles_data:
         profiles_with_edu = sum(1 for p in profiles if p.get("educations", []))
         st.metric("Profiles with Education", profiles_with_edu)
     
+    tenure_col1, tenure_col2, tenure_col3, tenure_col4 = st.columns(4)
+    tenure = tenure_stats(fingerprint, tables)
+    
+    with tenure_col1:
+        st.metric("Median Months/Position", "-" if tenure["position_months"] is None else f"{tenure['position_months']:.0f}")
+    
+    with tenure_col2:
+        st.metric("Avg. Career (Years)", "-" if tenure["career_years"] is None else f"{tenure['career_years']:.1f}")
+    
+    with tenure_col3:
+        st.metric("Current Positions", tenure["current_positions"])
+    
+    with tenure_col4:
+        st.metric("Avg. Study (Years)", "-" if tenure["study_years"] is None else f"{tenure['study_years']:.1f}")
+    
     # Clear Data Button
     st.markdown("---")
     col_clear1, col_clear2, col_clear3 = st.columns([1, 1, 1])
@@ -779,6 +565,39 @@ if st.session_state.scraping_complete and st.session_state.profiles_data:
             st.session_state.scraping_complete = False
             st.rerun()
 
+
+@st.fragment(run_every=1.0)
+def show_job(job):
+    """Poll the background job and redraw the results gathered so far"""
+    job.drain()
+    if not job.running:
+        # Full rerun: finish_job stores the results and the polling stops
+        st.rerun()
+    
+    status_col, stop_col = st.columns([4, 1])
+    with status_col:
+        st.progress(len(job.profiles) / job.total if job.total else 1.0)
+        st.caption(f"🔄 {job.status} ({len(job.profiles)}/{job.total} done)")
+        if job.cache_summary:
+            st.caption(f"🗄️ {job.cache_summary}")
+    with stop_col:
+        if st.button("⏹️ Stop", use_container_width=True, disabled=job.stopped):
+            job.stop()
+    
+    if job.profiles:
+        show_results(job.profiles, live=True)
+
+
+if st.session_state.scrape_error:
+    st.error(f"❌ {st.session_state.scrape_error}")
+
+if job is not None:
+    show_job(job)
+elif st.session_state.scraping_complete and st.session_state.profiles_data:
+    show_results(
+        st.session_state.profiles_data, st.session_state.get("resource_summary"),
+        st.session_state.get("cache_summary")
+    )
 else:
     # Welcome message
     st.info("""
@@ -0,0 +1,295 @@
+# End-to-end throughput benchmark of LinkedInScraper against the local
+# fake_linkedin server. Reports profiles/min, per-profile latency percentiles,
+# WebDriver commands per profile and whether the scraped dicts are correct.
+# With --startup it instead times a cold import of the CLI, the app and the
+# shared core, and fails if any of them loads the browser or charting stack.
+# With --records it compares profile dicts with Profile records in memory
+# and JSON encode/decode time. With --parsing it runs the generated profiles'
+# summary rows through the field parsers, without a browser, and fails if a
+# field or a date (year-only ranges included) does not come out as expected.
+#
+#   python benchmark.py --profiles 20 --latency 0.2 --lazy-delay 0.8 --extraction js
+#   python benchmark.py --startup
+#   python benchmark.py --records 100000
+#   python benchmark.py --parsing 1000
+import argparse
+import json
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections import Counter
+
+import date_parsing
+from fake_linkedin import FakeLinkedInServer, expected_profile, generate_profile, summary_rows
+from object import Profile
+import profile_codec
+from linkedin_scraper import LinkedInScraper, create_driver
+from field_parsing import parse_item_cap, parse_experience_fields, parse_education_fields, DEFAULT_ITEM_CAP
+from scrape_errors import ScrapeError
+
+
+def count_commands(driver):
+    """Wrap driver.execute so every WebDriver command is counted"""
+    counts = Counter()
+    execute = driver.execute
+
+    def counting_execute(driver_command, params=None):
+        counts[driver_command] += 1
+        return execute(driver_command, params)
+
+    driver.execute = counting_execute
+    return counts
+
+
+# Entry points whose cold start is measured, and modules none of them may
+# import before they are actually used
+STARTUP_MODULES = ("linkedin_scraper", "Scrapper", "app")
+HEAVY_MODULES = ("selenium.webdriver", "pandas", "plotly")
+
+
+def measure_startup(module):
+    """Import module in a fresh interpreter and return its import timings.
+
+    Returns the total import time in seconds, the modules the import itself
+    pulled in directly with their cumulative seconds, and every module loaded.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed: {result.stderr.strip().splitlines()[-1]}")
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        rows.append((len(name) - len(name.lstrip()), name.strip(), int(cumulative) / 1e6))
+
+    # -X importtime lists a module after everything it imported, one level deeper
+    index = max(i for i, row in enumerate(rows) if row[1] == module)
+    depth, _, total = rows[index]
+    direct = {}
+    for row_depth, name, cumulative in reversed(rows[:index]):
+        if row_depth <= depth:
+            break
+        if row_depth == depth + 2:
+            direct[name] = cumulative
+    return {
+        "module": module,
+        "total": total,
+        "direct": direct,
+        "loaded": {name for _, name, _ in rows}
+    }
+
+
+def heavy_imports(loaded):
+    return sorted(
+        name for name in loaded
+        if any(name == heavy or name.startswith(heavy + ".") for heavy in HEAVY_MODULES)
+    )
+
+
+def print_startup_report(results):
+    """Print the import report; returns False if a heavy module was imported"""
+    ok = True
+    print("=" * 60)
+    for result in results:
+        print(f"import {result['module']:<22} {result['total'] * 1000:.0f} ms")
+        for name, seconds in sorted(result["direct"].items(), key=lambda item: -item[1])[:5]:
+            print(f"  {name:<28} {seconds * 1000:.0f} ms")
+        heavy = heavy_imports(result["loaded"])
+        if heavy:
+            ok = False
+            print(f"✗ Imported at startup: {', '.join(heavy[:5])}")
+    if ok:
+        print(f"✓ None of {', '.join(HEAVY_MODULES)} is imported at startup")
+    print("=" * 60)
+    return ok
+
+
+def measure_records(count):
+    """Memory and JSON round-trip time of count profiles, as dicts and as records"""
+    lines = [
+        json.dumps(expected_profile(f"rec-{i}", f"https://www.linkedin.com/in/rec-{i}/")).encode("utf-8")
+        for i in range(count)
+    ]
+
+    def measure(decode, encode):
+        started = time.perf_counter()
+        profiles = [decode(line) for line in lines]
+        decode_seconds = time.perf_counter() - started
+        started = time.perf_counter()
+        for profile in profiles:
+            encode(profile)
+        encode_seconds = time.perf_counter() - started
+        del profiles
+
+        tracemalloc.start()
+        profiles = [decode(line) for line in lines]
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del profiles
+        return {"decode": decode_seconds, "encode": encode_seconds, "memory": memory}
+
+    return {
+        "profiles": count,
+        "codec": "orjson" if profile_codec.orjson is not None else "json",
+        "dicts": measure(json.loads, lambda profile: json.dumps(profile, ensure_ascii=False).encode("utf-8")),
+        "records": measure(profile_codec.decode, profile_codec.encode)
+    }
+
+
+def print_records_report(result):
+    print("=" * 60)
+    print(f"{result['profiles']} profiles, records encoded with {result['codec']}")
+    print(f"{'':<10} {'memory':>10} {'decode':>10} {'encode':>10}")
+    for kind in ("dicts", "records"):
+        measured = result[kind]
+        print(
+            f"{kind:<10} {measured['memory'] / 1e6:>8.1f}MB {measured['decode']:>9.2f}s {measured['encode']:>9.2f}s"
+        )
+    print("=" * 60)
+
+
+def check_parsing(count):
+    """Parse the summary rows of count generated profiles; returns the entries that came out wrong.
+
+    Each problem is (profile id, what went wrong): the parsed entry differs
+    from expected_profile's, or one of its dates is unreadable to date_parsing.
+    """
+    problems = []
+    for i in range(count):
+        profile_id = f"parse-{i}"
+        expected = expected_profile(profile_id, "", item_cap=None)
+        experience_rows, education_rows = summary_rows(generate_profile(profile_id))
+        for key, rows, parse in (
+            ("experiences", experience_rows, parse_experience_fields),
+            ("educations", education_rows, parse_education_fields)
+        ):
+            for row, wanted in zip(rows, expected[key]):
+                entry = parse(row)
+                if entry != wanted:
+                    problems.append((profile_id, f"{row[2]!r} parsed as {entry}"))
+                elif date_parsing.parse_month(entry["from_date"]) is None or (
+                    date_parsing.parse_month(entry["to_date"], end=True) is None
+                ):
+                    problems.append((profile_id, f"unreadable dates in {row[2]!r}"))
+    return problems
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def run_benchmark(profiles=10, latency=0.0, lazy_delay=0.0, extraction="webdriver",
+                  headless=True, blocked_urls=None, item_cap=DEFAULT_ITEM_CAP):
+    """Scrape generated profiles from a local server and return the measurements"""
+    server = FakeLinkedInServer(latency=latency, lazy_delay=lazy_delay).start()
+    driver = create_driver(headless=headless, blocked_urls=blocked_urls)
+    try:
+        scraper = LinkedInScraper(driver, extraction=extraction, base_url=server.base_url, item_cap=item_cap)
+        if not scraper.login("bench@example.com", "bench"):
+            raise RuntimeError("Login to the fake server failed")
+
+        counts = count_commands(driver)
+        latencies = []
+        mismatches = []
+        started = time.perf_counter()
+        for i in range(profiles):
+            profile_id = f"bench-{i}"
+            url = server.profile_url(profile_id)
+            profile_started = time.perf_counter()
+            try:
+                profile_data = scraper.scrape_profile(url)
+            except ScrapeError as e:
+                profile_data = {"url": url, "error": str(e)}
+            latencies.append(time.perf_counter() - profile_started)
+            if profile_data != Profile.from_dict(expected_profile(profile_id, url, item_cap)):
+                mismatches.append(url)
+        elapsed = time.perf_counter() - started
+    finally:
+        driver.quit()
+        server.shutdown()
+
+    return {
+        "extraction": extraction,
+        "profiles": profiles,
+        "elapsed": elapsed,
+        "profiles_per_min": profiles / elapsed * 60,
+        "p50": percentile(latencies, 50),
+        "p95": percentile(latencies, 95),
+        "commands": sum(counts.values()),
+        "commands_per_profile": sum(counts.values()) / profiles,
+        "command_counts": counts,
+        "mismatches": mismatches
+    }
+
+
+def print_report(result):
+    print("=" * 60)
+    print(f"Extraction mode:       {result['extraction']}")
+    print(f"Profiles:              {result['profiles']} in {result['elapsed']:.1f} s")
+    print(f"Throughput:            {result['profiles_per_min']:.1f} profiles/min")
+    print(f"Latency p50 / p95:     {result['p50']:.2f} s / {result['p95']:.2f} s")
+    print(f"WebDriver commands:    {result['commands']} ({result['commands_per_profile']:.1f} per profile)")
+    for command, count in result["command_counts"].most_common(5):
+        print(f"  {command:<28} {count}")
+    if result["mismatches"]:
+        print(f"✗ {len(result['mismatches'])} profile(s) did not match the expected data")
+    else:
+        print("✓ All profiles match the expected data")
+    print("=" * 60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark LinkedInScraper against a local fake LinkedIn")
+    parser.add_argument("--profiles", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--lazy-delay", type=float, default=0.0, help="seconds before detail lists render")
+    parser.add_argument("--extraction", choices=["webdriver", "js", "html"], default="webdriver")
+    parser.add_argument("--item-cap", type=parse_item_cap, default=DEFAULT_ITEM_CAP,
+                        help="items kept per section, 0 for all")
+    parser.add_argument("--headed", action="store_true", help="show the browser window")
+    parser.add_argument("--startup", action="store_true",
+                        help="measure import time of the entry points instead of scraping")
+    parser.add_argument("--records", type=int, metavar="N",
+                        help="compare N profile dicts with Profile records instead of scraping")
+    parser.add_argument("--parsing", type=int, metavar="N",
+                        help="check the field parsers against N generated profiles instead of scraping")
+    args = parser.parse_args()
+
+    if args.parsing:
+        problems = check_parsing(args.parsing)
+        for profile_id, problem in problems[:10]:
+            print(f"✗ {profile_id}: {problem}")
+        print(f"{'✗' if problems else '✓'} {len(problems)} problem(s) parsing {args.parsing} generated profiles")
+        sys.exit(1 if problems else 0)
+
+    if args.records:
+        print_records_report(measure_records(args.records))
+        return
+
+    if args.startup:
+        results = [measure_startup(module) for module in STARTUP_MODULES]
+        sys.exit(0 if print_startup_report(results) else 1)
+
+    result = run_benchmark(
+        profiles=args.profiles,
+        latency=args.latency,
+        lazy_delay=args.lazy_delay,
+        extraction=args.extraction,
+        headless=not args.headed,
+        item_cap=args.item_cap
+    )
+    print_report(result)
+
+
+if __name__ == "__main__":
+    main()
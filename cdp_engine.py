@@ -0,0 +1,627 @@
+# asyncio scraping engine that drives Chrome over the DevTools protocol
+# directly, without Selenium or chromedriver. Every profile is scraped in its
+# own tab, so many pages can be in flight from a single Python thread.
+# Extraction uses the same in-browser scripts as EXTRACTION=js and yields the
+# same profile dicts as Scrapper.LinkedInScraper.
+import asyncio
+import itertools
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+import urllib.request
+from urllib.parse import urlparse
+
+import js_extraction
+import session_vault
+from object import Profile
+from rate_limiter import looks_throttled
+from scrape_metrics import NO_TIMER
+from scrape_errors import (
+    Deadline, DeadlineExceeded, RetryQueue, check_landing, raise_if_classified, DEFAULT_PROFILE_BUDGET
+)
+from field_parsing import (
+    new_profile_data, parse_experience_fields, parse_education_fields, needs_detail_page, DEFAULT_ITEM_CAP
+)
+
+
+CHROME_CANDIDATES = [
+    "google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+    r"C:\Program Files\Google\Chrome\Application\chrome.exe"
+]
+
+# Fills the login form and submits it; arguments[0]: email, arguments[1]: password
+FILL_LOGIN_SCRIPT = """
+function fill(id, value) {
+    var field = document.getElementById(id);
+    var setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+    setter.call(field, value);
+    field.dispatchEvent(new Event('input', {bubbles: true}));
+    field.dispatchEvent(new Event('change', {bubbles: true}));
+}
+fill('username', arguments[0]);
+fill('password', arguments[1]);
+document.evaluate(
+    "//button[@type='submit']", document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+).singleNodeValue.click();
+"""
+
+
+class CDPError(Exception):
+    pass
+
+
+class CDPConnection:
+    """One WebSocket to the browser, shared by all tabs (flattened sessions)"""
+
+    def __init__(self, websocket):
+        self._websocket = websocket
+        self._ids = itertools.count(1)
+        self._pending = {}
+        self._listeners = []
+        self._reader = asyncio.ensure_future(self._read_loop())
+
+    @classmethod
+    async def connect(cls, ws_url):
+        try:
+            import websockets
+        except ImportError:
+            raise RuntimeError("The cdp engine needs the 'websockets' package: pip install websockets")
+        return cls(await websockets.connect(ws_url, max_size=None))
+
+    async def send(self, method, params=None, session_id=None):
+        """Send a command and wait for its result"""
+        message_id = next(self._ids)
+        message = {"id": message_id, "method": method, "params": params or {}}
+        if session_id:
+            message["sessionId"] = session_id
+        future = asyncio.get_running_loop().create_future()
+        self._pending[message_id] = future
+        await self._websocket.send(json.dumps(message))
+        return await future
+
+    def wait_for(self, method, session_id=None):
+        """Future resolved with the params of the next matching event"""
+        future = asyncio.get_running_loop().create_future()
+        self._listeners.append((method, session_id, future))
+        return future
+
+    async def _read_loop(self):
+        try:
+            async for raw in self._websocket:
+                message = json.loads(raw)
+                if "id" in message:
+                    future = self._pending.pop(message["id"], None)
+                    if future is None or future.done():
+                        continue
+                    if "error" in message:
+                        future.set_exception(CDPError(message["error"].get("message", "CDP error")))
+                    else:
+                        future.set_result(message.get("result", {}))
+                    continue
+
+                listeners = []
+                for method, session_id, future in self._listeners:
+                    if future.done():
+                        continue
+                    if message.get("method") == method and message.get("sessionId") == session_id:
+                        future.set_result(message.get("params", {}))
+                    else:
+                        listeners.append((method, session_id, future))
+                self._listeners = listeners
+        except Exception:
+            pass
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(CDPError("DevTools connection closed"))
+            self._pending.clear()
+
+    async def close(self):
+        await self._websocket.close()
+        await asyncio.gather(self._reader, return_exceptions=True)
+
+
+class CDPPage:
+    """A browser tab with the page helpers the scraper needs"""
+
+    def __init__(self, connection, target_id, session_id):
+        self.connection = connection
+        self.target_id = target_id
+        self.session_id = session_id
+
+    @classmethod
+    async def open(cls, connection, blocked_urls=None):
+        target = await connection.send("Target.createTarget", {"url": "about:blank"})
+        attached = await connection.send(
+            "Target.attachToTarget", {"targetId": target["targetId"], "flatten": True}
+        )
+        page = cls(connection, target["targetId"], attached["sessionId"])
+        await page.send("Page.enable")
+        if blocked_urls:
+            await page.send("Network.enable")
+            await page.send("Network.setBlockedURLs", {"urls": list(blocked_urls)})
+        return page
+
+    async def send(self, method, params=None):
+        return await self.connection.send(method, params, self.session_id)
+
+    async def navigate(self, url, timeout=30):
+        """Load url and wait for its load event"""
+        loaded = self.connection.wait_for("Page.loadEventFired", self.session_id)
+        try:
+            result = await self.send("Page.navigate", {"url": url})
+            if result.get("errorText"):
+                raise CDPError(f"Navigation to {url} failed: {result['errorText']}")
+            await asyncio.wait_for(loaded, timeout)
+        finally:
+            loaded.cancel()
+
+    async def call(self, script, *args, async_callback=False):
+        """Run a Selenium-style script (``arguments``/``return``) and return its value.
+
+        With ``async_callback`` the script reports its result through the
+        last argument, like execute_async_script.
+        """
+        args_json = json.dumps(list(args))
+        if async_callback:
+            expression = (
+                "new Promise(function (resolve) { (function () {" + script + "})"
+                ".apply(null, " + args_json + ".concat([resolve])); })"
+            )
+        else:
+            expression = "(function () {" + script + "}).apply(null, " + args_json + ")"
+        result = await self.send("Runtime.evaluate", {
+            "expression": expression,
+            "returnByValue": True,
+            "awaitPromise": async_callback
+        })
+        if "exceptionDetails" in result:
+            details = result["exceptionDetails"]
+            raise CDPError(details.get("exception", {}).get("description") or details.get("text"))
+        return result.get("result", {}).get("value")
+
+    async def wait_for_page_ready(self, selectors=(), timeout=5, quiet_period=0.5):
+        try:
+            return bool(await self.call(
+                js_extraction.PAGE_READY_SCRIPT, list(selectors), int(timeout * 1000),
+                int(quiet_period * 1000), async_callback=True
+            ))
+        except CDPError:
+            return False
+
+    async def load_list_items(self, container, cap=None, timeout=10, stable_period=1.0):
+        """Scroll a paginated list until it stops growing or holds cap items"""
+        try:
+            return await self.call(
+                js_extraction.LOAD_LIST_ITEMS_SCRIPT, container, cap, int(timeout * 1000),
+                int(stable_period * 1000), async_callback=True
+            ) or 0
+        except CDPError:
+            return 0
+
+    async def current_url(self):
+        return await self.call("return location.href;")
+
+    async def scroll_to_half(self):
+        await self.call("window.scrollTo(0, Math.ceil(document.body.scrollHeight/2));")
+
+    async def scroll_to_bottom(self):
+        await self.call("window.scrollTo(0, document.body.scrollHeight);")
+
+    async def close(self):
+        try:
+            await self.connection.send("Target.closeTarget", {"targetId": self.target_id})
+        except CDPError:
+            pass
+
+
+def find_chrome():
+    """Path of the Chrome binary (CHROME_PATH overrides the search)"""
+    if os.getenv("CHROME_PATH"):
+        return os.getenv("CHROME_PATH")
+    for candidate in CHROME_CANDIDATES:
+        path = shutil.which(candidate) or (candidate if os.path.isfile(candidate) else None)
+        if path:
+            return path
+    raise RuntimeError("Chrome not found; set CHROME_PATH")
+
+
+def to_cdp_cookie(cookie):
+    """Convert a Selenium-format cookie (as stored in the session vault) for CDP"""
+    converted = {
+        key: cookie[key]
+        for key in ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite")
+        if key in cookie
+    }
+    if "expiry" in cookie:
+        converted["expires"] = cookie["expiry"]
+    return converted
+
+
+def from_cdp_cookie(cookie):
+    """Convert a CDP cookie to the Selenium format used by the session vault"""
+    converted = {
+        key: cookie[key]
+        for key in ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite")
+        if key in cookie
+    }
+    if cookie.get("expires", -1) > 0:
+        converted["expiry"] = int(cookie["expires"])
+    return converted
+
+
+class CDPBrowser:
+    """A Chrome process and its DevTools connection"""
+
+    def __init__(self, process, connection, user_data_dir, blocked_urls=None):
+        self.process = process
+        self.connection = connection
+        self.user_data_dir = user_data_dir
+        self.blocked_urls = blocked_urls
+
+    @classmethod
+    async def launch(cls, headless=False, blocked_urls=None, startup_timeout=30):
+        user_data_dir = tempfile.mkdtemp(prefix="linkedin-cdp-")
+        args = [
+            find_chrome(),
+            "--remote-debugging-port=0",
+            f"--user-data-dir={user_data_dir}",
+            "--no-sandbox",
+            "--disable-dev-shm-usage",
+            "--no-first-run",
+            "--no-default-browser-check",
+            "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
+            "about:blank"
+        ]
+        if headless:
+            args.insert(1, "--headless=new")
+        process = subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+        # Chrome writes the port it picked to DevToolsActivePort
+        port_file = os.path.join(user_data_dir, "DevToolsActivePort")
+        deadline = time.monotonic() + startup_timeout
+        port = None
+        while not port:
+            if time.monotonic() > deadline or process.poll() is not None:
+                process.kill()
+                shutil.rmtree(user_data_dir, ignore_errors=True)
+                raise RuntimeError("Chrome did not start its DevTools endpoint")
+            await asyncio.sleep(0.1)
+            try:
+                with open(port_file) as f:
+                    port = f.readline().strip()
+            except FileNotFoundError:
+                pass
+
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/json/version") as response:
+            ws_url = json.load(response)["webSocketDebuggerUrl"]
+        connection = await CDPConnection.connect(ws_url)
+        return cls(process, connection, user_data_dir, blocked_urls)
+
+    async def new_page(self):
+        return await CDPPage.open(self.connection, self.blocked_urls)
+
+    async def restore_session(self, session):
+        """Install a session from the vault into the browser"""
+        await self.connection.send(
+            "Storage.setCookies", {"cookies": [to_cdp_cookie(c) for c in session.get("cookies", [])]}
+        )
+        local_storage = session.get("local_storage") or {}
+        if local_storage:
+            page = await self.new_page()
+            try:
+                await page.navigate(session_vault.SESSION_ORIGIN)
+                await page.call(
+                    "var data = arguments[0];"
+                    "for (var key in data) { localStorage.setItem(key, data[key]); }",
+                    local_storage
+                )
+            finally:
+                await page.close()
+
+    async def capture_session(self, page):
+        """Capture cookies and localStorage in the session vault format"""
+        cookies = await self.connection.send("Storage.getCookies")
+        local_storage = await page.call(
+            "var data = {};"
+            "for (var i = 0; i < localStorage.length; i++) {"
+            "  var key = localStorage.key(i); data[key] = localStorage.getItem(key);"
+            "}"
+            "return data;"
+        ) or {}
+        return {
+            "saved_at": time.time(),
+            "cookies": [from_cdp_cookie(c) for c in cookies.get("cookies", [])],
+            "local_storage": local_storage
+        }
+
+    async def close(self):
+        try:
+            await self.connection.send("Browser.close")
+        except Exception:
+            pass
+        await self.connection.close()
+        try:
+            self.process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+        shutil.rmtree(self.user_data_dir, ignore_errors=True)
+
+
+class AsyncLinkedInScraper:
+    """Async counterpart of Scrapper.LinkedInScraper on top of a CDPBrowser"""
+
+    def __init__(self, browser, limiter=None, item_cap=DEFAULT_ITEM_CAP, metrics=None):
+        self.browser = browser
+        self.session = None
+        # Items kept per experience/education section, None for all of them
+        self.item_cap = item_cap
+        # Shared RateLimiter every page load draws from, if any
+        self.limiter = limiter
+        # Shared ScrapeMetrics the phases are timed into, if any
+        self.metrics = metrics
+
+    def phase(self, name):
+        """Context manager timing a phase (navigation, wait, scroll, ...) into ``metrics``.
+
+        Tabs overlap, so the phases of a run can add up to more than its length.
+        """
+        return NO_TIMER if self.metrics is None else self.metrics.phase(name)
+
+    async def load_page(self, page, url, selectors=(), timeout=5, deadline=None):
+        """Load url in page once the rate limiter allows it and report how it went.
+
+        With a ``deadline`` the rate limiter's wait is left out of it, and
+        neither the load nor the wait may outlast it.
+        """
+        if self.limiter is not None:
+            with self.phase("rate_limit"):
+                await self.limiter.acquire_async(deadline)
+        load_timeout = 30
+        if deadline is not None:
+            deadline.check(url)
+            timeout = min(timeout, deadline.remaining())
+            load_timeout = min(load_timeout, deadline.remaining())
+        if self.metrics is not None:
+            self.metrics.inc("page_loads_total")
+        with self.phase("navigation"):
+            await page.navigate(url, load_timeout)
+        with self.phase("wait"):
+            ready = await page.wait_for_page_ready(selectors, timeout)
+        if self.limiter is not None:
+            try:
+                text_length = None if ready else await page.call(
+                    "return document.body ? document.body.innerText.trim().length : 0;"
+                )
+                throttled = looks_throttled(await page.current_url(), text_length)
+            except CDPError:
+                throttled = False
+            self.limiter.report(throttled)
+        return ready
+
+    @staticmethod
+    async def is_signed_in(page):
+        try:
+            path = urlparse(await page.current_url()).path
+            return path.startswith("/feed") or path.startswith("/mynetwork")
+        except CDPError:
+            return False
+
+    async def login(self, email, password):
+        """Login to LinkedIn"""
+        with NO_TIMER if self.metrics is None else self.metrics.timer("login_seconds"):
+            return await self._login(email, password)
+
+    async def _login(self, email, password):
+        page = await self.browser.new_page()
+        try:
+            await self.load_page(page, "https://www.linkedin.com/login", ["#username"], timeout=3)
+            with self.phase("input"):
+                await page.call(FILL_LOGIN_SCRIPT, email, password)
+            print("Logging in...")
+
+            deadline = time.monotonic() + 8
+            with self.phase("wait"):
+                while time.monotonic() < deadline and not await self.is_signed_in(page):
+                    await asyncio.sleep(0.25)
+
+            if await self.is_signed_in(page):
+                print("✓ LOGIN SUCCESS!")
+                self.session = await self.browser.capture_session(page)
+                return True
+            print("✗ Login failed! Check credentials or 2FA.")
+            return False
+        except Exception as e:
+            print(f"✗ Login error: {e}")
+            return False
+        finally:
+            await page.close()
+
+    async def resume_session(self, session):
+        """Re-use a saved session; returns True if LinkedIn still accepts it"""
+        await self.browser.restore_session(session)
+        page = await self.browser.new_page()
+        try:
+            await self.load_page(page, "https://www.linkedin.com/feed/", timeout=5)
+            return await self.is_signed_in(page)
+        finally:
+            await page.close()
+
+    async def scrape_profile(self, url, deadline=None):
+        """Scrape a single LinkedIn profile in its own tab; ``deadline`` bounds its page loads"""
+        print(f"\n→ Scraping: {url}")
+        page = await self.browser.new_page()
+        try:
+            await self.load_page(page, url, ["h1"], timeout=5, deadline=deadline)
+            check_landing(url, await page.current_url())
+            profile_data = new_profile_data(url)
+
+            try:
+                with self.phase("extraction"):
+                    top_card = await page.call(js_extraction.TOP_CARD_SCRIPT) or {}
+                for key in ("name", "headline", "location"):
+                    profile_data[key] = top_card.get(key) if top_card.get(key) is not None else "N/A"
+
+                # Scroll to load more content
+                for scroll in (page.scroll_to_half, page.scroll_to_bottom):
+                    with self.phase("scroll"):
+                        await scroll()
+                    with self.phase("wait"):
+                        await page.wait_for_page_ready(timeout=2)
+
+                # Read both sections off the profile page, and only visit the
+                # detail pages of those that are cut short
+                experiences = await self._get_section(page, "experience", parse_experience_fields, 4)
+                educations = await self._get_section(page, "education", parse_education_fields, 3)
+                if experiences is None:
+                    experiences = await self.get_experiences(url, page, deadline)
+                if educations is None:
+                    educations = await self.get_educations(url, page, deadline)
+                profile_data["experiences"] = experiences
+                profile_data["educations"] = educations
+
+                print(f"✓ Scraped: {profile_data['name']}")
+                return Profile.from_dict(profile_data)
+
+            except Exception as e:
+                raise_if_classified(e)
+                print(f"✗ Error scraping {url}: {e}")
+                profile_data["error"] = str(e)
+                return Profile.from_dict(profile_data)
+        finally:
+            await page.close()
+
+    async def _get_section(self, page, anchor, parse_fields, max_spans):
+        """Parse a section of the loaded profile page, or None if its detail page is needed"""
+        with self.phase("extraction"):
+            section = await page.call(js_extraction.PROFILE_SECTION_SCRIPT, anchor, self.item_cap, max_spans)
+        if section is None or needs_detail_page(section["count"], section["showAll"], self.item_cap):
+            return None
+        with self.phase("parsing"):
+            return [item for item in map(parse_fields, section["items"]) if item]
+
+    async def _get_list(self, page, section_url, parse_fields, max_spans, deadline=None):
+        await self.load_page(page, section_url, ["main .pvs-list__container"], timeout=3, deadline=deadline)
+        with self.phase("scroll"):
+            await page.load_list_items("main .pvs-list__container", self.item_cap)
+        with self.phase("extraction"):
+            rows = await page.call(
+                js_extraction.LIST_ITEMS_SCRIPT, "main .pvs-list__container", self.item_cap, max_spans
+            ) or []
+        with self.phase("parsing"):
+            return [item for item in map(parse_fields, rows) if item]
+
+    async def get_experiences(self, base_url, page=None, deadline=None):
+        """Get experience details"""
+        own_page = page is None
+        page = page or await self.browser.new_page()
+        try:
+            return await self._get_list(
+                page, base_url.rstrip('/') + "/details/experience", parse_experience_fields, 4, deadline
+            )
+        except Exception as e:
+            raise_if_classified(e)
+            print(f"  Warning: Could not fetch experiences - {e}")
+            return []
+        finally:
+            if own_page:
+                await page.close()
+
+    async def get_educations(self, base_url, page=None, deadline=None):
+        """Get education details"""
+        own_page = page is None
+        page = page or await self.browser.new_page()
+        try:
+            return await self._get_list(
+                page, base_url.rstrip('/') + "/details/education", parse_education_fields, 3, deadline
+            )
+        except Exception as e:
+            raise_if_classified(e)
+            print(f"  Warning: Could not fetch education - {e}")
+            return []
+        finally:
+            if own_page:
+                await page.close()
+
+
+async def scrape_within_budget(scraper, url, profile_budget):
+    """Scrape url, cancelling it once it has used up profile_budget seconds.
+
+    The budget is a Deadline rather than a fixed asyncio timeout, so time
+    spent waiting on the rate limiter is left out, as with Selenium.
+    """
+    deadline = Deadline(profile_budget)
+    task = asyncio.ensure_future(scraper.scrape_profile(url, deadline))
+    try:
+        with NO_TIMER if scraper.metrics is None else scraper.metrics.timer("profile_seconds"):
+            while True:
+                done, _ = await asyncio.wait({task}, timeout=deadline.remaining())
+                if done:
+                    return task.result()
+                if deadline.remaining() <= 0:
+                    raise DeadlineExceeded(f"Profile budget of {profile_budget:g} s used up")
+    finally:
+        # Also when the worker itself is cancelled
+        if not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+
+async def run(urls, email, password, on_result, concurrency=4,
+              vault_path=session_vault.DEFAULT_VAULT_PATH, blocked_urls=None, headless=False,
+              limiter=None, profile_budget=DEFAULT_PROFILE_BUDGET, item_cap=DEFAULT_ITEM_CAP, metrics=None):
+    """Log in (or re-use the vault session) and scrape urls with concurrent tabs.
+
+    ``on_result`` is called with each profile as soon as it finishes. All
+    tabs draw their page loads from ``limiter``, each profile gets
+    ``profile_budget`` seconds, and timeouts and crashed tabs are retried
+    at the end of ``urls`` (a RetryQueue, or any iterable of URLs).
+    Phases and page loads are timed into ``metrics`` if one is given.
+    Returns False if logging in failed.
+    """
+    print("\n→ Starting Chrome (DevTools engine)...")
+    browser = await CDPBrowser.launch(headless=headless, blocked_urls=blocked_urls)
+    try:
+        scraper = AsyncLinkedInScraper(browser, limiter, item_cap, metrics)
+
+        # Re-use the saved session, and only log in when it is rejected
+        session = session_vault.load_session(vault_path)
+        if session and await scraper.resume_session(session):
+            print("✓ Re-used saved session")
+        else:
+            if session:
+                print("→ Saved session rejected, logging in again...")
+                session_vault.delete_session(vault_path)
+            if not await scraper.login(email, password):
+                return False
+            session_vault.save_session(scraper.session, vault_path)
+            print(f"✓ Session saved to {vault_path}")
+
+        print(f"\n→ Scraping profiles in up to {concurrency} tabs...")
+        queue = urls if isinstance(urls, RetryQueue) else RetryQueue(urls)
+
+        async def worker():
+            for url in queue:
+                try:
+                    profile_data = await scrape_within_budget(scraper, url, profile_budget)
+                except Exception as e:
+                    profile_data = queue.handle(url, e)
+                if profile_data is not None:
+                    on_result(profile_data)
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(max(1, concurrency))]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            # A fatal error in one worker stops the others before the browser
+            # is closed under them
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+        return True
+    finally:
+        await browser.close()
@@ -0,0 +1,93 @@
+import os
+
+import profile_codec
+
+
+DEFAULT_JOURNAL_PATH = "linkedin_profiles.jsonl"
+
+
+class ProfileJournal:
+    """Append-only JSONL journal of scraped profiles.
+
+    Every profile is written and fsync'ed as soon as it is scraped, so a
+    crash loses at most the profile in flight. Reading never loads the whole
+    journal into memory.
+    """
+
+    def __init__(self, path=DEFAULT_JOURNAL_PATH):
+        self.path = path
+        self._line_checked = False
+
+    def reset(self):
+        """Start a fresh journal"""
+        open(self.path, "w", encoding="utf-8").close()
+        self._line_checked = True
+
+    def _end_partial_line(self):
+        """Terminate a line cut short by a crash so new records start cleanly"""
+        try:
+            with open(self.path, "rb+") as f:
+                f.seek(0, os.SEEK_END)
+                if f.tell() > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        f.write(b"\n")
+        except FileNotFoundError:
+            pass
+        self._line_checked = True
+
+    def append(self, profile_data):
+        """Write one profile and flush it to disk"""
+        if not self._line_checked:
+            self._end_partial_line()
+        with open(self.path, "ab") as f:
+            f.write(profile_codec.encode(profile_data) + b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _lines(self):
+        """Yield (offset, line) for every line"""
+        try:
+            f = open(self.path, "rb")
+        except FileNotFoundError:
+            return
+        with f:
+            offset = 0
+            for line in f:
+                yield offset, line
+                offset += len(line)
+
+    def _records(self):
+        """Yield (offset, profile dict) for every readable line"""
+        for offset, line in self._lines():
+            try:
+                profile = profile_codec.loads(line)
+            except ValueError:
+                # A line cut short by a crash
+                continue
+            if profile is not None:
+                yield offset, profile
+
+    def completed_urls(self):
+        """URLs whose latest record finished without an error"""
+        completed = set()
+        for _, profile in self._records():
+            if profile.get("error"):
+                completed.discard(profile.get("url"))
+            else:
+                completed.add(profile.get("url"))
+        return completed
+
+    def iter_profiles(self):
+        """Yield the latest record of each URL, in journal order"""
+        # The first pass only needs each line's URL, so it reads plain dicts
+        # and keeps an offset per URL; the second builds the records it yields
+        latest = {}
+        for offset, profile in self._records():
+            latest[profile.get("url")] = offset
+        wanted = set(latest.values())
+        del latest
+
+        for offset, line in self._lines():
+            if offset in wanted:
+                yield profile_codec.decode(line)
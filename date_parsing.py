@@ -0,0 +1,180 @@
+# Turns the free-text dates and durations of experience and education entries
+# ("Jan 2020", "2019", "Present", "2 yrs 3 mos", "févr. 2021", "1 J. 2 Mon.")
+# into numbers. Months are counted from year 0 (year * 12 + month - 1) so
+# that subtracting two of them gives a number of months. The batch functions
+# parse each distinct string once, which is what makes whole columns cheap:
+# a few hundred distinct dates cover any number of rows.
+import re
+import unicodedata
+from datetime import date
+
+
+# Full month names; every unambiguous prefix of three or more letters is
+# accepted as an abbreviation as well
+MONTH_NAMES = [
+    # English
+    ["january", "february", "march", "april", "may", "june", "july", "august", "september", "october",
+     "november", "december"],
+    # German
+    ["januar", "februar", "marz", "april", "mai", "juni", "juli", "august", "september", "oktober",
+     "november", "dezember"],
+    # French
+    ["janvier", "fevrier", "mars", "avril", "mai", "juin", "juillet", "aout", "septembre", "octobre",
+     "novembre", "decembre"],
+    # Spanish
+    ["enero", "febrero", "marzo", "abril", "mayo", "junio", "julio", "agosto", "septiembre", "octubre",
+     "noviembre", "diciembre"],
+    # Portuguese
+    ["janeiro", "fevereiro", "marco", "abril", "maio", "junho", "julho", "agosto", "setembro", "outubro",
+     "novembro", "dezembro"],
+    # Italian
+    ["gennaio", "febbraio", "marzo", "aprile", "maggio", "giugno", "luglio", "agosto", "settembre", "ottobre",
+     "novembre", "dicembre"],
+    # Dutch
+    ["januari", "februari", "maart", "april", "mei", "juni", "juli", "augustus", "september", "oktober",
+     "november", "december"]
+]
+# Abbreviations that are not prefixes of the full name
+MONTH_ABBREVIATIONS = {"mrt": 3, "sept": 9}
+
+PRESENT_WORDS = {
+    "present", "current", "now", "heute", "aujourd'hui", "actuel", "actualidad", "presente", "atual",
+    "oggi", "heden"
+}
+YEAR_WORDS = {
+    "yr", "yrs", "year", "years", "j", "jahr", "jahre", "an", "ans", "ano", "anos", "anio", "anios",
+    "anno", "anni", "jaar", "jr"
+}
+MONTH_WORDS = {
+    "mo", "mos", "month", "months", "mon", "monat", "monate", "mois", "mes", "meses", "mese", "mesi",
+    "maand", "maanden", "mnd"
+}
+
+DATE_PATTERN = re.compile(r"^(?:([^\W\d_]+)\.?\s+)?(\d{4})$")
+DURATION_PATTERN = re.compile(r"(\d+)\s*([^\W\d_]+)")
+
+
+def _month_lookup():
+    lookup = {}
+    for names in MONTH_NAMES:
+        for month, name in enumerate(names, 1):
+            for end in range(3, len(name) + 1):
+                lookup.setdefault(name[:end], set()).add(month)
+    months = {prefix: found.pop() for prefix, found in lookup.items() if len(found) == 1}
+    months.update(MONTH_ABBREVIATIONS)
+    return months
+
+
+MONTHS = _month_lookup()
+
+
+def normalize(text):
+    """Lower-case text without accents, so "Févr." and "fevr." look the same"""
+    text = unicodedata.normalize("NFKD", text.strip().lower())
+    return "".join(c for c in text if not unicodedata.combining(c))
+
+
+def month_index(year, month):
+    return year * 12 + month - 1
+
+
+def format_month(index):
+    """A month index as "YYYY-MM", or None"""
+    if index is None:
+        return None
+    year, month = divmod(index, 12)
+    return f"{year:04d}-{month + 1:02d}"
+
+
+def current_month(today=None):
+    today = today or date.today()
+    return month_index(today.year, today.month)
+
+
+def is_present(text):
+    """True for "Present" and its translations"""
+    return bool(text) and normalize(text) in PRESENT_WORDS
+
+
+def parse_month(text, end=False, today=None):
+    """Month index of a date such as "Jan 2020", "2020" or "Present"; None if unreadable.
+
+    A year on its own means its first month, or its last one for the end
+    of a range (``end=True``). "Present" is the current month.
+    """
+    if not text:
+        return None
+    if is_present(text):
+        return current_month(today)
+    # Older exports kept the dash of a range on its start ("2020 -")
+    text = normalize(text).rstrip(" -")
+    match = DATE_PATTERN.match(text)
+    if match is None:
+        return None
+    name, year = match.groups()
+    if name is None:
+        return month_index(int(year), 12 if end else 1)
+    month = MONTHS.get(name)
+    if month is None:
+        return None
+    return month_index(int(year), month)
+
+
+def parse_duration(text):
+    """Total months of a duration such as "2 yrs 3 mos" or "1 an 2 mois"; None if unreadable"""
+    if not text:
+        return None
+    months = None
+    for count, unit in DURATION_PATTERN.findall(normalize(text)):
+        if unit in YEAR_WORDS:
+            months = (months or 0) + int(count) * 12
+        elif unit in MONTH_WORDS:
+            months = (months or 0) + int(count)
+    return months
+
+
+def _parse_distinct(values, parse):
+    parsed = {}
+    result = []
+    for value in values:
+        if value not in parsed:
+            parsed[value] = parse(value) if isinstance(value, str) else None
+        result.append(parsed[value])
+    return result
+
+
+def parse_months(values, end=False, today=None):
+    """parse_month over a column of values, parsing each distinct value once"""
+    today = today or date.today()
+    return _parse_distinct(values, lambda text: parse_month(text, end, today))
+
+
+def parse_durations(values):
+    """parse_duration over a column of values, parsing each distinct value once"""
+    return _parse_distinct(values, parse_duration)
+
+
+def total_months(from_months, to_months, durations=None):
+    """Length of each entry in months.
+
+    The stated duration wins; otherwise the range is counted inclusively
+    ("Jan 2020 - Mar 2020" is 3 months).
+    """
+    durations = durations or [None] * len(from_months)
+    return [
+        duration if duration is not None else
+        to_month - from_month + 1 if from_month is not None and to_month is not None and to_month >= from_month else
+        None
+        for from_month, to_month, duration in zip(from_months, to_months, durations)
+    ]
+
+
+def month_columns(from_dates, to_dates, durations=None, today=None):
+    """from_month, to_month and months columns for columns of date and duration strings"""
+    from_months = parse_months(from_dates, today=today)
+    to_months = parse_months(to_dates, end=True, today=today)
+    return {
+        "from_month": from_months,
+        "to_month": to_months,
+        "months": total_months(from_months, to_months, parse_durations(durations) if durations is not None else None)
+    }
@@ -0,0 +1,267 @@
+# Streaming exporters. Each one consumes a profile iterator (for example a
+# checkpoint.ProfileJournal) and writes it out row by row, so memory use does
+# not grow with the number of profiles.
+import csv
+import gzip
+import io
+import itertools
+import os
+import textwrap
+from datetime import date
+
+import date_parsing
+import profile_codec
+
+
+CSV_HEADER = [
+    "URL", "Name", "Headline", "Location",
+    "Position Title", "Company", "Work From", "Work To", "Duration", "Work Location",
+    "Education Institution", "Degree", "Edu From", "Edu To"
+]
+
+# File name suffix for each supported compression
+COMPRESSION_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+
+# Parquet export: one file per table, experience and education rows point to
+# their profile through profile_id and keep their position on it as item
+PARQUET_TABLES = {
+    "profiles": ["url", "name", "headline", "location", "error", "error_kind"],
+    "experiences": ["position_title", "company", "from_date", "to_date", "duration", "location"],
+    "educations": ["institution", "degree", "from_date", "to_date"]
+}
+# Integer columns derived from the date strings by date_parsing.month_columns
+PARQUET_MONTH_COLUMNS = ["from_month", "to_month", "months"]
+PARQUET_BATCH_SIZE = 10_000
+
+
+def non_empty(profiles):
+    """Return the profiles as an iterator, or None if there are none"""
+    profiles = iter(profiles)
+    first = next(profiles, None)
+    if first is None:
+        return None
+    return itertools.chain([first], profiles)
+
+
+def compressed_name(filename, compression=None):
+    """Add the compression suffix to a file name"""
+    if not compression:
+        return filename
+    if compression not in COMPRESSION_SUFFIXES:
+        raise ValueError(f"Unknown compression '{compression}', use one of {sorted(COMPRESSION_SUFFIXES)}")
+    return filename + COMPRESSION_SUFFIXES[compression]
+
+
+def open_output(filename, binary=False):
+    """Open a file for writing, compressing it when it ends in .gz or .zst"""
+    if filename.endswith(".gz"):
+        raw = gzip.open(filename, "wb")
+    elif filename.endswith(".zst"):
+        try:
+            import zstandard
+        except ImportError:
+            raise RuntimeError("zstd compression needs the 'zstandard' package: pip install zstandard")
+        raw = zstandard.ZstdCompressor().stream_writer(open(filename, "wb"))
+    else:
+        raw = open(filename, "wb")
+
+    if binary:
+        return raw
+    return io.TextIOWrapper(raw, encoding="utf-8", newline="")
+
+
+def profile_rows(profile):
+    """Yield the CSV rows of one profile - one row per experience/education pair"""
+    url = profile.get("url", "")
+    name = profile.get("name", "")
+    headline = profile.get("headline", "")
+    location = profile.get("location", "")
+
+    experiences = profile.get("experiences", [])
+    educations = profile.get("educations", [])
+
+    # If no experience or education, still write one row with basic info
+    if not experiences and not educations:
+        yield [
+            url, name, headline, location,
+            "", "", "", "", "", "",
+            "", "", "", ""
+        ]
+        return
+
+    for i in range(max(len(experiences), len(educations))):
+        exp = experiences[i] if i < len(experiences) else {}
+        edu = educations[i] if i < len(educations) else {}
+        yield [
+            url, name, headline, location,
+            exp.get("position_title", ""), exp.get("company", ""),
+            exp.get("from_date", ""), exp.get("to_date", ""),
+            exp.get("duration", ""), exp.get("location", ""),
+            edu.get("institution", ""), edu.get("degree", ""),
+            edu.get("from_date", ""), edu.get("to_date", "")
+        ]
+
+
+def write_csv(profiles, f):
+    """Write profiles as CSV rows to an open text file; returns the profile count"""
+    writer = csv.writer(f)
+    writer.writerow(CSV_HEADER)
+    count = 0
+    for profile in profiles:
+        writer.writerows(profile_rows(profile))
+        count += 1
+    return count
+
+
+def write_json(profiles, f):
+    """Write profiles as a JSON array to an open text file; returns the profile count.
+
+    The layout matches json.dump(..., indent=2) but the document is written
+    one profile at a time.
+    """
+    f.write("[")
+    count = 0
+    for profile in profiles:
+        f.write(",\n" if count else "\n")
+        f.write(textwrap.indent(profile_codec.encode_pretty(profile), "  "))
+        count += 1
+    f.write("\n]" if count else "]")
+    return count
+
+
+def write_xlsx(profiles, f):
+    """Write profiles to an Excel sheet in write-only mode; returns the profile count.
+
+    ``f`` may be a file name or a binary file object.
+    """
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Profiles")
+    sheet.append(CSV_HEADER)
+    count = 0
+    for profile in profiles:
+        for row in profile_rows(profile):
+            sheet.append(row)
+        count += 1
+    workbook.save(f)
+    return count
+
+
+def parquet_keys(name):
+    """Integer key columns of a Parquet table"""
+    return ["profile_id"] if name == "profiles" else ["profile_id", "item"]
+
+
+def parquet_month_columns(name):
+    """Month columns of a Parquet table; entry tables have them"""
+    return [] if name == "profiles" else PARQUET_MONTH_COLUMNS
+
+
+def parquet_schemas():
+    """Arrow schema of each Parquet table"""
+    import pyarrow as pa
+
+    return {
+        name: pa.schema(
+            [(key, pa.int32()) for key in parquet_keys(name)] + [(column, pa.string()) for column in columns] +
+            [(column, pa.int32()) for column in parquet_month_columns(name)]
+        )
+        for name, columns in PARQUET_TABLES.items()
+    }
+
+
+def parquet_batches(profiles, batch_size=PARQUET_BATCH_SIZE):
+    """Yield (table name, column dict) for every batch_size profiles.
+
+    Dates are parsed a whole batch at a time, so each distinct date string
+    of the batch is parsed once.
+    """
+    today = date.today()
+
+    def with_months(tables):
+        for name, columns in tables.items():
+            if parquet_month_columns(name):
+                columns.update(date_parsing.month_columns(
+                    columns["from_date"], columns["to_date"], columns.get("duration"), today=today
+                ))
+        return tables.items()
+
+    def empty():
+        return {
+            name: {column: [] for column in parquet_keys(name) + columns}
+            for name, columns in PARQUET_TABLES.items()
+        }
+
+    tables = empty()
+    count = 0
+    for profile_id, profile in enumerate(profiles):
+        row = tables["profiles"]
+        row["profile_id"].append(profile_id)
+        for column in PARQUET_TABLES["profiles"]:
+            row[column].append(profile.get(column) or None)
+        for name in ("experiences", "educations"):
+            rows = tables[name]
+            for item, entry in enumerate(profile.get(name) or []):
+                rows["profile_id"].append(profile_id)
+                rows["item"].append(item)
+                for column in PARQUET_TABLES[name]:
+                    rows[column].append(entry.get(column) or None)
+        count += 1
+        if count % batch_size == 0:
+            yield from with_months(tables)
+            tables = empty()
+    if count % batch_size:
+        yield from with_months(tables)
+
+
+def write_parquet(profiles, sinks, compression="snappy"):
+    """Write profiles as the Parquet tables; returns the profile count.
+
+    ``sinks`` maps each table name in PARQUET_TABLES to a file name or a
+    binary file object. Profiles are written PARQUET_BATCH_SIZE at a time.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schemas = parquet_schemas()
+    writers = {name: pq.ParquetWriter(sinks[name], schema, compression=compression)
+               for name, schema in schemas.items()}
+    count = 0
+    try:
+        for name, columns in parquet_batches(profiles):
+            writers[name].write_batch(pa.RecordBatch.from_pydict(columns, schema=schemas[name]))
+            if name == "profiles":
+                count += len(columns["profile_id"])
+    finally:
+        for writer in writers.values():
+            writer.close()
+    return count
+
+
+def export_csv(profiles, filename):
+    with open_output(filename) as f:
+        return write_csv(profiles, f)
+
+
+def export_json(profiles, filename):
+    with open_output(filename) as f:
+        return write_json(profiles, f)
+
+
+def export_parquet(profiles, directory, compression=None):
+    """Write profiles/experiences/educations .parquet files into directory.
+
+    Experience and education rows carry from_month/to_month (months since
+    year 0, see date_parsing) and months, the entry's length.
+
+    ``compression`` is a Parquet codec (gzip, zstd, ...); snappy by default.
+    """
+    os.makedirs(directory, exist_ok=True)
+    sinks = {name: os.path.join(directory, f"{name}.parquet") for name in PARQUET_TABLES}
+    return write_parquet(profiles, sinks, compression or "snappy")
+
+
+def export_xlsx(profiles, filename):
+    # .xlsx is already a zip archive, so it is never compressed again
+    return write_xlsx(profiles, filename)
@@ -0,0 +1,311 @@
+# Local stand-in for the LinkedIn pages the scraper visits. Pages use the
+# same markup the extractors rely on, with configurable response latency and
+# a lazy-load delay before the detail lists are rendered. Every profile is
+# generated deterministically from its id, and expected_profile() returns the
+# dict the scraper should produce for it.
+#
+#   python fake_linkedin.py --port 8765 --latency 0.2 --lazy-delay 0.8
+import argparse
+import html
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+
+SESSION_COOKIE = "li_at=fake-session"
+
+FIRST_NAMES = ["Ada", "Grace", "Alan", "Edsger", "Barbara", "Donald", "Frances", "Ken", "Radia", "Linus"]
+LAST_NAMES = ["Lovelace", "Hopper", "Turing", "Dijkstra", "Liskov", "Knuth", "Allen", "Thompson", "Perlman"]
+TITLES = ["Software Engineer", "Data Scientist", "Engineering Manager", "Product Manager", "Researcher"]
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella", "Hooli", "Stark Industries", "Wayne Enterprises"]
+LOCATIONS = ["Berlin, Germany", "London, United Kingdom", "San Francisco, CA", "Bengaluru, India", "Toronto, Canada"]
+SCHOOLS = ["MIT", "Stanford University", "IIT Bombay", "ETH Zurich", "University of Toronto"]
+DEGREES = ["Bachelor of Science", "Master of Science", "PhD", "Bachelor of Engineering"]
+MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+# Items each section of the main profile page shows before "Show all N"
+MAIN_PAGE_ITEMS = 4
+# Detail pages render this many items, and the next batch on scrolling down
+DETAIL_PAGE_SIZE = 3
+
+# One small binary asset so resource blocking has something to block
+PIXEL_PNG = (
+    b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x06\x00\x00\x00\x1f\x15\xc4\x89"
+    b"\x00\x00\x00\rIDATx\x9cc\xf8\x0f\x00\x00\x01\x01\x00\x05\x18\xd8N\x00\x00\x00\x00IEND\xaeB`\x82"
+)
+
+
+def generate_profile(profile_id):
+    """Raw data of a fake profile, stable for a given id"""
+    rng = random.Random(profile_id)
+    experiences = []
+    year = 2024
+    for _ in range(rng.randint(1, 8)):
+        start_year = year - rng.randint(1, 4)
+        # Some positions only show years, as LinkedIn does when no month was entered
+        year_only = rng.random() < 0.25
+        start = f"{start_year}" if year_only else f"{rng.choice(MONTHS)} {start_year}"
+        end = "Present" if not experiences else f"{year}" if year_only else f"{rng.choice(MONTHS)} {year}"
+        years = year - start_year
+        experiences.append({
+            "title": rng.choice(TITLES),
+            "company": rng.choice(COMPANIES),
+            "dates": f"{start} - {end} · {years} yrs {rng.randint(1, 11)} mos",
+            "location": rng.choice(LOCATIONS)
+        })
+        year = start_year
+
+    educations = []
+    for _ in range(rng.randint(1, 3)):
+        end_year = rng.randint(2000, 2020)
+        educations.append({
+            "school": rng.choice(SCHOOLS),
+            "degree": rng.choice(DEGREES),
+            "dates": f"{end_year - 4} - {end_year}"
+        })
+
+    return {
+        "name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+        "headline": f"{rng.choice(TITLES)} at {rng.choice(COMPANIES)}",
+        "location": rng.choice(LOCATIONS),
+        "experiences": experiences,
+        "educations": educations
+    }
+
+
+def expected_profile(profile_id, url, item_cap=5):
+    """The profile dict LinkedInScraper should produce for this fake profile"""
+    profile = generate_profile(profile_id)
+    experiences = []
+    for exp in profile["experiences"][:item_cap]:
+        times, duration = exp["dates"].split(" · ")
+        start, end = times.split(" - ")
+        experiences.append({
+            "position_title": exp["title"],
+            "company": exp["company"],
+            "from_date": start,
+            "to_date": end,
+            "duration": duration,
+            "location": exp["location"]
+        })
+    educations = []
+    for edu in profile["educations"][:item_cap]:
+        start, end = edu["dates"].split(" - ")
+        educations.append({
+            "institution": edu["school"],
+            "degree": edu["degree"],
+            "from_date": start,
+            "to_date": end
+        })
+    return {
+        "url": url,
+        "name": profile["name"],
+        "headline": profile["headline"],
+        "location": profile["location"],
+        "experiences": experiences,
+        "educations": educations
+    }
+
+
+def summary_rows(profile):
+    """Summary row texts of each experience and education item, as the pages show them"""
+    experience_rows = [
+        [exp["title"], exp["company"], exp["dates"], exp["location"]] for exp in profile["experiences"]
+    ]
+    education_rows = [[edu["school"], edu["degree"], edu["dates"]] for edu in profile["educations"]]
+    return experience_rows, education_rows
+
+
+def page(title, body):
+    return (
+        "<!DOCTYPE html><html><head><meta charset='utf-8'><title>" + html.escape(title) + "</title></head>"
+        "<body>" + body + "</body></html>"
+    )
+
+
+def list_item(rows, css_class="pvs-list__paged-list-item artdeco-list__item"):
+    """One list item with the nesting the parsers walk"""
+    spans = "".join(f"<div><span aria-hidden='true'>{html.escape(row)}</span></div>" for row in rows)
+    return (
+        f"<li class='{css_class}'>"
+        "<div data-view-name='profile-component-entity' class='display-flex'>"
+        "<div><img alt='' width='48' height='48' src='/static/logo.png'></div>"
+        "<div class='display-flex flex-column full-width'>"
+        f"<div class='display-flex'><div class='display-flex flex-column'>{spans}</div></div>"
+        "</div></div></li>"
+    )
+
+
+def profile_section(anchor, title, rows, detail_url):
+    """A main-page section showing the first items, linking to its detail page if there are more"""
+    items = "".join(list_item(row, "artdeco-list__item") for row in rows[:MAIN_PAGE_ITEMS])
+    footer = ""
+    if len(rows) > MAIN_PAGE_ITEMS:
+        footer = (
+            f"<div class='pvs-list__footer-wrapper'><a id='navigation-index-see-all-{anchor}s' "
+            f"href='{detail_url}'>Show all {len(rows)} {anchor}s</a></div>"
+        )
+    return (
+        f"<section class='artdeco-card pv-profile-card'><div id='{anchor}' class='pv-profile-card__anchor'></div>"
+        f"<h2>{title}</h2><div><ul>{items}</ul></div>{footer}</section>"
+    )
+
+
+def lazy_list(items, lazy_delay):
+    """A detail list inserted by script after lazy_delay seconds, like LinkedIn's lazy rendering.
+
+    Only the first DETAIL_PAGE_SIZE items are shown at first; scrolling to
+    the end of the list loads the next batch after another lazy_delay.
+    """
+    markup = "<div class='pvs-list__container'><ul>" + "".join(items) + "</ul></div>"
+    delay = int(lazy_delay * 1000)
+    return (
+        "<main id='main'><h2>Details</h2><div id='list-slot'></div>"
+        "<div style='height: 2000px'></div>"
+        f"<template id='list'>{markup}</template>"
+        "<script>setTimeout(function () {"
+        "  var slot = document.getElementById('list-slot');"
+        "  slot.appendChild(document.getElementById('list').content.cloneNode(true));"
+        "  var list = slot.querySelector('ul');"
+        f"  var rest = Array.prototype.slice.call(list.children, {DETAIL_PAGE_SIZE});"
+        "  rest.forEach(function (li) { list.removeChild(li); });"
+        "  var loading = false;"
+        "  window.addEventListener('scroll', function () {"
+        "    if (loading || !rest.length || list.getBoundingClientRect().bottom > window.innerHeight + 200) { return; }"
+        "    loading = true;"
+        "    setTimeout(function () {"
+        f"      rest.splice(0, {DETAIL_PAGE_SIZE}).forEach(function (li) {{ list.appendChild(li); }});"
+        "      loading = false;"
+        f"    }}, {delay});"
+        "  });"
+        f"}}, {delay});</script>"
+        "</main>"
+    )
+
+
+class FakeLinkedInHandler(BaseHTTPRequestHandler):
+    server_version = "FakeLinkedIn/1.0"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body=b"", content_type="text/html; charset=utf-8", headers=None):
+        time.sleep(self.server.latency)
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _redirect(self, location, headers=None):
+        self._send(302, headers=dict(headers or {}, Location=location))
+
+    def _signed_in(self):
+        return SESSION_COOKIE in (self.headers.get("Cookie") or "")
+
+    def do_POST(self):
+        path = urlparse(self.path).path
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if path.rstrip("/") == "/login":
+            self._redirect("/feed/", {"Set-Cookie": SESSION_COOKIE + "; Path=/"})
+        else:
+            self._send(404, page("Not found", "<h1>Not found</h1>"))
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        parts = [part for part in path.split("/") if part]
+
+        if path.startswith("/static/"):
+            self._send(200, PIXEL_PNG, "image/png")
+        elif parts == ["login"]:
+            self._send(200, page("Login", (
+                "<form method='post' action='/login'>"
+                "<input id='username' name='session_key'>"
+                "<input id='password' name='session_password' type='password'>"
+                "<button type='submit'>Sign in</button></form>"
+            )))
+        elif not self._signed_in():
+            self._redirect("/login?session_redirect=%2Ffeed%2F")
+        elif parts in (["feed"], []):
+            self._send(200, page("Feed", "<main><h1>Feed</h1></main>"))
+        elif len(parts) >= 2 and parts[0] == "in":
+            self._profile_page(parts[1], parts[2:])
+        else:
+            self._send(404, page("Not found", "<h1>Not found</h1>"))
+
+    def _profile_page(self, profile_id, rest):
+        profile = generate_profile(profile_id)
+        lazy_delay = self.server.lazy_delay
+
+        experience_rows, education_rows = summary_rows(profile)
+
+        if rest == ["details", "experience"]:
+            items = [list_item(row) for row in experience_rows]
+            self._send(200, page("Experience", lazy_list(items, lazy_delay)))
+        elif rest == ["details", "education"]:
+            items = [list_item(row) for row in education_rows]
+            self._send(200, page("Education", lazy_list(items, lazy_delay)))
+        elif not rest:
+            profile_url = f"/in/{profile_id}"
+            self._send(200, page(profile["name"], (
+                "<main><section class='pv-top-card'>"
+                "<img alt='' width='800' height='200' src='/static/banner.png'>"
+                f"<h1>{html.escape(profile['name'])}</h1>"
+                f"<div class='text-body-medium break-words'>{html.escape(profile['headline'])}</div>"
+                f"<span class='text-body-small inline t-black--light break-words'>"
+                f"{html.escape(profile['location'])}</span>"
+                "</section>"
+                + profile_section("experience", "Experience", experience_rows, profile_url + "/details/experience/")
+                + profile_section("education", "Education", education_rows, profile_url + "/details/education/")
+                + "</main>"
+            )))
+        else:
+            self._send(404, page("Not found", "<h1>Not found</h1>"))
+
+
+class FakeLinkedInServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address=("127.0.0.1", 0), latency=0.0, lazy_delay=0.0):
+        super().__init__(address, FakeLinkedInHandler)
+        self.latency = latency
+        self.lazy_delay = lazy_delay
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Serve from a background thread"""
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return self
+
+    def profile_url(self, profile_id):
+        return f"{self.base_url}/in/{profile_id}/"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local LinkedIn stand-in server")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--lazy-delay", type=float, default=0.0, help="seconds before detail lists render")
+    args = parser.parse_args()
+
+    server = FakeLinkedInServer(("127.0.0.1", args.port), args.latency, args.lazy_delay)
+    print(f"→ Serving fake LinkedIn on {server.base_url} (login with any credentials)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# Pure-Python field parsers shared by every extraction mode. They take the
+# first-span text of each summary row of a list item and build the profile dicts.
+
+
+def new_profile_data(url):
+    """Empty profile dict, filled in by the scrapers"""
+    return {
+        "url": url,
+        "name": None,
+        "headline": None,
+        "location": None,
+        "experiences": [],
+        "educations": []
+    }
+
+
+# Items kept per experience/education section; None keeps them all
+DEFAULT_ITEM_CAP = 5
+
+
+def parse_item_cap(value):
+    """Read an item cap setting, where 0 or "all" means no cap"""
+    value = str(value).strip().lower()
+    if value in ("", "0", "all", "none"):
+        return None
+    return max(1, int(value))
+
+
+def needs_detail_page(item_count, show_all, limit):
+    """Whether a main-page section is cut short of what the detail page would give.
+
+    That is when the section links to its detail page ("Show all N") and
+    shows fewer than ``limit`` items itself (any number, with no limit).
+    """
+    return show_all and (limit is None or item_count < limit)
+
+
+def split_date_range(times):
+    """Start and end of a range such as "Jan 2020 - Present" or "2016 - 2020".
+
+    A single date is a start without an end; a missing part is "".
+    """
+    start, _, end = times.partition("-")
+    return start.strip(), end.strip()
+
+
+def parse_experience_fields(spans):
+    """Build an experience dict from the span texts of an item's summary rows"""
+    if spans is None:
+        return None
+    spans = [text or "" for text in spans]
+    
+    # Extract basic info
+    position_title = ""
+    company = ""
+    work_times = ""
+    location = ""
+    
+    if len(spans) >= 2:
+        position_title = spans[0]
+        company = spans[1]
+        if len(spans) >= 3:
+            work_times = spans[2]
+        if len(spans) >= 4:
+            location = spans[3]
+    
+    # Parse dates
+    from_date = ""
+    to_date = ""
+    duration = None
+    
+    if work_times and "·" in work_times:
+        parts = work_times.split("·")
+        from_date, to_date = split_date_range(parts[0])
+        duration = parts[1].strip() if len(parts) > 1 else None
+    
+    return {
+        "position_title": position_title or "N/A",
+        "company": company or "N/A",
+        "from_date": from_date,
+        "to_date": to_date,
+        "duration": duration,
+        "location": location
+    }
+
+
+def parse_education_fields(spans):
+    """Build an education dict from the span texts of an item's summary rows"""
+    if spans is None:
+        return None
+    spans = [text or "" for text in spans]
+    
+    institution_name = ""
+    degree = ""
+    from_date = ""
+    to_date = ""
+    
+    if spans:
+        institution_name = spans[0]
+        
+        if len(spans) > 1:
+            degree = spans[1]
+        
+        if len(spans) > 2:
+            times = spans[2]
+            if times and "-" in times:
+                from_date, to_date = split_date_range(times)
+    
+    return {
+        "institution": institution_name or "N/A",
+        "degree": degree or "N/A",
+        "from_date": from_date,
+        "to_date": to_date
+    }
@@ -0,0 +1,226 @@
+# Off-browser extraction from saved page HTML. The functions here only use
+# the standard library, so they can run in a ProcessPoolExecutor while the
+# browser moves on to the next URL. They mirror the lookups made by
+# Scrapper.LinkedInScraper and js_extraction.
+from html.parser import HTMLParser
+
+from object import Profile
+
+from field_parsing import (
+    new_profile_data, parse_experience_fields, parse_education_fields, needs_detail_page, DEFAULT_ITEM_CAP
+)
+
+
+VOID_TAGS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "param", "source", "track", "wbr"
+}
+# Elements whose content is never rendered as text
+SKIP_TEXT_TAGS = {"script", "style", "template", "noscript", "head", "title"}
+
+
+class Node:
+    __slots__ = ("tag", "attrs", "children", "parent")
+
+    def __init__(self, tag, attrs=None, parent=None):
+        self.tag = tag
+        self.attrs = attrs or {}
+        self.children = []
+        self.parent = parent
+
+    @property
+    def element_children(self):
+        return [child for child in self.children if isinstance(child, Node)]
+
+    @property
+    def class_attr(self):
+        return self.attrs.get("class") or ""
+
+    def has_class(self, name):
+        return name in self.class_attr.split()
+
+    def closest(self, tag):
+        """The nearest ancestor with this tag, like Element.closest"""
+        node = self.parent
+        while node is not None and node.tag != tag:
+            node = node.parent
+        return node
+
+    def iter(self):
+        """Yield all descendant elements in document order"""
+        stack = list(reversed(self.element_children))
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.element_children))
+
+    def find(self, predicate):
+        return next((node for node in self.iter() if predicate(node)), None)
+
+    def find_all(self, predicate):
+        return [node for node in self.iter() if predicate(node)]
+
+    def is_hidden(self):
+        style = self.attrs.get("style", "").replace(" ", "").lower()
+        return "hidden" in self.attrs or "display:none" in style or "visibility:hidden" in style
+
+    def text(self):
+        """Whitespace-normalized text, like WebElement.text"""
+        if self.is_hidden():
+            return ""
+        parts = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, str):
+                parts.append(node)
+            elif node.tag not in SKIP_TEXT_TAGS and not node.is_hidden():
+                stack.extend(reversed(node.children))
+        return " ".join("".join(parts).split())
+
+
+class TreeBuilder(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = Node("#document")
+        self.current = self.root
+
+    def handle_starttag(self, tag, attrs):
+        node = Node(tag, {name: value or "" for name, value in attrs}, self.current)
+        self.current.children.append(node)
+        if tag not in VOID_TAGS:
+            self.current = node
+
+    def handle_startendtag(self, tag, attrs):
+        node = Node(tag, {name: value or "" for name, value in attrs}, self.current)
+        self.current.children.append(node)
+
+    def handle_endtag(self, tag):
+        # Close the nearest open element with this tag; ignore stray end tags
+        node = self.current
+        while node is not self.root and node.tag != tag:
+            node = node.parent
+        if node is not self.root:
+            self.current = node.parent
+
+    def handle_data(self, data):
+        self.current.children.append(data)
+
+
+def parse_html(html):
+    """Parse an HTML document into a Node tree"""
+    builder = TreeBuilder()
+    builder.feed(html or "")
+    builder.close()
+    return builder.root
+
+
+def parse_top_card(root):
+    """Get name, headline and location from a parsed profile page"""
+    h1 = root.find(lambda n: n.tag == "h1")
+    headline = root.find(lambda n: n.tag == "div" and "text-body-medium" in n.class_attr)
+    location = root.find(
+        lambda n: n.tag == "span" and "text-body-small" in n.class_attr and "inline" in n.class_attr
+    )
+    return {
+        "name": h1.text() if h1 else "N/A",
+        "headline": headline.text() if headline else "N/A",
+        "location": location.text() if location else "N/A"
+    }
+
+
+def item_spans(item, max_spans):
+    """Get the first span text of each summary row of a list item"""
+    entity = item.find(
+        lambda n: n.tag == "div" and n.attrs.get("data-view-name") == "profile-component-entity"
+    )
+    if entity is None:
+        return None
+    elements = entity.element_children
+    if len(elements) < 2:
+        return None
+    details = elements[1].element_children
+    if not details or not details[0].element_children:
+        return None
+
+    spans = []
+    for row in details[0].element_children[0].element_children[:max_spans]:
+        span = row.find(lambda n: n.tag == "span")
+        spans.append(span.text() if span else None)
+    return spans
+
+
+def parse_list_items(root, parse_fields, max_spans, limit=DEFAULT_ITEM_CAP):
+    """Parse the first ``limit`` list items of a parsed detail page (all with None)"""
+    main = root.find(lambda n: n.tag == "main")
+    if main is None:
+        return []
+    container = main.find(lambda n: n.has_class("pvs-list__container"))
+    if container is None:
+        return []
+
+    parsed = []
+    for item in container.find_all(lambda n: n.has_class("pvs-list__paged-list-item"))[:limit]:
+        fields = parse_fields(item_spans(item, max_spans))
+        if fields:
+            parsed.append(fields)
+    return parsed
+
+
+def parse_profile_section(root, anchor, parse_fields, max_spans, limit=DEFAULT_ITEM_CAP):
+    """Parse a section of a parsed main profile page.
+
+    Returns None when the section is missing or cut short, i.e. when its
+    detail page has to be parsed instead.
+    """
+    anchor_node = root.find(lambda n: n.attrs.get("id") == anchor)
+    section = anchor_node.closest("section") if anchor_node else None
+    if section is None:
+        return None
+    items = section.find_all(lambda n: n.tag == "li" and n.closest("li") is None)
+    show_all = section.find(
+        lambda n: n.tag == "a" and f"/details/{anchor}" in n.attrs.get("href", "")
+    ) is not None
+    if needs_detail_page(len(items), show_all, limit):
+        return None
+
+    parsed = []
+    for item in items[:limit]:
+        fields = parse_fields(item_spans(item, max_spans))
+        if fields:
+            parsed.append(fields)
+    return parsed
+
+
+def parse_profile_pages(url, pages, item_cap=DEFAULT_ITEM_CAP):
+    """Build a profile dict from the HTML of its profile and detail pages.
+
+    ``pages`` maps "profile", "experience" and "education" to page source.
+    Without a detail page its section is read from the profile page, and
+    is empty if that has none either. Each section keeps ``item_cap`` items.
+    """
+    profile_data = new_profile_data(url)
+
+    try:
+        profile = parse_html(pages.get("profile"))
+        profile_data.update(parse_top_card(profile))
+        if pages.get("experience") is not None:
+            profile_data["experiences"] = parse_list_items(
+                parse_html(pages["experience"]), parse_experience_fields, max_spans=4, limit=item_cap
+            )
+        else:
+            profile_data["experiences"] = parse_profile_section(
+                profile, "experience", parse_experience_fields, max_spans=4, limit=item_cap
+            ) or []
+        if pages.get("education") is not None:
+            profile_data["educations"] = parse_list_items(
+                parse_html(pages["education"]), parse_education_fields, max_spans=3, limit=item_cap
+            )
+        else:
+            profile_data["educations"] = parse_profile_section(
+                profile, "education", parse_education_fields, max_spans=3, limit=item_cap
+            ) or []
+    except Exception as e:
+        profile_data["error"] = str(e)
+
+    return Profile.from_dict(profile_data)
@@ -0,0 +1,127 @@
+# In-browser extraction scripts. Each one walks the DOM in a single
+# execute_script round trip and mirrors the WebDriver lookups in
+# Scrapper.LinkedInScraper, so the Python field parsers give identical dicts.
+
+# Resolves once the document has loaded, every selector in arguments[0] is
+# present and the DOM has not changed for arguments[2] ms, or after
+# arguments[1] ms at the latest.
+PAGE_READY_SCRIPT = """
+var selectors = arguments[0], timeout = arguments[1], quiet = arguments[2];
+var done = arguments[arguments.length - 1];
+var start = Date.now(), lastChange = Date.now();
+var observer = new MutationObserver(function () { lastChange = Date.now(); });
+observer.observe(document.documentElement, {childList: true, subtree: true, characterData: true});
+(function check() {
+    var now = Date.now();
+    var ready = document.readyState === 'complete' &&
+        selectors.every(function (s) { return document.querySelector(s) !== null; }) &&
+        now - lastChange >= quiet;
+    if (ready || now - start >= timeout) {
+        observer.disconnect();
+        done(ready);
+    } else {
+        setTimeout(check, 50);
+    }
+})();
+"""
+
+# Scrolls a paginated detail list until its item count stops growing.
+# arguments[0]: CSS selector of the list container, arguments[1]: item cap
+# (null for no cap), arguments[2]: timeout in ms, arguments[3]: ms without
+# new items after which the list counts as complete.
+# Clicks "Show more results" when LinkedIn paginates with a button instead
+# of infinite scroll. Resolves with the number of items loaded.
+LOAD_LIST_ITEMS_SCRIPT = """
+var selector = arguments[0], cap = arguments[1], timeout = arguments[2], stable = arguments[3];
+var done = arguments[arguments.length - 1];
+var start = Date.now(), lastGrowth = Date.now(), lastCount = -1;
+function count() {
+    var container = document.querySelector(selector);
+    return container ? container.querySelectorAll('.pvs-list__paged-list-item').length : 0;
+}
+(function step() {
+    var n = count(), now = Date.now();
+    if (n !== lastCount) { lastCount = n; lastGrowth = now; }
+    if ((cap !== null && n >= cap) || now - lastGrowth >= stable || now - start >= timeout) {
+        done(n);
+        return;
+    }
+    window.scrollTo(0, document.body.scrollHeight);
+    var more = document.querySelector('button.scaffold-finite-scroll__load-button');
+    if (more && !more.disabled) { more.click(); }
+    setTimeout(step, 100);
+})();
+"""
+
+# Mirrors WebElement.text: the text of a rendered element, "" when hidden.
+_VISIBLE_TEXT = """
+function visibleText(el) {
+    if (!el) { return null; }
+    var style = window.getComputedStyle(el);
+    if (el.getClientRects().length === 0 || style.visibility === 'hidden') { return ''; }
+    return el.innerText.replace(/\\u00a0/g, ' ').trim();
+}
+function firstByXPath(xpath) {
+    return document.evaluate(
+        xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+    ).singleNodeValue;
+}
+"""
+
+# Returns {name, headline, location}; null marks an element that was not found.
+TOP_CARD_SCRIPT = _VISIBLE_TEXT + """
+return {
+    name: visibleText(document.querySelector('h1')),
+    headline: visibleText(firstByXPath("//div[contains(@class, 'text-body-medium')]")),
+    location: visibleText(firstByXPath(
+        "//span[contains(@class, 'text-body-small') and contains(@class, 'inline')]"
+    ))
+};
+"""
+
+# null when the item has no parsable summary, otherwise the first-span text
+# of each summary row (null if the row has no span).
+_ITEM_SPANS = """
+function itemSpans(item, maxSpans) {
+    var entity = item.querySelector("div[data-view-name='profile-component-entity']");
+    if (!entity || entity.children.length < 2) { return null; }
+    var details = entity.children[1].children;
+    if (details.length === 0 || !details[0].firstElementChild) { return null; }
+    var rows = Array.prototype.slice.call(details[0].firstElementChild.children, 0, maxSpans);
+    return rows.map(function (row) { return visibleText(row.querySelector('span')); });
+}
+"""
+
+# arguments[0]: CSS selector of the list container, arguments[1]: max items
+# (null for all), arguments[2]: max span texts per item.
+# Returns itemSpans() of each list item.
+LIST_ITEMS_SCRIPT = _VISIBLE_TEXT + _ITEM_SPANS + """
+var container = document.querySelector(arguments[0]);
+if (!container) { return []; }
+var items = Array.prototype.slice.call(
+    container.querySelectorAll('.pvs-list__paged-list-item'), 0, arguments[1] === null ? undefined : arguments[1]
+);
+var maxSpans = arguments[2];
+return items.map(function (item) { return itemSpans(item, maxSpans); });
+"""
+
+# A section of the main profile page, found by its anchor id.
+# arguments[0]: anchor id ("experience"/"education"), arguments[1]: max
+# items (null for all), arguments[2]: max span texts per item.
+# Returns null when the section is not on the page, otherwise
+# {count: number of top-level items, showAll: whether it links to its
+# detail page, items: itemSpans() of the first max items}.
+PROFILE_SECTION_SCRIPT = _VISIBLE_TEXT + _ITEM_SPANS + """
+var anchor = document.getElementById(arguments[0]);
+var section = anchor && anchor.closest('section');
+if (!section) { return null; }
+var maxSpans = arguments[2];
+var items = Array.prototype.filter.call(section.querySelectorAll('li'), function (li) {
+    return li.parentElement.closest('li') === null;
+});
+return {
+    count: items.length,
+    showAll: section.querySelector("a[href*='/details/" + arguments[0] + "']") !== null,
+    items: items.slice(0, arguments[1] === null ? undefined : arguments[1]).map(function (item) { return itemSpans(item, maxSpans); })
+};
+"""
@@ -0,0 +1,485 @@
+# Shared scraping core used by the CLI (Scrapper.py), the Streamlit app and
+# the benchmark. Importing it is cheap: Selenium is only imported once a
+# browser is started or a page is read, so tools that merely display or
+# export results never pay for the browser stack.
+import session_vault
+import js_extraction
+import html_extraction
+import resource_blocking
+import exporters
+from object import Scraper, Profile
+from scrape_metrics import NO_TIMER
+from scrape_errors import Deadline, check_landing, raise_if_classified, DEFAULT_PROFILE_BUDGET
+from field_parsing import (
+    new_profile_data, parse_experience_fields, parse_education_fields, needs_detail_page,
+    DEFAULT_ITEM_CAP
+)
+
+
+class LinkedInScraper(Scraper):
+    BASE_URL = "https://www.linkedin.com"
+
+    def __init__(self, driver, extraction="webdriver", base_url=None, profile_budget=DEFAULT_PROFILE_BUDGET,
+                 item_cap=DEFAULT_ITEM_CAP, blocked_urls=None):
+        super().__init__(driver)
+        self.base_url = (base_url or self.BASE_URL).rstrip("/")
+        # "webdriver": element-by-element lookups, "js": one script per page,
+        # "html": page source parsed off-browser
+        self.extraction = extraction
+        self.profile_budget = profile_budget
+        # create_driver gives the browsers it starts this page-load timeout
+        self.page_load_timeout = profile_budget
+        # Items kept per experience/education section, None for all of them
+        self.item_cap = item_cap
+        # URL patterns blocked in browsers this scraper starts itself
+        self.blocked_urls = blocked_urls
+        self.profiles = []
+        self.resource_stats = None
+
+    def collect_resource_stats(self):
+        """Count the requests blocked since the last call"""
+        if self.resource_stats is not None:
+            self.resource_stats.collect(self.driver)
+
+    def login(self, email, password):
+        """Login to LinkedIn"""
+        with NO_TIMER if self.metrics is None else self.metrics.timer("login_seconds"):
+            return self._login(email, password)
+
+    def _login(self, email, password):
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common.exceptions import TimeoutException
+        
+        self.load_page(f"{self.base_url}/login", ["#username"], timeout=3)
+        
+        try:
+            with self.phase("wait"):
+                username_field = WebDriverWait(self.driver, 10).until(
+                    EC.presence_of_element_located((By.ID, "username"))
+                )
+            with self.phase("input"):
+                username_field.send_keys(email)
+                
+                password_field = self.driver.find_element(By.ID, "password")
+                password_field.send_keys(password)
+                
+                submit_button = self.driver.find_element(By.XPATH, "//button[@type='submit']")
+                submit_button.click()
+            
+            print("Logging in...")
+            try:
+                with self.phase("wait"):
+                    WebDriverWait(self.driver, 8).until(lambda d: self.is_signed_in())
+            except TimeoutException:
+                pass
+            
+            if self.is_signed_in():
+                print("✓ LOGIN SUCCESS!")
+                return True
+            else:
+                print("✗ Login failed! Check credentials or 2FA.")
+                return False
+        except Exception as e:
+            print(f"✗ Login error: {e}")
+            return False
+
+    def resume_session(self, session):
+        """Re-use a saved session; returns True if LinkedIn still accepts it"""
+        session_vault.restore_session(session, self.driver, origin=self.base_url)
+        self.load_page(f"{self.base_url}/feed/", timeout=5)
+        return self.is_signed_in()
+
+    def restart_browser(self, session, headless=False):
+        """Replace a crashed browser with a fresh one on the same session"""
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
+        self.driver = create_driver(headless=headless, blocked_urls=self.blocked_urls, page_timeout=self.profile_budget)
+        if self.metrics is not None:
+            self.metrics.instrument_driver(self.driver)
+        session_vault.restore_session(session, self.driver, origin=self.base_url)
+
+    def scrape_profile(self, url):
+        """Scrape a single LinkedIn profile within ``profile_budget`` seconds.
+
+        Timeouts, browser crashes, a lost login and missing profiles are
+        raised as ScrapeError subclasses for the caller's retry policy.
+        """
+        self.deadline = Deadline(self.profile_budget)
+        try:
+            with NO_TIMER if self.metrics is None else self.metrics.timer("profile_seconds"):
+                if self.extraction == "html":
+                    pages = self.capture_profile_pages(url)
+                    with self.phase("parsing"):
+                        profile_data = html_extraction.parse_profile_pages(url, pages, self.item_cap)
+                    print(f"✓ Scraped: {profile_data.name}")
+                    return profile_data
+                return self._scrape_profile(url)
+        finally:
+            self.deadline = None
+
+    def _load_profile_page(self, url):
+        self.load_page(url, ["h1"], timeout=5)
+        check_landing(url, self.driver.current_url)
+
+    def _scrape_profile(self, url):
+        print(f"\n→ Scraping: {url}")
+        self._load_profile_page(url)
+        
+        profile_data = new_profile_data(url)
+        
+        try:
+            # Get name, headline and location
+            with self.phase("extraction"):
+                if self.extraction == "js":
+                    profile_data.update(self._extract_top_card_js())
+                else:
+                    profile_data.update(self._extract_top_card())
+            
+            # Scroll to load more content
+            self.scroll_to_half()
+            self.wait_for_page_ready(timeout=2)
+            self.scroll_to_bottom()
+            self.wait_for_page_ready(timeout=2)
+            
+            # Read both sections off the profile page while it is loaded, and
+            # only visit the detail pages of those that are cut short
+            experiences = self._extract_section("experience", parse_experience_fields, max_spans=4)
+            educations = self._extract_section("education", parse_education_fields, max_spans=3)
+            
+            # Get experiences
+            if experiences is None:
+                experiences = self.get_experiences(url)
+            profile_data["experiences"] = experiences
+            
+            # Get education
+            if educations is None:
+                educations = self.get_educations(url)
+            profile_data["educations"] = educations
+            
+            print(f"✓ Scraped: {profile_data['name']}")
+            return Profile.from_dict(profile_data)
+            
+        except Exception as e:
+            raise_if_classified(e)
+            print(f"✗ Error scraping {url}: {e}")
+            profile_data["error"] = str(e)
+            return Profile.from_dict(profile_data)
+
+    def capture_profile_pages(self, url):
+        """Load the profile and its detail pages and return their HTML"""
+        print(f"\n→ Capturing: {url}")
+        self._load_profile_page(url)
+        
+        # Scroll to load more content
+        self.scroll_to_half()
+        self.wait_for_page_ready(timeout=2)
+        self.scroll_to_bottom()
+        self.wait_for_page_ready(timeout=2)
+        with self.phase("extraction"):
+            pages = {"profile": self.driver.page_source}
+        
+        for section in ("experience", "education"):
+            if not self._section_needs_detail_page(section):
+                continue
+            try:
+                section_url = url.rstrip('/') + "/details/" + section
+                self.load_page(section_url, ["main .pvs-list__container"], timeout=3)
+                self.load_list_items("main .pvs-list__container", self.item_cap)
+                with self.phase("extraction"):
+                    pages[section] = self.driver.page_source
+            except Exception as e:
+                raise_if_classified(e)
+                print(f"  Warning: Could not fetch {section} - {e}")
+        
+        return pages
+
+    def _section_needs_detail_page(self, anchor):
+        """Whether a section of the loaded profile page is missing or cut short"""
+        try:
+            with self.phase("extraction"):
+                section = self.driver.execute_script(js_extraction.PROFILE_SECTION_SCRIPT, anchor, 0, 0)
+        except Exception as e:
+            raise_if_classified(e)
+            return True
+        return section is None or needs_detail_page(section["count"], section["showAll"], self.item_cap)
+
+    def _extract_section(self, anchor, parse_fields, max_spans):
+        """Parse a section of the loaded profile page.
+
+        Returns None when the section is missing or cut short, so its detail
+        page has to be loaded instead.
+        """
+        from selenium.webdriver.common.by import By
+        
+        limit = self.item_cap
+        try:
+            with self.phase("extraction"):
+                if self.extraction == "js":
+                    section = self.driver.execute_script(
+                        js_extraction.PROFILE_SECTION_SCRIPT, anchor, limit, max_spans
+                    )
+                    if section is None or needs_detail_page(section["count"], section["showAll"], limit):
+                        return None
+                    rows = section["items"]
+                else:
+                    card = self.driver.find_elements(By.XPATH, f"//*[@id='{anchor}']/ancestor::section[1]")
+                    if not card:
+                        return None
+                    items = card[0].find_elements(By.XPATH, ".//li[not(ancestor::li)]")
+                    show_all = bool(card[0].find_elements(By.XPATH, f".//a[contains(@href, '/details/{anchor}')]"))
+                    if needs_detail_page(len(items), show_all, limit):
+                        return None
+                    rows = []
+                    for item in items[:limit]:
+                        try:
+                            rows.append(self._item_spans(item, max_spans))
+                        except:
+                            rows.append(None)
+        except Exception as e:
+            raise_if_classified(e)
+            return None
+        with self.phase("parsing"):
+            return [item for item in map(parse_fields, rows) if item]
+
+    def _extract_top_card(self):
+        """Get name, headline and location through WebDriver lookups"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        
+        top_card = {}
+        
+        # Get name
+        try:
+            top_card["name"] = WebDriverWait(self.driver, 10).until(
+                EC.presence_of_element_located((By.TAG_NAME, "h1"))
+            ).text
+        except:
+            top_card["name"] = "N/A"
+        
+        # Get headline
+        try:
+            top_card["headline"] = self.driver.find_element(
+                By.XPATH, 
+                "//div[contains(@class, 'text-body-medium')]"
+            ).text
+        except:
+            top_card["headline"] = "N/A"
+        
+        # Get location
+        try:
+            top_card["location"] = self.driver.find_element(
+                By.XPATH, 
+                "//span[contains(@class, 'text-body-small') and contains(@class, 'inline')]"
+            ).text
+        except:
+            top_card["location"] = "N/A"
+        
+        return top_card
+
+    def _extract_top_card_js(self):
+        """Get name, headline and location in a single script call"""
+        top_card = self.driver.execute_script(js_extraction.TOP_CARD_SCRIPT) or {}
+        return {
+            key: top_card.get(key) if top_card.get(key) is not None else "N/A"
+            for key in ("name", "headline", "location")
+        }
+
+    def get_experiences(self, base_url):
+        """Get experience details"""
+        from selenium.webdriver.common.by import By
+        
+        experiences = []
+        try:
+            exp_url = base_url.rstrip('/') + "/details/experience"
+            self.load_page(exp_url, ["main .pvs-list__container"], timeout=3)
+            self.load_list_items("main .pvs-list__container", self.item_cap)
+            
+            if self.extraction == "js":
+                return self._extract_items_js(parse_experience_fields, max_spans=4)
+            
+            main = self.wait_for_element_to_load(by=By.TAG_NAME, name="main")
+            
+            try:
+                main_list = self.wait_for_element_to_load(name="pvs-list__container", base=main)
+                with self.phase("extraction"):
+                    items = main_list.find_elements(By.CLASS_NAME, "pvs-list__paged-list-item")
+                
+                for item in items[:self.item_cap]:
+                    try:
+                        exp_data = self._parse_experience_item(item)
+                        if exp_data:
+                            experiences.append(exp_data)
+                    except:
+                        continue
+            except:
+                pass
+                
+        except Exception as e:
+            raise_if_classified(e)
+            print(f"  Warning: Could not fetch experiences - {e}")
+        
+        return experiences
+
+    def _item_spans(self, item, max_spans):
+        """Get the first span text of each summary row of a list item"""
+        from selenium.webdriver.common.by import By
+        
+        position = item.find_element(By.CSS_SELECTOR, "div[data-view-name='profile-component-entity']")
+        elements = position.find_elements(By.XPATH, "*")
+        
+        if len(elements) < 2:
+            return None
+        
+        position_details = elements[1]
+        position_details_list = position_details.find_elements(By.XPATH, "*")
+        
+        if not position_details_list:
+            return None
+        
+        position_summary = position_details_list[0]
+        outer_positions = position_summary.find_element(By.XPATH, "*").find_elements(By.XPATH, "*")
+        
+        spans = []
+        for outer_position in outer_positions[:max_spans]:
+            try:
+                spans.append(outer_position.find_element(By.TAG_NAME, "span").text)
+            except:
+                spans.append(None)
+        return spans
+
+    def _extract_items_js(self, parse_fields, max_spans):
+        """Parse the detail page list items from a single script call"""
+        with self.phase("extraction"):
+            rows = self.driver.execute_script(
+                js_extraction.LIST_ITEMS_SCRIPT, "main .pvs-list__container", self.item_cap, max_spans
+            ) or []
+        parsed = []
+        with self.phase("parsing"):
+            for spans in rows:
+                item = parse_fields(spans)
+                if item:
+                    parsed.append(item)
+        return parsed
+
+    def _parse_experience_item(self, item):
+        """Parse a single experience item"""
+        try:
+            with self.phase("extraction"):
+                spans = self._item_spans(item, max_spans=4)
+            with self.phase("parsing"):
+                return parse_experience_fields(spans)
+        except:
+            return None
+
+    def get_educations(self, base_url):
+        """Get education details"""
+        from selenium.webdriver.common.by import By
+        
+        educations = []
+        try:
+            edu_url = base_url.rstrip('/') + "/details/education"
+            self.load_page(edu_url, ["main .pvs-list__container"], timeout=3)
+            self.load_list_items("main .pvs-list__container", self.item_cap)
+            
+            if self.extraction == "js":
+                return self._extract_items_js(parse_education_fields, max_spans=3)
+            
+            main = self.wait_for_element_to_load(by=By.TAG_NAME, name="main")
+            
+            try:
+                main_list = self.wait_for_element_to_load(name="pvs-list__container", base=main)
+                with self.phase("extraction"):
+                    items = main_list.find_elements(By.CLASS_NAME, "pvs-list__paged-list-item")
+                
+                for item in items[:self.item_cap]:
+                    try:
+                        edu_data = self._parse_education_item(item)
+                        if edu_data:
+                            educations.append(edu_data)
+                    except:
+                        continue
+            except:
+                pass
+                
+        except Exception as e:
+            raise_if_classified(e)
+            print(f"  Warning: Could not fetch education - {e}")
+        
+        return educations
+
+    def _parse_education_item(self, item):
+        """Parse a single education item"""
+        try:
+            with self.phase("extraction"):
+                spans = self._item_spans(item, max_spans=3)
+            with self.phase("parsing"):
+                return parse_education_fields(spans)
+        except:
+            return None
+
+    def save_to_csv(self, filename="linkedin_profiles.csv", profiles=None):
+        """Save scraped data to CSV with detailed experience and education"""
+        profiles = exporters.non_empty(self.profiles if profiles is None else profiles)
+        if profiles is None:
+            print("No profiles to save!")
+            return
+        
+        exporters.export_csv(profiles, filename)
+        print(f"\n✓ CSV saved: {filename}")
+
+    def save_to_json(self, filename="linkedin_profiles.json", profiles=None):
+        """Save scraped data to JSON"""
+        profiles = exporters.non_empty(self.profiles if profiles is None else profiles)
+        if profiles is None:
+            print("No profiles to save!")
+            return
+        
+        exporters.export_json(profiles, filename)
+        print(f"✓ JSON saved: {filename}")
+
+    def save_to_xlsx(self, filename="linkedin_profiles.xlsx", profiles=None):
+        """Save scraped data to Excel"""
+        profiles = exporters.non_empty(self.profiles if profiles is None else profiles)
+        if profiles is None:
+            print("No profiles to save!")
+            return
+        
+        exporters.export_xlsx(profiles, filename)
+        print(f"✓ Excel saved: {filename}")
+
+    def save_to_parquet(self, directory="linkedin_profiles.parquet", profiles=None, compression=None):
+        """Save scraped data as profiles/experiences/educations Parquet tables"""
+        profiles = exporters.non_empty(self.profiles if profiles is None else profiles)
+        if profiles is None:
+            print("No profiles to save!")
+            return
+        
+        exporters.export_parquet(profiles, directory, compression)
+        print(f"✓ Parquet saved: {directory}/")
+
+
+def create_driver(headless=False, blocked_urls=None, page_timeout=DEFAULT_PROFILE_BUDGET):
+    """Start a Chrome driver with the scraper's default options"""
+    from selenium import webdriver
+    
+    chrome_options = webdriver.ChromeOptions()
+    if headless:
+        chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64)")
+    if blocked_urls:
+        resource_blocking.enable_performance_logging(chrome_options)
+    
+    driver = webdriver.Chrome(options=chrome_options)
+    # No single page or script may hold up the batch for longer than a profile's budget
+    driver.set_page_load_timeout(page_timeout)
+    driver.set_script_timeout(page_timeout)
+    if blocked_urls:
+        resource_blocking.enable_resource_blocking(driver, blocked_urls)
+    return driver
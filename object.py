@@ -1,38 +1,144 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from time import sleep
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.wait import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from urllib.parse import urlparse
+from js_extraction import PAGE_READY_SCRIPT, LOAD_LIST_ITEMS_SCRIPT
+from rate_limiter import looks_throttled
+from scrape_metrics import NO_TIMER
+
+
+class Record:
+    """Base of the compact profile records.
+
+    Records keep their fields in ``__slots__`` rather than a per-instance
+    dict and are treated as read-only once built. They are not frozen
+    dataclasses because a frozen __init__ is more than twice as slow, and
+    journals are decoded a profile at a time. ``get`` mirrors dict.get, so
+    code written against profile dicts reads records unchanged.
+    """
+    __slots__ = ()
+    # Names of the fields, inherited ones included; the only keys get knows
+    _field_names = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._field_names = frozenset(name for base in cls.__mro__ for name in getattr(base, "__slots__", ()))
+
+    @classmethod
+    def from_dict(cls, data):
+        if isinstance(data, cls):
+            return data
+        # A record's __slots__ lists its fields in order
+        return cls(*map(data.get, cls.__slots__))
+
+    def to_dict(self):
+        return {field.name: getattr(self, field.name) for field in fields(self)}
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self._field_names else default
+
+    def __reduce__(self):
+        # Rebuild from the field values: smaller and faster than slot state
+        return type(self), tuple(getattr(self, field.name) for field in fields(self))
 
 
 @dataclass
-class Experience:
-    position_title: str = None
-    institution_name: str = None
-    from_date: str = None
-    to_date: str = None
-    duration: str = None
-    location: str = None
-    description: str = None
-    linkedin_url: str = None
+class Experience(Record):
+    __slots__ = ("position_title", "company", "from_date", "to_date", "duration", "location")
+    position_title: str
+    company: str
+    from_date: str
+    to_date: str
+    duration: str
+    location: str
 
 
 @dataclass
-class Education:
-    institution_name: str = None
-    degree: str = None
-    from_date: str = None
-    to_date: str = None
-    description: str = None
-    linkedin_url: str = None
+class Education(Record):
+    __slots__ = ("institution", "degree", "from_date", "to_date")
+    institution: str
+    degree: str
+    from_date: str
+    to_date: str
+
+
+@dataclass
+class Profile(Record):
+    """A scraped profile; experiences and educations are tuples of records"""
+    __slots__ = ("url", "name", "headline", "location", "experiences", "educations")
+    url: str
+    name: str
+    headline: str
+    location: str
+    experiences: tuple
+    educations: tuple
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a Profile, or a FailedProfile if data has an error, from a profile dict"""
+        if isinstance(data, Profile):
+            return data
+        values = (
+            data.get("url"), data.get("name"), data.get("headline"), data.get("location"),
+            tuple(map(Experience.from_dict, filter(None, data.get("experiences") or ()))),
+            tuple(map(Education.from_dict, filter(None, data.get("educations") or ())))
+        )
+        if data.get("error"):
+            return FailedProfile(*values, data.get("error"), data.get("error_kind"))
+        return Profile(*values)
+
+    def to_dict(self):
+        data = super().to_dict()
+        data["experiences"] = [item.to_dict() for item in self.experiences]
+        data["educations"] = [item.to_dict() for item in self.educations]
+        return data
+
+
+@dataclass
+class FailedProfile(Profile):
+    """A profile that could not be (fully) scraped, and why"""
+    __slots__ = ("error", "error_kind")
+    error: str
+    error_kind: str
 
 
 class Scraper:
     WAIT_FOR_ELEMENT_TIMEOUT = 5
+    # Shortest page-load timeout given to the driver; Selenium rounds
+    # fractions of a millisecond down to no timeout at all
+    MIN_PAGE_LOAD_TIMEOUT = 1
 
     def __init__(self, driver):
         self.driver = driver
+        # Shared RateLimiter every page load draws from, if any
+        self.rate_limiter = None
+        # The driver's own page-load timeout, put back when a profile's
+        # deadline is cleared; None leaves the driver as it is
+        self.page_load_timeout = None
+        self._page_load_timeout_changed = False
+        # Deadline of the profile being scraped, shared by its page loads
+        self.deadline = None
+        # ScrapeMetrics the phases of each page are timed into, if any
+        self.metrics = None
+
+    @property
+    def deadline(self):
+        return self._deadline
+
+    @deadline.setter
+    def deadline(self, deadline):
+        self._deadline = deadline
+        if deadline is None and self._page_load_timeout_changed:
+            # Login and the next profile must not inherit what was left of this budget
+            self._page_load_timeout_changed = False
+            if self.page_load_timeout is not None:
+                try:
+                    self.driver.set_page_load_timeout(self.page_load_timeout)
+                except Exception:
+                    pass
+
+    def phase(self, name):
+        """Context manager timing a phase (navigation, wait, scroll, ...) into ``metrics``"""
+        return NO_TIMER if self.metrics is None else self.metrics.phase(name)
 
     @staticmethod
     def wait(duration):
@@ -45,25 +151,112 @@ class Scraper:
         except:
             pass
 
-    def wait_for_element_to_load(self, by=By.CLASS_NAME, name="pv-top-card", base=None):
+    # by defaults to By.CLASS_NAME; Selenium is imported on first use so that
+    # importing this module stays cheap
+    def wait_for_element_to_load(self, by="class name", name="pv-top-card", base=None):
+        from selenium.webdriver.support.wait import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        
         base = base or self.driver
-        return WebDriverWait(base, self.WAIT_FOR_ELEMENT_TIMEOUT).until(
-            EC.presence_of_element_located((by, name))
-        )
+        with self.phase("wait"):
+            return WebDriverWait(base, self.WAIT_FOR_ELEMENT_TIMEOUT).until(
+                EC.presence_of_element_located((by, name))
+            )
+
+    def wait_for_page_ready(self, selectors=(), timeout=5, quiet_period=0.5):
+        """Wait until the page is ready instead of sleeping for a fixed time.
+
+        Returns True as soon as the document has loaded, all CSS ``selectors``
+        are present and the DOM has been quiet for ``quiet_period`` seconds.
+        ``timeout`` is only an upper bound; False is returned when it is hit.
+        """
+        try:
+            with self.phase("wait"):
+                return bool(self.driver.execute_async_script(
+                    PAGE_READY_SCRIPT, list(selectors), int(timeout * 1000), int(quiet_period * 1000)
+                ))
+        except:
+            return False
+
+    def load_list_items(self, container, cap=None, timeout=10, stable_period=1.0):
+        """Scroll a paginated list until it stops growing or holds ``cap`` items.
+
+        Returns the number of items loaded. Short lists return after
+        ``stable_period`` seconds without new items; ``timeout`` (and the
+        profile ``deadline``) bound long ones.
+        """
+        if self.deadline is not None:
+            timeout = min(timeout, self.deadline.remaining())
+        try:
+            with self.phase("scroll"):
+                return self.driver.execute_async_script(
+                    LOAD_LIST_ITEMS_SCRIPT, container, cap, int(timeout * 1000), int(stable_period * 1000)
+                ) or 0
+        except:
+            return 0
+
+    def load_page(self, url, selectors=(), timeout=5):
+        """Navigate to url and wait until it is ready.
+
+        With a ``rate_limiter`` the navigation waits for its turn, and the
+        loaded page is reported back to it as throttled or not. With a
+        ``deadline`` neither the load nor the wait may outlast it. Timeouts
+        and crashes during navigation are raised as ScrapeError subclasses.
+        """
+        if self.rate_limiter is not None:
+            with self.phase("rate_limit"):
+                waited = self.rate_limiter.acquire()
+            if self.deadline is not None:
+                self.deadline.extend(waited)
+        if self.deadline is not None:
+            self.deadline.check(url)
+            timeout = min(timeout, self.deadline.remaining())
+        if self.metrics is not None:
+            self.metrics.inc("page_loads_total")
+        try:
+            if self.deadline is not None:
+                self._page_load_timeout_changed = True
+                self.driver.set_page_load_timeout(max(self.MIN_PAGE_LOAD_TIMEOUT, self.deadline.remaining()))
+            with self.phase("navigation"):
+                self.driver.get(url)
+        except Exception as e:
+            # scrape_errors imports this module, so it is imported here
+            from scrape_errors import raise_if_classified
+            
+            raise_if_classified(e, navigation=True)
+            raise
+        ready = self.wait_for_page_ready(selectors, timeout)
+        if self.rate_limiter is not None:
+            self.rate_limiter.report(self.is_throttled(ready))
+        return ready
+
+    def is_throttled(self, ready=True):
+        try:
+            # Only a page that never became ready is checked for being empty
+            text_length = None if ready else self.driver.execute_script(
+                "return document.body ? document.body.innerText.trim().length : 0;"
+            )
+            return looks_throttled(self.driver.current_url, text_length)
+        except:
+            return False
 
     def is_signed_in(self):
         try:
-            # Check if we're on the feed page (logged in)
-            return "feed" in self.driver.current_url or "mynetwork" in self.driver.current_url
+            # Check if we're on the feed page (logged in). Only the path is
+            # checked: login redirects carry "feed" in their query string.
+            path = urlparse(self.driver.current_url).path
+            return path.startswith("/feed") or path.startswith("/mynetwork")
         except:
             return False
 
     def scroll_to_half(self):
-        self.driver.execute_script(
-            "window.scrollTo(0, Math.ceil(document.body.scrollHeight/2));"
-        )
+        with self.phase("scroll"):
+            self.driver.execute_script(
+                "window.scrollTo(0, Math.ceil(document.body.scrollHeight/2));"
+            )
 
     def scroll_to_bottom(self):
-        self.driver.execute_script(
-            "window.scrollTo(0, document.body.scrollHeight);"
-        )
\ No newline at end of file
+        with self.phase("scroll"):
+            self.driver.execute_script(
+                "window.scrollTo(0, document.body.scrollHeight);"
+            )
\ No newline at end of file
@@ -0,0 +1,70 @@
+import sqlite3
+import threading
+import time
+from dataclasses import replace
+
+import profile_codec
+from url_frontier import canonicalize_url
+
+
+DEFAULT_CACHE_PATH = "linkedin_cache.sqlite3"
+DEFAULT_TTL_HOURS = 168
+
+
+def cache_key(url):
+    """Key a profile URL by its canonical form"""
+    return canonicalize_url(url) or url.strip()
+
+
+class ProfileCache:
+    """SQLite cache of scraped profiles with a freshness TTL.
+
+    Profiles scraped within ``ttl_hours`` are served from the cache instead
+    of being scraped again. Profiles that ended in an error are not cached.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl_hours=DEFAULT_TTL_HOURS):
+        self.path = path
+        self.ttl = ttl_hours * 3600
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS profiles ("
+            " key TEXT PRIMARY KEY,"
+            " scraped_at REAL NOT NULL,"
+            " data TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, url):
+        """Return the cached profile for url if it is still fresh, else None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM profiles WHERE key = ? AND scraped_at >= ?",
+                (cache_key(url), time.time() - self.ttl)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+
+        return replace(profile_codec.decode(row[0]), url=url)
+
+    def put(self, profile_data):
+        """Store a freshly scraped profile"""
+        if profile_data.get("error") or not profile_data.get("url"):
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO profiles (key, scraped_at, data) VALUES (?, ?, ?)",
+                (cache_key(profile_data.get("url")), time.time(), profile_codec.encode(profile_data).decode("utf-8"))
+            )
+            self._conn.commit()
+
+    def summary(self):
+        return f"Cache: {self.hits} hit(s), {self.misses} miss(es)"
+
+    def close(self):
+        self._conn.close()
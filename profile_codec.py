@@ -0,0 +1,51 @@
+# JSON encoding of profile records for the journal, the cache and the JSON
+# export. orjson, when installed, serializes the slotted records directly and
+# parses lines several times faster than the json module; without it records
+# go through plain dicts and json.
+import json
+
+from object import Profile
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _as_dict(profile):
+    return profile.to_dict() if isinstance(profile, Profile) else profile
+
+
+def encode(profile):
+    """A profile (record or dict) as compact UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(profile)
+    return json.dumps(_as_dict(profile), ensure_ascii=False).encode("utf-8")
+
+
+def encode_pretty(profile):
+    """A profile as JSON text indented by two spaces, like json.dumps(..., indent=2)"""
+    if orjson is not None:
+        return orjson.dumps(profile, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(_as_dict(profile), indent=2, ensure_ascii=False)
+
+
+def loads(data):
+    """Plain profile dict from JSON bytes or text; None if it is not a JSON object.
+
+    Cheaper than decode when only a field or two (url, error) is needed.
+    Raises ValueError on malformed JSON.
+    """
+    value = orjson.loads(data) if orjson is not None else json.loads(data)
+    return value if isinstance(value, dict) else None
+
+
+def decode(data):
+    """Profile record from JSON bytes or text; None if it is not a JSON object.
+
+    Raises ValueError on malformed JSON.
+    """
+    value = loads(data)
+    if value is None:
+        return None
+    return Profile.from_dict(value)
@@ -0,0 +1,211 @@
+# Normalized in-memory model of scraped profiles for the web app. Profiles,
+# experiences and educations are separate tables joined by profile_id, so
+# a profile's URL, name and headline are stored once rather than on every
+# experience row. Values that repeat across profiles (companies, schools,
+# places, titles, dates) are categoricals, so dates are parsed once per
+# category rather than once per row.
+import os
+from datetime import date
+
+import date_parsing
+from exporters import CSV_HEADER, PARQUET_TABLES
+from object import Profile, FailedProfile, Experience, Education
+
+
+PROFILE_COLUMNS = {"url": "URL", "name": "Name", "headline": "Headline", "location": "Location"}
+EXPERIENCE_COLUMNS = {
+    "position_title": "Position Title", "company": "Company", "from_date": "Work From",
+    "to_date": "Work To", "duration": "Duration", "location": "Work Location"
+}
+EDUCATION_COLUMNS = {
+    "institution": "Education Institution", "degree": "Degree", "from_date": "Edu From", "to_date": "Edu To"
+}
+
+# Why a profile could not be scraped; missing for the ones that were
+FAILURE_COLUMNS = ("error", "error_kind")
+
+# Profile columns that are mostly unique; every other column is categorical
+UNIQUE_PROFILE_COLUMNS = ("url", "name", "headline", "error")
+
+
+def string_dtype():
+    """Arrow-backed strings when pyarrow is installed, plain objects otherwise"""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return object
+    return "string[pyarrow]"
+
+
+def _columns(names):
+    return {name: [] for name in names}
+
+
+def _frame(columns, categorical, index_name=None):
+    import pandas as pd
+
+    frame = pd.DataFrame({
+        name: pd.Series(values, dtype="int32" if name in ("profile_id", "item") else
+                        "category" if name in categorical else string_dtype())
+        for name, values in columns.items()
+    })
+    if index_name:
+        frame.index.name = index_name
+    return frame
+
+
+def _parsed(column, parse):
+    """parse applied to each category of column, spread back over the rows as Int32"""
+    import pandas as pd
+
+    if column.dtype.name != "category":
+        column = column.astype("category")
+    # Missing values have code -1, which picks the trailing None
+    parsed = pd.array([parse(value) for value in column.cat.categories] + [None], dtype="Int32")
+    return pd.Series(parsed[column.cat.codes.to_numpy()], index=column.index)
+
+
+def add_month_columns(entries, today=None):
+    """Add from_month, to_month and months (see date_parsing) to an entry table"""
+    today = today or date.today()
+    entries["from_month"] = _parsed(entries["from_date"], lambda text: date_parsing.parse_month(text, today=today))
+    entries["to_month"] = _parsed(entries["to_date"], lambda text: date_parsing.parse_month(text, True, today))
+    span = entries["to_month"] - entries["from_month"] + 1
+    span = span.where((span > 0).fillna(False))
+    if "duration" in entries:
+        entries["months"] = _parsed(entries["duration"], date_parsing.parse_duration).fillna(span)
+    else:
+        entries["months"] = span
+    return entries
+
+
+class ProfileTables:
+    """The profiles, experiences and educations tables of one result set.
+
+    ``profiles`` is indexed by profile_id; ``experiences`` and
+    ``educations`` carry a profile_id column and ``item``, the entry's
+    position on the profile. Empty values are stored as missing. Both
+    entry tables also have the parsed from_month, to_month and months.
+    """
+
+    def __init__(self, profiles, experiences, educations):
+        self.profiles = profiles
+        self.experiences = experiences
+        self.educations = educations
+
+    @classmethod
+    def from_profiles(cls, profiles):
+        """Build the tables from scraped profile dicts in one pass"""
+        profile_columns = _columns([*PROFILE_COLUMNS, *FAILURE_COLUMNS])
+        experience_columns = _columns(["profile_id", "item", *EXPERIENCE_COLUMNS])
+        education_columns = _columns(["profile_id", "item", *EDUCATION_COLUMNS])
+
+        for profile_id, profile in enumerate(profiles):
+            for name, values in profile_columns.items():
+                values.append(profile.get(name) or None)
+            for entries, columns in (
+                (profile.get("experiences") or [], experience_columns),
+                (profile.get("educations") or [], education_columns)
+            ):
+                for item, entry in enumerate(entries):
+                    columns["profile_id"].append(profile_id)
+                    columns["item"].append(item)
+                    for name, values in columns.items():
+                        if name not in ("profile_id", "item"):
+                            values.append(entry.get(name) or None)
+
+        return cls(
+            _frame(profile_columns, set(profile_columns) - set(UNIQUE_PROFILE_COLUMNS), "profile_id"),
+            add_month_columns(_frame(experience_columns, set(EXPERIENCE_COLUMNS))),
+            add_month_columns(_frame(education_columns, set(EDUCATION_COLUMNS)))
+        )
+
+    @classmethod
+    def from_parquet(cls, directory):
+        """Load the tables written by exporters.export_parquet.
+
+        Files are memory-mapped and categorical columns are read straight
+        into dictionary-encoded (categorical) columns. Month columns are
+        parsed again, so "Present" means today rather than the export date.
+        Exports from before the error columns load as all-successful.
+        """
+        import pandas as pd
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        string_types = {}
+        if string_dtype() != object:
+            string_types = {pa.string(): pd.StringDtype("pyarrow"), pa.large_string(): pd.StringDtype("pyarrow")}
+        categorical = {
+            "profiles": {*PROFILE_COLUMNS, *FAILURE_COLUMNS} - set(UNIQUE_PROFILE_COLUMNS),
+            "experiences": set(EXPERIENCE_COLUMNS),
+            "educations": set(EDUCATION_COLUMNS)
+        }
+        tables = {}
+        for name in PARQUET_TABLES:
+            path = os.path.join(directory, f"{name}.parquet")
+            columns = set(pq.read_schema(path).names)
+            table = pq.read_table(path, memory_map=True, read_dictionary=sorted(categorical[name] & columns))
+            tables[name] = table.to_pandas(types_mapper=string_types.get)
+        profiles = tables["profiles"].set_index("profile_id")
+        for column in FAILURE_COLUMNS:
+            if column not in profiles:
+                profiles[column] = pd.Series(None, index=profiles.index, dtype=string_dtype())
+        return cls(
+            profiles,
+            add_month_columns(tables["experiences"]),
+            add_month_columns(tables["educations"])
+        )
+
+    def to_profiles(self):
+        """Rebuild the Profile records, e.g. from a run loaded from Parquet.
+
+        Profiles with an error come back as FailedProfile records.
+        """
+        def rows(frame, columns):
+            frame = frame[columns].astype(object)
+            return frame.where(frame.notna(), None).itertuples(index=False, name=None)
+
+        entries = {}
+        for key, table, columns, record in (
+            ("experiences", self.experiences, list(EXPERIENCE_COLUMNS), Experience),
+            ("educations", self.educations, list(EDUCATION_COLUMNS), Education)
+        ):
+            table = table.sort_values(["profile_id", "item"])
+            for profile_id, values in zip(table["profile_id"], rows(table, columns)):
+                entries.setdefault((key, profile_id), []).append(record(*values))
+
+        profiles = []
+        columns = [*PROFILE_COLUMNS, *FAILURE_COLUMNS]
+        for profile_id, (*values, error, error_kind) in zip(self.profiles.index, rows(self.profiles, columns)):
+            values += [
+                tuple(entries.get(("experiences", profile_id), ())),
+                tuple(entries.get(("educations", profile_id), ()))
+            ]
+            profiles.append(FailedProfile(*values, error, error_kind) if error else Profile(*values))
+        return profiles
+
+    def wide(self):
+        """One row per experience/education pair with the CSV export's columns.
+
+        This is the layout of exporters.profile_rows: the n-th experience and
+        the n-th education of a profile share a row, and a profile with
+        neither still gets one. Missing values are empty strings.
+        """
+        keys = ["profile_id", "item"]
+        entries = self.experiences[keys + list(EXPERIENCE_COLUMNS)].rename(columns=EXPERIENCE_COLUMNS).merge(
+            self.educations[keys + list(EDUCATION_COLUMNS)].rename(columns=EDUCATION_COLUMNS),
+            on=keys, how="outer", sort=True
+        )
+        # A left merge keeps the profiles' order
+        wide = self.profiles.rename(columns=PROFILE_COLUMNS).reset_index().merge(
+            entries, on="profile_id", how="left"
+        )
+        wide = wide[CSV_HEADER].reset_index(drop=True)
+
+        for name in CSV_HEADER:
+            column = wide[name]
+            if column.dtype.name == "category" and "" not in column.cat.categories:
+                column = column.cat.add_categories("")
+            wide[name] = column.fillna("")
+        return wide
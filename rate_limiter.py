@@ -0,0 +1,109 @@
+import threading
+import time
+from urllib.parse import urlparse
+
+
+DEFAULT_PAGES_PER_MINUTE = 30
+DEFAULT_BURST = 3
+
+# Where LinkedIn sends clients it wants to slow down or challenge
+THROTTLE_PATHS = ("/checkpoint", "/authwall")
+
+
+def looks_throttled(current_url, page_text_length=None):
+    """True if a loaded page looks like LinkedIn pushing back.
+
+    That is a redirect to a checkpoint/authwall page, or a page that came
+    back without any text (``page_text_length`` of 0).
+    """
+    try:
+        path = urlparse(current_url or "").path
+    except ValueError:
+        path = ""
+    if path.startswith(THROTTLE_PATHS):
+        return True
+    return page_text_length == 0
+
+
+class RateLimiter:
+    """Token bucket shared by every worker that loads pages.
+
+    Allows ``burst`` page loads at once and ``pages_per_minute`` on average.
+    Each throttling signal multiplies the rate by ``backoff`` (down to
+    ``min_factor`` of the configured rate); every clean page load then wins
+    back ``recovery`` of the configured rate until it is fully restored.
+    """
+
+    def __init__(self, pages_per_minute=DEFAULT_PAGES_PER_MINUTE, burst=DEFAULT_BURST,
+                 backoff=0.5, recovery=0.05, min_factor=1 / 16):
+        if not pages_per_minute > 0:
+            raise ValueError(f"pages_per_minute must be positive, got {pages_per_minute!r}")
+        self.rate = pages_per_minute / 60
+        self.burst = max(1, burst)
+        self.backoff = backoff
+        self.recovery = recovery
+        self.min_factor = min_factor
+        self.factor = 1.0
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.page_loads = 0
+        self.throttle_signals = 0
+        self._lock = threading.Lock()
+
+    @property
+    def current_rate(self):
+        """Page loads per second allowed right now"""
+        return self.rate * self.factor
+
+    def _reserve(self):
+        """Take a token and return how long to wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.current_rate)
+            self.updated = now
+            self.tokens -= 1
+            self.page_loads += 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.current_rate
+
+    def acquire(self):
+        """Block until the next page load is allowed; returns the seconds waited"""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self, deadline=None):
+        """Wait, without blocking the event loop, until the next page load is allowed.
+
+        The wait is added to ``deadline`` (a scrape_errors.Deadline) before
+        it starts, so whatever watches that budget never counts it.
+        """
+        import asyncio
+        
+        delay = self._reserve()
+        if deadline is not None:
+            deadline.extend(delay)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def report(self, throttled):
+        """Feed back whether the page that was just loaded looked throttled"""
+        with self._lock:
+            if throttled:
+                self.throttle_signals += 1
+                self.factor = max(self.min_factor, self.factor * self.backoff)
+                # No bursting while LinkedIn is pushing back
+                self.tokens = min(self.tokens, 0.0)
+            else:
+                self.factor = min(1.0, self.factor + self.recovery)
+        if throttled:
+            print(f"  Warning: Throttling detected, slowing down to {self.current_rate * 60:.1f} pages/min")
+
+    def summary(self):
+        return (
+            f"Rate limit: {self.page_loads} page load(s), {self.throttle_signals} throttle signal(s), "
+            f"ending at {self.current_rate * 60:.1f} pages/min"
+        )
@@ -0,0 +1,113 @@
+# Blocks page resources the extractors never use (images, media, fonts,
+# trackers) through the Chrome DevTools protocol, and keeps count of what
+# was blocked.
+import json
+import threading
+
+
+DEFAULT_BLOCKED_URLS = [
+    # Images (LinkedIn serves profile and banner images without an extension)
+    "*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.svg*", "*.ico*",
+    "*media.licdn.com/dms/image*",
+    # Video and audio
+    "*.mp4*", "*.webm*", "*.m3u8*", "*.mp3*", "*dms.licdn.com/playlist*",
+    # Fonts
+    "*.woff*", "*.ttf*", "*.otf*",
+    # Analytics and ads
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*px.ads.linkedin.com*", "*dc.ads.linkedin.com*", "*snap.licdn.com*",
+    "*linkedin.com/li/track*", "*bat.bing.com*", "*connect.facebook.net*"
+]
+
+# Typical transfer size per blocked resource type. Blocked requests are never
+# downloaded, so the bytes saved can only be estimated from these.
+TYPICAL_BYTES = {
+    "Image": 25_000,
+    "Media": 400_000,
+    "Font": 35_000,
+    "Script": 50_000,
+    "XHR": 2_000,
+    "Fetch": 2_000,
+    "Ping": 500,
+    "Other": 5_000
+}
+
+
+def parse_blocked_urls(value):
+    """Read a comma-separated block list; "default" expands to DEFAULT_BLOCKED_URLS"""
+    patterns = []
+    for pattern in (value or "").split(","):
+        pattern = pattern.strip()
+        if pattern == "default":
+            patterns.extend(DEFAULT_BLOCKED_URLS)
+        elif pattern:
+            patterns.append(pattern)
+    return patterns
+
+
+def enable_performance_logging(chrome_options):
+    """Record DevTools network events so blocked requests can be counted"""
+    chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+
+def enable_resource_blocking(driver, patterns=None):
+    """Block requests matching any of the URL patterns on this driver"""
+    patterns = DEFAULT_BLOCKED_URLS if patterns is None else patterns
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+
+
+class ResourceStats:
+    """Blocked request counts and downloaded bytes, collected from performance logs"""
+
+    def __init__(self):
+        self.blocked = {}
+        self.bytes_received = 0
+        self._request_types = {}
+        self._lock = threading.Lock()
+
+    def collect(self, driver):
+        """Drain the driver's performance log into the counters"""
+        try:
+            entries = driver.get_log("performance")
+        except Exception:
+            return
+
+        with self._lock:
+            for entry in entries:
+                try:
+                    message = json.loads(entry["message"])["message"]
+                except (KeyError, ValueError):
+                    continue
+                method = message.get("method")
+                params = message.get("params", {})
+
+                if method == "Network.requestWillBeSent":
+                    self._request_types[params.get("requestId")] = params.get("type", "Other")
+                elif method == "Network.loadingFinished":
+                    self._request_types.pop(params.get("requestId"), None)
+                    self.bytes_received += int(params.get("encodedDataLength", 0))
+                elif method == "Network.loadingFailed":
+                    resource_type = self._request_types.pop(params.get("requestId"), None)
+                    if params.get("blockedReason"):
+                        resource_type = params.get("type") or resource_type or "Other"
+                        self.blocked[resource_type] = self.blocked.get(resource_type, 0) + 1
+
+    @property
+    def blocked_requests(self):
+        return sum(self.blocked.values())
+
+    @property
+    def estimated_bytes_saved(self):
+        return sum(
+            count * TYPICAL_BYTES.get(resource_type, TYPICAL_BYTES["Other"])
+            for resource_type, count in self.blocked.items()
+        )
+
+    def summary(self):
+        """One-line report of what blocking saved"""
+        return (
+            f"Blocked {self.blocked_requests} request(s), "
+            f"~{self.estimated_bytes_saved / 1_000_000:.1f} MB saved (estimated), "
+            f"{self.bytes_received / 1_000_000:.1f} MB downloaded"
+        )
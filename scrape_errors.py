@@ -0,0 +1,179 @@
+import time
+from collections import Counter, deque
+from urllib.parse import urlparse
+
+from object import FailedProfile
+
+try:
+    from selenium.common.exceptions import TimeoutException as WebDriverTimeout
+except ImportError:  # the cdp engine runs without Selenium
+    WebDriverTimeout = TimeoutError
+
+
+DEFAULT_PROFILE_BUDGET = 60
+DEFAULT_MAX_ATTEMPTS = 3
+
+# Error messages that mean the tab or the whole browser went away
+CRASH_MARKERS = (
+    "tab crashed", "page crash", "target crashed", "target closed", "chrome not reachable",
+    "invalid session id", "disconnected", "no such window"
+)
+# Where LinkedIn lands a profile visit that is no longer signed in
+AUTH_PATHS = ("/login", "/uas/login", "/authwall")
+# Security or rate checkpoints; the session is still valid, LinkedIn wants us to slow down
+CHECKPOINT_PATHS = ("/checkpoint",)
+NOT_FOUND_PATHS = ("/404", "/in/unavailable")
+
+
+class ScrapeError(Exception):
+    """A profile could not be scraped; ``kind`` says why"""
+    kind = "error"
+    # Worth trying again later
+    transient = False
+    # Every following profile would fail the same way, so the run stops
+    fatal = False
+
+
+class PageTimeout(ScrapeError):
+    kind = "timeout"
+    transient = True
+
+
+class DeadlineExceeded(PageTimeout):
+    kind = "deadline"
+
+
+class RendererCrash(ScrapeError):
+    kind = "renderer_crash"
+    transient = True
+
+
+class Throttled(ScrapeError):
+    kind = "throttled"
+    transient = True
+
+
+class AuthLost(ScrapeError):
+    kind = "auth_lost"
+    fatal = True
+
+
+class ProfileNotFound(ScrapeError):
+    kind = "not_found"
+
+
+def classify(exc, navigation=False):
+    """Wrap any exception raised while scraping in the matching ScrapeError.
+
+    Selenium raises the same TimeoutException for a page load that runs
+    out of time and for an element wait that gives up, so it only counts
+    as a PageTimeout when ``navigation`` says it came from a page load; a
+    missing element is an ordinary extraction error.
+    """
+    # Only the cdp engine runs on asyncio; it is loaded by the time it times out
+    import asyncio
+    
+    if isinstance(exc, ScrapeError):
+        return exc
+    if navigation and isinstance(exc, WebDriverTimeout) or isinstance(exc, (TimeoutError, asyncio.TimeoutError)):
+        return PageTimeout(str(exc) or "Page load timed out")
+    message = str(exc).lower()
+    if any(marker in message for marker in CRASH_MARKERS):
+        return RendererCrash(str(exc))
+    return ScrapeError(str(exc))
+
+
+def raise_if_classified(exc, navigation=False):
+    """Re-raise exc as a ScrapeError unless it is an ordinary extraction error"""
+    error = classify(exc, navigation)
+    if type(error) is not ScrapeError:
+        raise error from exc
+
+
+def check_landing(url, current_url):
+    """Raise if loading a profile ended on a login wall, a checkpoint or a missing-profile page"""
+    path = urlparse(current_url or "").path
+    if path.startswith(AUTH_PATHS):
+        raise AuthLost(f"Session is no longer signed in (redirected to {path})")
+    if path.startswith(CHECKPOINT_PATHS):
+        # load_page has already reported the page to the rate limiter, which backs off
+        raise Throttled(f"LinkedIn checkpoint while loading {url} (redirected to {path})")
+    if path.startswith(NOT_FOUND_PATHS):
+        raise ProfileNotFound(f"Profile not found: {url}")
+
+
+class Deadline:
+    """Wall-clock budget shared by all page loads of one profile"""
+
+    def __init__(self, seconds):
+        self.expires = time.monotonic() + seconds
+
+    def extend(self, seconds):
+        """Leave time spent waiting on the rate limiter out of the budget"""
+        self.expires += seconds
+
+    def remaining(self):
+        return max(0.0, self.expires - time.monotonic())
+
+    def check(self, what):
+        if self.remaining() <= 0:
+            raise DeadlineExceeded(f"Profile budget used up before loading {what}")
+
+
+def failed_profile(url, error):
+    """Profile record recording why url could not be scraped"""
+    return FailedProfile(url, None, None, None, (), (), str(error), error.kind)
+
+
+class RetryQueue:
+    """URL iterator that takes transiently failed URLs back at the end.
+
+    URLs come from ``urls`` first; a URL handed to ``handle`` with a
+    transient error is queued again behind them, up to ``max_attempts``
+    tries in total, so a flaky profile never holds up the rest.
+    """
+
+    def __init__(self, urls, max_attempts=DEFAULT_MAX_ATTEMPTS):
+        self.max_attempts = max(1, max_attempts)
+        self.attempts = {}
+        self.retried = 0
+        self.failures = Counter()
+        self._urls = iter(urls)
+        self._retries = deque()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._urls is not None:
+            try:
+                return next(self._urls)
+            except StopIteration:
+                self._urls = None
+        if self._retries:
+            return self._retries.popleft()
+        raise StopIteration
+
+    def handle(self, url, exc):
+        """Deal with a failed URL.
+
+        Returns None when the URL was queued for another attempt, otherwise
+        the FailedProfile record to keep. Fatal errors are re-raised.
+        """
+        error = classify(exc)
+        if error.fatal:
+            raise error
+        attempt = self.attempts.get(url, 1)
+        if error.transient and attempt < self.max_attempts:
+            self.attempts[url] = attempt + 1
+            self.retried += 1
+            self._retries.append(url)
+            print(f"  ↻ {error.kind} on {url}, retrying later (attempt {attempt + 1}/{self.max_attempts})")
+            return None
+        print(f"✗ {error.kind} on {url}: {error}")
+        self.failures[error.kind] += 1
+        return failed_profile(url, error)
+
+    def summary(self):
+        failures = ", ".join(f"{kind} {count}" for kind, count in self.failures.most_common()) or "none"
+        return f"Retries: {self.retried} re-queued; failures: {failures}"
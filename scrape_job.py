@@ -0,0 +1,137 @@
+# Runs a scrape on a background thread so the Streamlit page stays responsive.
+# Every finished profile is put on a queue that the page drains on each rerun.
+import queue
+import threading
+
+import profile_cache
+import rate_limiter
+import resource_blocking
+import session_vault
+from linkedin_scraper import LinkedInScraper, create_driver
+from scrape_errors import RetryQueue, RendererCrash, classify
+
+
+class ScrapeJob:
+    """Scrape a list of URLs on a background thread.
+
+    Cached, scraped and failed profiles are all put on ``results`` as soon as
+    they are finished; ``drain()`` moves them into ``profiles``. The job is
+    independent of any Streamlit script run, so it keeps going across
+    reruns and browser refreshes until it is done or ``stop()`` is called.
+    """
+
+    def __init__(self, urls, email, password, cache_ttl=profile_cache.DEFAULT_TTL_HOURS, blocked_urls=None,
+                 pages_per_minute=rate_limiter.DEFAULT_PAGES_PER_MINUTE):
+        self.urls = list(urls)
+        self.email = email
+        self.password = password
+        self.cache_ttl = cache_ttl
+        self.blocked_urls = blocked_urls
+        self.pages_per_minute = pages_per_minute
+        self.results = queue.Queue()
+        self.profiles = []
+        self.status = "Starting..."
+        self.error = None
+        self.cache_summary = None
+        self.resource_summary = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="scrape-job", daemon=True)
+
+    @property
+    def total(self):
+        return len(self.urls)
+
+    @property
+    def running(self):
+        return self._thread.is_alive()
+
+    @property
+    def stopped(self):
+        return self._stop.is_set()
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Finish the profile in progress, then end the job"""
+        self._stop.set()
+
+    def drain(self):
+        """Move finished profiles from the queue into ``profiles``; returns how many arrived"""
+        with self._lock:
+            count = 0
+            while True:
+                try:
+                    self.profiles.append(self.results.get_nowait())
+                except queue.Empty:
+                    return count
+                count += 1
+
+    def _run(self):
+        cache = profile_cache.ProfileCache(ttl_hours=self.cache_ttl) if self.cache_ttl > 0 else None
+        scraper = LinkedInScraper(None, blocked_urls=self.blocked_urls)
+        # Login cookies, for restarting a crashed browser without logging in again
+        session = None
+        try:
+            # Serve fresh profiles from the cache without navigating to them
+            cached_profiles = {}
+            if cache is not None:
+                for url in self.urls:
+                    cached = cache.get(url)
+                    if cached is not None:
+                        cached_profiles[url] = cached
+                self.cache_summary = cache.summary()
+
+            if len(cached_profiles) < len(self.urls):
+                self.status = "Starting Chrome..."
+                scraper.driver = create_driver(headless=True, blocked_urls=self.blocked_urls)
+                if self.blocked_urls:
+                    scraper.resource_stats = resource_blocking.ResourceStats()
+                scraper.rate_limiter = rate_limiter.RateLimiter(self.pages_per_minute)
+
+                self.status = "Logging in to LinkedIn..."
+                if not scraper.login(self.email, self.password):
+                    self.error = "Login failed! Check your credentials or 2FA settings."
+                    return
+                session = session_vault.capture_session(scraper.driver)
+
+            # Timeouts and crashes are retried once the rest are done; a
+            # crashed browser is replaced first
+            retries = RetryQueue(self.urls)
+            finished = 0
+            for url in retries:
+                if self._stop.is_set():
+                    self.status = f"Stopped after {finished} of {self.total} profile(s)"
+                    return
+                self.status = f"Scraping profile {finished + 1}/{self.total}..."
+
+                if url in cached_profiles:
+                    profile_data = cached_profiles[url]
+                else:
+                    try:
+                        profile_data = scraper.scrape_profile(url)
+                    except Exception as e:
+                        profile_data = retries.handle(url, e)
+                        if isinstance(classify(e), RendererCrash):
+                            self.status = "Restarting Chrome..."
+                            scraper.restart_browser(session, headless=True)
+                        if profile_data is None:
+                            continue
+                    if cache is not None:
+                        cache.put(profile_data)
+                    scraper.collect_resource_stats()
+                self.results.put(profile_data)
+                finished += 1
+
+            self.status = f"Scraped {finished} profile(s)"
+        except Exception as e:
+            self.error = f"Error during scraping: {e}"
+        finally:
+            if scraper.resource_stats is not None:
+                self.resource_summary = scraper.resource_stats.summary()
+            if scraper.driver is not None:
+                scraper.driver.quit()
+            if cache is not None:
+                cache.close()
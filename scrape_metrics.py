@@ -0,0 +1,186 @@
+# Per-phase timings and counters of a scrape: where the seconds per profile
+# go (navigation, waits, scrolling, extraction, parsing), how many pages and
+# WebDriver commands that took, and how many profiles came out. Scrapers only
+# record into a ScrapeMetrics when one is attached, so without one the cost
+# is a None check per phase. serve() exposes the numbers in the Prometheus
+# text format on a local /metrics endpoint.
+import contextlib
+import threading
+import time
+from bisect import bisect_left
+
+
+PREFIX = "linkedin_scraper_"
+
+# Upper bounds (seconds) of the histogram buckets; +Inf is implied
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 60)
+
+# name: (type, help)
+METRICS = {
+    "phase_seconds": ("histogram", "Time spent in each phase of scraping a profile or logging in"),
+    "profile_seconds": ("histogram", "Wall-clock time to scrape one profile"),
+    "login_seconds": ("histogram", "Wall-clock time of a login"),
+    "profiles_total": ("counter", "Profiles finished, by status (ok, failed, cached)"),
+    "page_loads_total": ("counter", "Page navigations"),
+    "webdriver_commands_total": ("counter", "WebDriver commands sent, by command")
+}
+
+# Shared stand-in for a timer when no metrics are collected
+NO_TIMER = contextlib.nullcontext()
+
+
+class Histogram:
+    """Bucketed observations with their sum and count"""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        # One count per bucket plus the +Inf bucket, not cumulative
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Timer:
+    """Context manager observing its duration into a histogram"""
+    __slots__ = ("metrics", "name", "labels", "started")
+
+    def __init__(self, metrics, name, labels):
+        self.metrics = metrics
+        self.name = name
+        self.labels = labels
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.metrics.observe(self.name, time.perf_counter() - self.started, **self.labels)
+        return False
+
+
+def _label_text(labels):
+    return "{" + ",".join(f'{name}="{value}"' for name, value in labels) + "}" if labels else ""
+
+
+def _number(value):
+    return f"{value:g}" if isinstance(value, float) else str(value)
+
+
+class ScrapeMetrics:
+    """Counters and histograms shared by every scraper of a run, thread-safe"""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counters = {}
+        self.histograms = {}
+        self.started = time.monotonic()
+        self._lock = threading.Lock()
+
+    def inc(self, name, amount=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    def observe(self, name, seconds, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram(self.buckets)
+            histogram.observe(seconds)
+
+    def timer(self, name, **labels):
+        """Time a with-block into histogram name"""
+        return Timer(self, name, labels)
+
+    def phase(self, phase):
+        """Time a with-block as one phase of scraping"""
+        return Timer(self, "phase_seconds", {"phase": phase})
+
+    def instrument_driver(self, driver):
+        """Count every WebDriver command this driver (and its elements) sends"""
+        execute = driver.execute
+
+        def counted_execute(driver_command, params=None):
+            self.inc("webdriver_commands_total", command=driver_command)
+            return execute(driver_command, params)
+
+        driver.execute = counted_execute
+        return driver
+
+    def counter_total(self, name):
+        with self._lock:
+            return sum(value for (key, _), value in self.counters.items() if key == name)
+
+    def render(self):
+        """All metrics in the Prometheus text exposition format"""
+        lines = []
+        with self._lock:
+            for name, (kind, help_text) in METRICS.items():
+                full_name = PREFIX + name
+                lines.append(f"# HELP {full_name} {help_text}")
+                lines.append(f"# TYPE {full_name} {kind}")
+                if kind == "counter":
+                    for (key, labels), value in sorted(self.counters.items()):
+                        if key == name:
+                            lines.append(f"{full_name}{_label_text(labels)} {_number(value)}")
+                    continue
+                for (key, labels), histogram in sorted(self.histograms.items(), key=lambda item: item[0]):
+                    if key != name:
+                        continue
+                    cumulative = 0
+                    for bound, count in zip((*histogram.buckets, "+Inf"), histogram.counts):
+                        cumulative += count
+                        bucket_labels = (*labels, ("le", bound if bound == "+Inf" else _number(float(bound))))
+                        lines.append(f"{full_name}_bucket{_label_text(bucket_labels)} {cumulative}")
+                    lines.append(f"{full_name}_sum{_label_text(labels)} {histogram.sum:.6f}")
+                    lines.append(f"{full_name}_count{_label_text(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def summary(self):
+        with self._lock:
+            profiles = self.histograms.get(("profile_seconds", ()))
+            phases = sorted(
+                ((dict(labels)["phase"], histogram.sum) for (key, labels), histogram in self.histograms.items()
+                 if key == "phase_seconds"),
+                key=lambda phase: -phase[1]
+            )
+        timed = sum(seconds for _, seconds in phases)
+        text = f"Timing: {time.monotonic() - self.started:.1f}s run"
+        if profiles is not None and profiles.count:
+            text += f", {profiles.sum / profiles.count:.1f}s per scraped profile"
+        if timed:
+            text += "; " + ", ".join(f"{phase} {seconds:.1f}s ({seconds / timed:.0%})" for phase, seconds in phases)
+        return (
+            f"{text}; {self.counter_total('page_loads_total')} page load(s), "
+            f"{self.counter_total('webdriver_commands_total')} WebDriver command(s)"
+        )
+
+
+def serve(metrics, port, host="127.0.0.1"):
+    """Serve metrics.render() at http://host:port/metrics on a daemon thread; returns the server"""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = metrics.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    return server
@@ -0,0 +1,95 @@
+# In-memory full-text index over table rows for the app's search box. Built
+# once per result set; queries then touch only the rows that can match.
+import re
+from bisect import bisect_left
+
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text):
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class SearchIndex:
+    """Token -> row-id inverted index plus one lower-cased text per row.
+
+    A query is split on whitespace and a row matches when it contains every
+    term (AND). A term matches a word it starts (prefix match), and the term
+    as typed, punctuation included, must occur in the row's text, so
+    "c++" or "ph.d" only match rows that actually contain them.
+    """
+
+    def __init__(self, rows):
+        self.texts = []
+        postings = {}
+        # Cells repeat a lot (a profile's name is on each of its rows), so each
+        # distinct value is tokenized once
+        cell_tokens = {}
+        for row_id, values in enumerate(rows):
+            cells = [str(value).lower() for value in values if value is not None and value != ""]
+            self.texts.append(" ".join(cells))
+            tokens = set()
+            for cell in cells:
+                if cell not in cell_tokens:
+                    cell_tokens[cell] = tokenize(cell)
+                tokens.update(cell_tokens[cell])
+            for token in tokens:
+                postings.setdefault(token, []).append(row_id)
+        self.postings = postings
+        # Sorted tokens, so every token starting with a prefix is one contiguous run
+        self.vocabulary = sorted(postings)
+
+    def __len__(self):
+        return len(self.texts)
+
+    def prefix_rows(self, prefix):
+        """Ids of the rows holding a token that starts with prefix"""
+        start = bisect_left(self.vocabulary, prefix)
+        end = start
+        while end < len(self.vocabulary) and self.vocabulary[end].startswith(prefix):
+            end += 1
+        if end - start == 1:
+            return set(self.postings[self.vocabulary[start]])
+        rows = set()
+        for token in self.vocabulary[start:end]:
+            rows.update(self.postings[token])
+        return rows
+
+    def term_rows(self, term):
+        """Lookups for one query term: whole words exactly, the last word as a prefix"""
+        tokens = tokenize(term)
+        lookups = [set(self.postings.get(token, ())) for token in tokens[:-1]]
+        if tokens:
+            if term.endswith(tokens[-1]):
+                lookups.append(self.prefix_rows(tokens[-1]))
+            else:
+                # "c++": the word ends before the punctuation
+                lookups.append(set(self.postings.get(tokens[-1], ())))
+        return lookups
+
+    def search(self, query):
+        """Sorted ids of the rows matching every term of query; all rows for an empty query"""
+        terms = query.lower().split()
+        if not terms:
+            return list(range(len(self.texts)))
+
+        candidates = None
+        # Rarest prefixes first keeps the intersections small
+        for rows in sorted((rows for term in terms for rows in self.term_rows(term)), key=len):
+            candidates = rows if candidates is None else candidates & rows
+            if not candidates:
+                return []
+        if candidates is None:
+            # Only punctuation was typed: nothing to look up, scan the texts
+            candidates = range(len(self.texts))
+
+        # A plain word is fully answered by its prefix lookup; only terms with
+        # punctuation in them need checking against the row texts
+        literal = [term for term in terms if tokenize(term) != [term]]
+        if not literal:
+            return sorted(candidates)
+        return sorted(
+            row_id for row_id in candidates
+            if all(term in self.texts[row_id] for term in literal)
+        )
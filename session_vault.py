@@ -0,0 +1,81 @@
+import json
+import os
+import time
+
+
+DEFAULT_VAULT_PATH = "linkedin_session.json"
+SESSION_ORIGIN = "https://www.linkedin.com"
+
+
+def capture_session(driver):
+    """Capture the cookie jar and localStorage of a logged-in driver"""
+    try:
+        local_storage = driver.execute_script(
+            "var data = {};"
+            "for (var i = 0; i < localStorage.length; i++) {"
+            "  var key = localStorage.key(i); data[key] = localStorage.getItem(key);"
+            "}"
+            "return data;"
+        ) or {}
+    except Exception:
+        local_storage = {}
+
+    return {
+        "saved_at": time.time(),
+        "cookies": driver.get_cookies(),
+        "local_storage": local_storage
+    }
+
+
+def restore_session(session, driver, origin=SESSION_ORIGIN):
+    """Install a captured session into a driver"""
+    # Cookies and localStorage can only be set for the domain that is loaded
+    driver.get(origin)
+    for cookie in session.get("cookies", []):
+        try:
+            driver.add_cookie(cookie)
+        except Exception as e:
+            print(f"  Warning: Could not restore cookie {cookie.get('name')} - {e}")
+
+    local_storage = session.get("local_storage") or {}
+    if local_storage:
+        try:
+            driver.execute_script(
+                "var data = arguments[0];"
+                "for (var key in data) { localStorage.setItem(key, data[key]); }",
+                local_storage
+            )
+        except Exception as e:
+            print(f"  Warning: Could not restore localStorage - {e}")
+
+
+def save_session(session, path=DEFAULT_VAULT_PATH):
+    """Write a session to the vault file, readable by the current user only"""
+    tmp_path = path + ".tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(session, f)
+    os.replace(tmp_path, path)
+
+
+def load_session(path=DEFAULT_VAULT_PATH):
+    """Read a session from the vault file, or None if there is none"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            session = json.load(f)
+        if not isinstance(session, dict) or not session.get("cookies"):
+            return None
+        return session
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"  Warning: Could not read session vault {path} - {e}")
+        return None
+
+
+def delete_session(path=DEFAULT_VAULT_PATH):
+    """Remove a rejected session from the vault"""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
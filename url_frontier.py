@@ -0,0 +1,197 @@
+import csv
+import gzip
+import hashlib
+import json
+import os
+from urllib.parse import quote, unquote, urlsplit
+
+
+PROFILE_ORIGIN = "https://www.linkedin.com"
+NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+
+
+def canonicalize_url(url):
+    """Canonical form of a profile URL, or None if it is not a URL.
+
+    LinkedIn URLs on any subdomain, scheme or letter case map to
+    ``https://www.linkedin.com/in/<slug>/``; query strings, fragments and
+    sub-pages such as ``/details/experience`` are dropped. Other hosts keep
+    their scheme and host and only lose the query, fragment and any extra
+    trailing slashes.
+    """
+    url = url.strip()
+    if not url:
+        return None
+    if "://" not in url:
+        url = "https://" + url
+    try:
+        parsed = urlsplit(url)
+        host = (parsed.hostname or "").lower()
+    except ValueError:
+        return None
+    if not host:
+        return None
+
+    parts = [part for part in unquote(parsed.path).split("/") if part]
+    if host == "linkedin.com" or host.endswith(".linkedin.com"):
+        if len(parts) >= 2 and parts[0].lower() == "in":
+            parts = ["in", parts[1].lower()]
+        path = "/".join(quote(part, safe="-_.~") for part in parts)
+        return f"{PROFILE_ORIGIN}/{path}/" if path else PROFILE_ORIGIN + "/"
+
+    path = "/".join(quote(part, safe="-_.~") for part in parts)
+    return f"{parsed.scheme.lower()}://{parsed.netloc.lower()}/{path + '/' if path else ''}"
+
+
+class SeenSet:
+    """Set of URLs kept as 64-bit digests instead of full strings"""
+
+    def __init__(self):
+        self._digests = set()
+
+    @staticmethod
+    def _digest(url):
+        return int.from_bytes(hashlib.blake2b(url.encode("utf-8"), digest_size=8).digest(), "little")
+
+    def add(self, url):
+        """Add url and return True if it had not been seen before"""
+        digest = self._digest(url)
+        if digest in self._digests:
+            return False
+        self._digests.add(digest)
+        return True
+
+    def __contains__(self, url):
+        return self._digest(url) in self._digests
+
+    def __len__(self):
+        return len(self._digests)
+
+
+def _open_text(path):
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8", newline="")
+    return open(path, "r", encoding="utf-8", newline="")
+
+
+def _json_urls(f):
+    # urls.json holds a single document, {"urls": [...]} or a bare list
+    data = json.load(f)
+    urls = data.get("urls", []) if isinstance(data, dict) else data
+    if not isinstance(urls, list):
+        raise ValueError("'urls' must be a list")
+    for url in urls:
+        if isinstance(url, str):
+            yield url
+
+
+def _ndjson_urls(f, column):
+    for line in f:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(record, dict):
+            record = record.get(column)
+        if isinstance(record, str):
+            yield record
+
+
+def _csv_urls(f, column):
+    reader = csv.reader(f)
+    header = next(reader, None)
+    if header is None:
+        return
+    names = [name.strip().lower() for name in header]
+    if column.lower() in names:
+        index = names.index(column.lower())
+    else:
+        # No header with that name: take the first column, header row included
+        index = 0
+        yield header[0]
+    for row in reader:
+        if len(row) > index:
+            yield row[index]
+
+
+def _text_urls(f):
+    for line in f:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield line
+
+
+def read_source(path, column="url"):
+    """Yield raw URLs from one file, one at a time.
+
+    The format follows the file name, with an optional ``.gz`` suffix:
+    ``.json`` ({"urls": [...]}), ``.ndjson``/``.jsonl`` (a string or an
+    object with a ``column`` field per line), ``.csv`` (the ``column``
+    column, or the first one) and anything else as one URL per line.
+    """
+    name = path[:-3] if path.endswith(".gz") else path
+    ext = os.path.splitext(name)[1].lower()
+    try:
+        with _open_text(path) as f:
+            if ext == ".json":
+                yield from _json_urls(f)
+            elif ext in NDJSON_SUFFIXES:
+                yield from _ndjson_urls(f, column)
+            elif ext == ".csv":
+                yield from _csv_urls(f, column)
+            else:
+                yield from _text_urls(f)
+    except FileNotFoundError:
+        print(f"{path} not found. Create it with {{\"urls\": [ ... ]}} or one URL per line")
+    except Exception as e:
+        print(f"Failed to read {path}: {e}")
+
+
+def read_sources(paths, column="url"):
+    """Yield raw URLs from several files in turn"""
+    for path in paths:
+        yield from read_source(path, column)
+
+
+class URLFrontier:
+    """Lazily canonicalize and de-duplicate a stream of profile URLs.
+
+    Iterating yields each canonical URL once, reading the underlying source
+    only as fast as the scraper consumes it. URLs for which ``skip`` returns
+    True (e.g. profiles already in the journal) are dropped.
+    """
+
+    def __init__(self, raw_urls, skip=None):
+        self.raw_urls = raw_urls
+        self.skip = skip
+        self.seen = SeenSet()
+        self.read = 0
+        self.invalid = 0
+        self.duplicates = 0
+        self.skipped = 0
+        self.queued = 0
+
+    def __iter__(self):
+        for raw_url in self.raw_urls:
+            self.read += 1
+            url = canonicalize_url(raw_url) if isinstance(raw_url, str) else None
+            if url is None:
+                self.invalid += 1
+                continue
+            if not self.seen.add(url):
+                self.duplicates += 1
+                continue
+            if self.skip is not None and self.skip(url):
+                self.skipped += 1
+                continue
+            self.queued += 1
+            yield url
+
+    def summary(self):
+        return (
+            f"URLs: {self.read} read, {self.queued} queued, {self.duplicates} duplicate(s), "
+            f"{self.skipped} skipped, {self.invalid} invalid"
+        )